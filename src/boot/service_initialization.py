@@ -11,6 +11,7 @@ from orcidlink.lib.config import get_service_description
 from orcidlink.lib.logger import log_event, log_level
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.runtime import config
+from orcidlink.storage.indexes import missing_indexes, required_indexes
 
 
 def make_db_client() -> MongoClient[Dict[str, Any]]:
@@ -431,6 +432,81 @@ def migrate_v040_to_v041(db: database.Database):
     }
 
 
+def migrate_v041_to_v050(db: database.Database):
+    service_version = "0.5.0"
+
+    # Moves the linking sessions from the per-state collections into the single
+    # "linking_sessions" collection, in which each session records its state. Each
+    # per-state collection is dropped once its sessions have been moved, so an
+    # interrupted migration may be run again.
+
+    actions = []
+
+    collection_names = db.list_collection_names()
+
+    schema = get_schema(service_version, "linking_sessions")
+    if "linking_sessions" in collection_names:
+        db.command("collMod", "linking_sessions", validator=schema)
+        actions.append(
+            {
+                "at": posix_time_millis(),
+                "message": "updated schema for 'linking_sessions' collection",
+            }
+        )
+    else:
+        db.create_collection("linking_sessions", validator=schema)
+        actions.append(
+            {
+                "at": posix_time_millis(),
+                "message": "created 'linking_sessions' collection",
+            }
+        )
+
+    linking_sessions = db.get_collection("linking_sessions")
+    for state in ["initial", "started", "completed"]:
+        collection_name = f"linking_sessions_{state}"
+        if collection_name not in collection_names:
+            continue
+
+        count = 0
+        for linking_session in db.get_collection(collection_name).find({}):
+            linking_session["state"] = state
+            linking_sessions.replace_one(
+                {"_id": linking_session["_id"]}, linking_session, upsert=True
+            )
+            count += 1
+        db.get_collection(collection_name).drop()
+        actions.append(
+            {
+                "at": posix_time_millis(),
+                "message": (
+                    f"moved {count} sessions from '{collection_name}' to "
+                    "'linking_sessions', and dropped it"
+                ),
+            }
+        )
+
+    # Update the database description, recording the migration
+    description = db.get_collection("description").find_one()
+
+    if description is None:
+        raise Exception("No description document found")
+
+    db.get_collection("description").update_one(
+        {"_id": description["_id"]},
+        {
+            "$set": {"version": service_version, "migrated": True},
+            "$push": {"messages": {"$each": actions}},
+        },
+    )
+
+    return {
+        "status": "ok",
+        "message": "Migration successfully completed",
+        "actions": actions,
+    }
+
+
 def migrate_db():
     try:
         client = make_db_client()
@@ -534,6 +610,43 @@ def migrate_db():
                         ),
                     }
 
+        elif service_description.version == "0.5.0":
+            if description is None:
+                # As for 0.4.1, we initialize from the major release, and then apply
+                # each migration in order.
+                result = initialize_v040(db)
+                if result["status"] != "ok":
+                    return result
+                result = migrate_v040_to_v041(db)
+                if result["status"] != "ok":
+                    return result
+                return migrate_v041_to_v050(db)
+            else:
+                database_version = description["version"]
+                if database_version == service_description.version:
+                    return {
+                        "status": "ok",
+                        "code": "migration-not-required",
+                        "message": "Database already migrated for this version",
+                    }
+                elif database_version == "0.4.0":
+                    result = migrate_v040_to_v041(db)
+                    if result["status"] != "ok":
+                        return result
+                    return migrate_v041_to_v050(db)
+                elif database_version == "0.4.1":
+                    return migrate_v041_to_v050(db)
+                else:
+                    return {
+                        "status": "error",
+                        "code": "migration-error",
+                        "message": (
+                            "No migration available from db version "
+                            f"{description['version']} to service version "
+                            f"{service_description.version}"
+                        ),
+                    }
+
         else:
             return {
                 "status": "error",
@@ -551,6 +664,94 @@ def migrate_db():
         }
 
 
+def enable_linking_session_ttl(db: database.Database):
+    """
+    Prepares the initial and started linking sessions for expiry by a TTL index
+    (which is created by `ensure_indexes`), by setting the expiration date field for
+    any existing sessions, from their expiration time.
+
+    This is applied to the database after any migration, and may be applied
+    repeatedly.
+    """
+    db.get_collection("linking_sessions").update_many(
+        {
+            "state": {"$in": ["initial", "started"]},
+            "expires_at_date": {"$exists": False},
+        },
+        [{"$set": {"expires_at_date": {"$toDate": "$expires_at"}}}],
+    )
+
+    return {
+        "status": "ok",
+        "message": "Linking session TTL successfully enabled",
+        "actions": [
+            {
+                "at": posix_time_millis(),
+                "message": "set expires_at_date for 'linking_sessions' collection",
+            }
+        ],
+    }
+
+
+def ensure_indexes(db: database.Database, session_ttl: bool):
+    """
+    Creates any indexes required by the service which are missing.
+
+    This is applied to the database after any migration, whatever the version, since
+    creating an index which already exists has no effect. A unique index cannot be
+    created if the collection holds duplicates (e.g. an ORCID id linked to two
+    users), which must be resolved by hand.
+
+    Note that the TTL indexes, which are required only if linking sessions expire by
+    TTL, are not removed if that is no longer the case.
+    """
+    actions = []
+    required = required_indexes(session_ttl)
+
+    try:
+        for spec in required:
+            options: Dict[str, Any] = {"unique": spec.unique}
+            if spec.expire_after_seconds is not None:
+                options["expireAfterSeconds"] = spec.expire_after_seconds
+            db.get_collection(spec.collection).create_index(spec.field, **options)
+            actions.append(
+                {
+                    "at": posix_time_millis(),
+                    "message": (
+                        f"ensured {'unique ' if spec.unique else ''}{spec.field} "
+                        f"index for {spec.collection} collection"
+                    ),
+                }
+            )
+    except pymongo.errors.OperationFailure as of:
+        return {
+            "status": "error",
+            "code": "index-error",
+            "message": f"Creating the indexes failed: {str(of)}",
+            "actions": actions,
+        }
+
+    index_information = {
+        spec.collection: db.get_collection(spec.collection).index_information()
+        for spec in required
+    }
+    missing = missing_indexes(index_information, required)
+    if len(missing) > 0:
+        return {
+            "status": "error",
+            "code": "index-missing",
+            "message": "Some required indexes are missing",
+            "missing": [spec.model_dump() for spec in missing],
+            "actions": actions,
+        }
+
+    return {
+        "status": "ok",
+        "message": "Indexes successfully ensured",
+        "actions": actions,
+    }
+
+
 def main():
     log_level(logging.DEBUG)
     log_event("initialization-start", {"message": "initializing orcidlink service"})
@@ -572,5 +773,20 @@ def main():
             f"mongodb database migration failed - see logs: {result['code']}, {result['message']}"
         )
 
+    client = make_db_client()
+    db = client.get_database(config().mongo_database)
+    session_ttl = config().linking_session_reaper_interval > 0
+
+    if session_ttl:
+        result = enable_linking_session_ttl(db)
+        log_event("initialization-enable-linking-session-ttl", result)
+
+    result = ensure_indexes(db, session_ttl)
+    log_event("initialization-ensure-indexes", result)
+    if result["status"] == "error":
+        raise Exception(
+            f"mongodb index creation failed - see logs: {result['code']}, {result['message']}"
+        )
+
 
 main()
@@ -0,0 +1,85 @@
+import copy
+import json
+import sys
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from orcidlink.lib.json_codec import ORJSON_CODEC, STDLIB_CODEC
+
+#
+# In which we compare the JSON codecs on the recorded ORCID profiles in the test
+# data, as decoded from a response body and as encoded for a request body.
+#
+# The "text" decoder is that previously used for ORCID responses: the body is decoded
+# to a string, and parsed by the standard library.
+#
+# As the recorded profiles are small, each is also scaled up, by repeating its works,
+# to approximate the profile of an active researcher.
+#
+# Usage: python src/misc/benchmark-json-codec.py <project root> [iterations]
+#
+
+PROFILES = ["profile.json", "profile-single-affiliation.json"]
+
+SCALES = [1, 10, 50]
+
+
+def scale_profile(profile: Any, scale: int) -> Any:
+    scaled = copy.deepcopy(profile)
+    works = scaled["activities-summary"]["works"]
+    works["group"] = works["group"] * scale
+    return scaled
+
+
+def time_call(call: Callable[[], Any], iterations: int) -> float:
+    """
+    Returns the best time, in microseconds, for a single call.
+    """
+    return min(timeit.repeat(call, number=iterations, repeat=5)) / iterations * 1e6
+
+
+def text_loads(body: bytes) -> Any:
+    return json.loads(body.decode("utf-8"))
+
+
+def main():
+    root = sys.argv[1]
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    decoders: List[Tuple[str, Callable[[bytes], Any]]] = [
+        ("text", text_loads),
+        ("json", STDLIB_CODEC.loads),
+    ]
+    encoders: List[Tuple[str, Callable[[Any], bytes]]] = [("json", STDLIB_CODEC.dumps)]
+    if ORJSON_CODEC is None:
+        print("orjson is not installed; comparing standard library decoding only")
+    else:
+        decoders.append(("orjson", ORJSON_CODEC.loads))
+        encoders.append(("orjson", ORJSON_CODEC.dumps))
+
+    columns = [f"loads {name}" for name, _ in decoders] + [
+        f"dumps {name}" for name, _ in encoders
+    ]
+    print(
+        f"{'profile':<36} {'scale':>5} {'size':>9}  "
+        + "  ".join(f"{column:>12}" for column in columns)
+    )
+    print("(microseconds per call)")
+
+    for filename in PROFILES:
+        with open(f"{root}/test/data/orcid/{filename}", "rb") as fin:
+            profile = json.load(fin)
+        for scale in SCALES:
+            value = scale_profile(profile, scale)
+            body = json.dumps(value).encode("utf-8")
+            timings = [
+                time_call(lambda: decode(body), iterations) for _, decode in decoders
+            ] + [time_call(lambda: encode(value), iterations) for _, encode in encoders]
+            print(
+                f"{filename:<36} {scale:>5} {len(body):>9}  "
+                + "  ".join(f"{timing:>12.1f}" for timing in timings)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import copy
+import json
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, List, Tuple, Type
+
+from orcidlink.lib import json_codec
+from orcidlink.lib.service_clients.orcid_api import ORCIDProfile, Works
+from orcidlink.lib.type import ServiceBaseModel
+
+#
+# In which we compare the two ways in which an ORCID API response body may be
+# decoded as a model, on the recorded profile and works in the test data:
+#
+# - "dict": the body is parsed into Python objects (by the JSON codec), which are then
+#   validated as the model, as was done for all responses;
+# - "json": the body is validated as the model directly from the JSON, by pydantic, as
+#   is now done for successful responses (see handle_model_response).
+#
+# For each, we report the time per decode, and the peak memory allocated by Python
+# while decoding (as traced by tracemalloc, which does not see memory allocated
+# within pydantic-core itself).
+#
+# As the recorded resources are small, each is also scaled up, by repeating its
+# works, to approximate that of an active researcher. Note that the works of a
+# profile are not part of the profile model, so the "json" decode never builds them.
+#
+# Usage: python src/misc/benchmark-orcid-decode.py <project root> [iterations]
+#
+
+SCALES = [1, 10, 50]
+
+
+def scale_profile(profile: Any, scale: int) -> Any:
+    scaled = copy.deepcopy(profile)
+    works = scaled["activities-summary"]["works"]
+    works["group"] = works["group"] * scale
+    return scaled
+
+
+def scale_works(works: Any, scale: int) -> Any:
+    scaled = copy.deepcopy(works)
+    scaled["group"] = scaled["group"] * scale
+    return scaled
+
+
+RESOURCES: List[Tuple[str, Type[ServiceBaseModel], Callable[[Any, int], Any]]] = [
+    ("profile.json", ORCIDProfile, scale_profile),
+    ("works_x.json", Works, scale_works),
+]
+
+
+def decode_dict(model: Type[ServiceBaseModel], body: bytes) -> ServiceBaseModel:
+    return model.model_validate(json_codec.loads(body))
+
+
+def decode_json(model: Type[ServiceBaseModel], body: bytes) -> ServiceBaseModel:
+    return model.model_validate_json(body)
+
+
+DECODERS = [("dict", decode_dict), ("json", decode_json)]
+
+
+def time_call(call: Callable[[], Any], iterations: int) -> float:
+    """
+    Returns the best time, in microseconds, for a single call.
+    """
+    return min(timeit.repeat(call, number=iterations, repeat=5)) / iterations * 1e6
+
+
+def peak_memory(call: Callable[[], Any]) -> int:
+    """
+    Returns the peak memory, in bytes, allocated by Python during the call.
+    """
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    root = sys.argv[1]
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print(f"JSON codec: {json_codec.json_codec().name}")
+    columns = [f"{name} us" for name, _ in DECODERS] + [
+        f"{name} KB" for name, _ in DECODERS
+    ]
+    print(
+        f"{'resource':<14} {'scale':>5} {'size':>9}  "
+        + "  ".join(f"{column:>10}" for column in columns)
+    )
+
+    for filename, model, scale_resource in RESOURCES:
+        with open(f"{root}/test/data/orcid/{filename}", "rb") as fin:
+            resource = json.load(fin)
+        for scale in SCALES:
+            body = json.dumps(scale_resource(resource, scale)).encode("utf-8")
+            timings = [
+                time_call(lambda: decode(model, body), iterations)
+                for _, decode in DECODERS
+            ]
+            peaks = [
+                peak_memory(lambda: decode(model, body)) / 1024
+                for _, decode in DECODERS
+            ]
+            print(
+                f"{filename:<14} {scale:>5} {len(body):>9}  "
+                + "  ".join(f"{timing:>10.1f}" for timing in timings)
+                + "  "
+                + "  ".join(f"{peak:>10.1f}" for peak in peaks)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-from orcidlink import process
 from orcidlink.jsonrpc.errors import NotAuthorizedError
+from orcidlink.storage.storage_model import storage_model
 
 
 async def is_linked_method(username: str, auth_username: str) -> bool:
@@ -12,12 +12,13 @@ async def is_linked_method(username: str, auth_username: str) -> bool:
 
     This method is designed to be used for and by the user who may be linked,
     and therefore the given and authorized username must be the same.
+
+    As only the existence of the link matters, the link record itself is not fetched,
+    and its tokens are not refreshed even if retired.
     """
     if username != auth_username:
         raise NotAuthorizedError(
             "Not authorized to inquire about the link for another user"
         )
 
-    link_record = await process.link_record_for_user(username)
-
-    return link_record is not None
+    return await storage_model().link_record_exists(username)
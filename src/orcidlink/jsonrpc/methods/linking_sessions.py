@@ -95,7 +95,6 @@ async def finish_linking_session(session_id: str, auth_username: str) -> None:
     created_at = posix_time_millis()
     expires_at = created_at + session_record.orcid_auth.expires_in * 1000
 
-    storage = storage_model()
     link_record = LinkRecord(
         username=session_record.username,
         orcid_auth=session_record.orcid_auth,
@@ -1,22 +1,30 @@
+import base64
+import hashlib
+import json
 from typing import Any, Dict, List, Optional, Union
 
 import pymongo
-from pydantic import Field
+from bson import ObjectId
+from fastapi_jsonrpc import InvalidParams
+from pydantic import Field, ValidationError
 
+from orcidlink import process
 from orcidlink.jsonrpc.errors import NotAuthorizedError, NotFoundError
+from orcidlink.lib.cache import TimedLRUCache
 from orcidlink.lib.service_clients.kbase_auth import AccountInfo
-from orcidlink.lib.service_clients.orcid_oauth_api import orcid_oauth_api
 from orcidlink.lib.type import ServiceBaseModel
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.model import (
+    LinkingSessionComplete,
     LinkingSessionCompletePublic,
     LinkingSessionInitial,
     LinkingSessionStarted,
     LinkRecordPublic,
 )
 from orcidlink.runtime import config
+from orcidlink.session_reaper import RevocationFailure, revoke_linking_sessions
 from orcidlink.storage.storage_model import storage_model
-from orcidlink.storage.storage_model_mongo import StatsRecord
+from orcidlink.storage.storage_model_mongo import KeysetPosition, StatsRecord
 
 
 class IsManagerResult(ServiceBaseModel):
@@ -39,6 +47,7 @@ async def is_manager(username: str, account_info: AccountInfo) -> IsManagerResul
 
 class FindLinksResult(ServiceBaseModel):
     links: List[LinkRecordPublic]
+    next_cursor: Optional[str] = Field(default=None)
 
 
 class FilterByUsername(ServiceBaseModel):
@@ -90,6 +99,9 @@ class SearchQuery(ServiceBaseModel):
     sort: Optional[QuerySort] = Field(default=None)
     offset: Optional[int] = Field(default=None)
     limit: Optional[int] = Field(default=None)
+    # The next_cursor returned with the previous page of a query with the same find,
+    # sort and limit.
+    after: Optional[str] = Field(default=None)
 
     class Config:  # type: ignore
         extra = "forbid"
@@ -120,6 +132,58 @@ def augment_with_time_filter(
     return filter
 
 
+class LinksCursor(ServiceBaseModel):
+    """
+    The content of the opaque cursor with which a page of links is requested.
+
+    The query digest ensures that the cursor is used only for the query from which it
+    was issued.
+    """
+
+    query: str = Field(...)
+    position: KeysetPosition = Field(...)
+
+
+def query_digest(filter: Any, sort: Any) -> str:
+    query = json.dumps({"filter": filter, "sort": sort}, sort_keys=True)
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_links_cursor(digest: str, position: KeysetPosition) -> str:
+    cursor = LinksCursor(query=digest, position=position)
+    return base64.urlsafe_b64encode(cursor.model_dump_json().encode("utf-8")).decode(
+        "ascii"
+    )
+
+
+def invalid_cursor(message: str) -> InvalidParams:
+    return InvalidParams(
+        data={
+            "errors": [
+                {"loc": ["query", "after"], "msg": message, "type": "value_error"}
+            ]
+        }
+    )
+
+
+def decode_links_cursor(cursor: str, digest: str) -> KeysetPosition:
+    try:
+        links_cursor = LinksCursor.model_validate_json(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (ValueError, ValidationError):
+        raise invalid_cursor("The cursor is not valid")
+
+    if links_cursor.query != digest:
+        raise invalid_cursor("The cursor was issued for a different query")
+
+    # The position is that of a link document, identified by its _id.
+    if not ObjectId.is_valid(links_cursor.position.id):
+        raise invalid_cursor("The cursor is not valid")
+
+    return links_cursor.position
+
+
 async def find_links(query: Optional[SearchQuery] = None) -> FindLinksResult:
     filter: dict[str, dict[str, str | int]] = {}
     sort: list[tuple[str, int]] = []
@@ -159,12 +223,36 @@ async def find_links(query: Optional[SearchQuery] = None) -> FindLinksResult:
             limit = query.limit
 
     model = storage_model()
-    links = await model.get_link_records(
-        filter=filter, sort=sort, offset=offset, limit=limit
-    )
+
+    # A limited query without an offset is paged by keyset; the cursor for the next
+    # page encodes the position of the last link on this page.
+    if limit and not offset:
+        digest = query_digest(filter, sort)
+        after = None
+        if query is not None and query.after is not None:
+            after = decode_links_cursor(query.after, digest)
+
+        # Public link records are decoded directly from the stored documents.
+        page = await model.get_link_records_page_as(
+            LinkRecordPublic, filter=filter, sort=sort, limit=limit, after=after
+        )
+        return FindLinksResult(
+            links=page.links,
+            next_cursor=(
+                encode_links_cursor(digest, page.next)
+                if page.next is not None
+                else None
+            ),
+        )
+
+    if query is not None and query.after is not None:
+        raise invalid_cursor("A cursor requires a limit, and may not have an offset")
 
     public_links = [
-        LinkRecordPublic.model_validate(link.model_dump()) for link in links
+        link
+        async for link in model.iter_link_records_as(
+            LinkRecordPublic, filter=filter, sort=sort, offset=offset, limit=limit
+        )
     ]
 
     return FindLinksResult(links=public_links)
@@ -194,11 +282,12 @@ async def get_linking_sessions() -> GetLinkingSessionsResult:
     model = storage_model()
     initial_linking_sessions = await model.get_linking_sessions_initial()
     started_linking_sessions = await model.get_linking_sessions_started()
-    completed_linking_sessions = await model.get_linking_sessions_completed()
 
     completed_linking_sessions_public = [
-        LinkingSessionCompletePublic.model_validate(linking_session.model_dump())
-        for linking_session in completed_linking_sessions
+        linking_session
+        async for linking_session in model.iter_linking_sessions_completed_as(
+            LinkingSessionCompletePublic
+        )
     ]
 
     return GetLinkingSessionsResult(
@@ -208,20 +297,54 @@ async def get_linking_sessions() -> GetLinkingSessionsResult:
     )
 
 
-async def delete_expired_linking_sessions() -> None:
+class DeleteExpiredLinkingSessionsResult(ServiceBaseModel):
+    # Initial and started sessions, and completed sessions whose tokens were revoked.
+    deleted_sessions: int = Field(...)
+    revoked_sessions: int = Field(...)
+    # Completed sessions whose tokens could not be revoked, and which were retained.
+    failures: List[RevocationFailure] = Field(...)
+
+
+async def delete_expired_linking_sessions() -> DeleteExpiredLinkingSessionsResult:
     model = storage_model()
 
     now = posix_time_millis()
 
-    expired_sessions = await model.get_expired_sessions(now)
-
-    for expired_completed_session in expired_sessions.completed_sessions:
-        await orcid_oauth_api().revoke_access_token(
-            expired_completed_session.orcid_auth.access_token
+    # Only completed sessions hold ORCID tokens, which must be revoked; they are
+    # revoked, and those revoked deleted, a chunk at a time.
+    revoked_sessions = 0
+    failures: List[RevocationFailure] = []
+
+    async def revoke(sessions: List[LinkingSessionComplete]) -> None:
+        nonlocal revoked_sessions
+        result = await revoke_linking_sessions(
+            model,
+            sessions,
+            now,
+            config().linking_session_revocation_concurrency,
+            config().linking_session_revocation_retries,
         )
+        revoked_sessions += result.revoked
+        failures.extend(result.failures)
+
+    chunk: List[LinkingSessionComplete] = []
+    async for expired_completed_session in model.iter_expired_completed_sessions(now):
+        chunk.append(expired_completed_session)
+        if len(chunk) == config().mongo_cursor_batch_size:
+            await revoke(chunk)
+            chunk = []
+    if len(chunk) > 0:
+        await revoke(chunk)
+
+    deleted_sessions = await model.delete_expired_sessions(
+        now, states=["initial", "started"]
+    )
 
-    # TODO: rectify with the above.
-    await model.delete_expired_sessions()
+    return DeleteExpiredLinkingSessionsResult(
+        deleted_sessions=deleted_sessions + revoked_sessions,
+        revoked_sessions=revoked_sessions,
+        failures=failures,
+    )
 
 
 async def delete_linking_session_initial(session_id: str) -> None:
@@ -243,9 +366,31 @@ class GetStatsResult(ServiceBaseModel):
     stats: StatsRecord
 
 
+_stats_cache: Optional[TimedLRUCache[StatsRecord]] = None
+
+
+def stats_cache() -> Optional[TimedLRUCache[StatsRecord]]:
+    """
+    Returns the process-wide cache of the stats snapshot, or None if caching is
+    disabled.
+    """
+    global _stats_cache
+    if _stats_cache is None and config().stats_cache_lifetime > 0:
+        _stats_cache = TimedLRUCache(max_size=1, lifetime=config().stats_cache_lifetime)
+    return _stats_cache
+
+
 async def get_stats() -> GetStatsResult:
+    cache = stats_cache()
+    if cache is not None:
+        stats = cache.get("stats")
+        if stats is not None:
+            return GetStatsResult(stats=stats)
+
     model = storage_model()
     stats = await model.get_stats()
+    if cache is not None:
+        cache.set("stats", stats)
 
     return GetStatsResult(stats=stats)
 
@@ -261,19 +406,9 @@ async def refresh_tokens(username: str) -> RefreshTokensResult:
     if link_record is None:
         raise NotFoundError("Link record not found for this user")
 
-    # refresh the tokens
-    orcid_auth = await orcid_oauth_api().refresh_token(
-        link_record.orcid_auth.refresh_token
-    )
-
-    link_record.orcid_auth = orcid_auth
-    link_record.created_at = posix_time_millis()
-    link_record.expires_at = (
-        link_record.created_at + config().linking_session_lifetime * 1000
-    )
-
-    # update the link with the new orcid_auth
-    await storage.save_link_record(link_record)
+    # The refresh is coordinated with any other refresh of this link, as concurrent
+    # refreshes would revoke each other's tokens.
+    link_record = await process.refresh_token_for_link(link_record)
 
     return RefreshTokensResult(
         link=LinkRecordPublic.model_validate(link_record.model_dump())
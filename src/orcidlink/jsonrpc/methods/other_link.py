@@ -1,17 +1,18 @@
-from orcidlink import process
 from orcidlink.jsonrpc.errors import NotFoundError
-from orcidlink.model import LinkRecordPublicNonOwner, ORCIDAuthPublicNonOwner
+from orcidlink.model import LinkRecordPublicNonOwner
+from orcidlink.storage.storage_model import storage_model
 
 
 async def other_link(username: str) -> LinkRecordPublicNonOwner:
-    link_record = await process.link_record_for_user(username)
+    """
+    Gets the public view of another user's link.
+
+    The view does not include the link's tokens, so the link's tokens are not
+    refreshed even if retired.
+    """
+    link_record = await storage_model().get_link_record_public_non_owner(username)
 
     if link_record is None:
         raise NotFoundError()
 
-    return LinkRecordPublicNonOwner(
-        username=link_record.username,
-        orcid_auth=ORCIDAuthPublicNonOwner(
-            name=link_record.orcid_auth.name, orcid=link_record.orcid_auth.orcid
-        ),
-    )
+    return link_record
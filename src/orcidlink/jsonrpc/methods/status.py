@@ -1,17 +1,63 @@
 from pydantic import Field
 
+from orcidlink.lib.cache import CacheStats
+from orcidlink.lib.service_clients.kbase_auth import (
+    account_info_cache,
+    account_info_lookups,
+    invalid_token_cache,
+    token_info_cache,
+    token_info_lookups,
+)
+from orcidlink.lib.service_clients.orcid_api import (
+    ResponseCacheStats,
+    orcid_profile_cache,
+    orcid_response_cache,
+)
+from orcidlink.lib.single_flight import SingleFlightStats
 from orcidlink.lib.type import ServiceBaseModel
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.runtime import stats
+from orcidlink.session_reaper import LinkingSessionReaperStats, linking_session_reaper
+from orcidlink.storage.mongo_pool import MongoPoolStats
+from orcidlink.storage.storage_model import mongo_pool_stats
+from orcidlink.token_refresh import TokenRefreshStats, token_refresh_scheduler
+
+
+class ServiceMetrics(ServiceBaseModel):
+    mongo_pool: MongoPoolStats = Field(...)
+    token_cache: CacheStats = Field(...)
+    account_cache: CacheStats = Field(...)
+    invalid_token_cache: CacheStats = Field(...)
+    token_lookups: SingleFlightStats = Field(...)
+    account_lookups: SingleFlightStats = Field(...)
+    token_refresh: TokenRefreshStats = Field(...)
+    orcid_profile_cache: CacheStats = Field(...)
+    orcid_response_cache: ResponseCacheStats = Field(...)
+    linking_session_reaper: LinkingSessionReaperStats = Field(...)
 
 
 class StatusResult(ServiceBaseModel):
     status: str = Field(...)
     current_time: int = Field(...)
     start_time: int = Field(...)
+    metrics: ServiceMetrics = Field(...)
 
 
 def status_method() -> StatusResult:
     return StatusResult(
-        status="ok", start_time=stats().start_time, current_time=posix_time_millis()
+        status="ok",
+        start_time=stats().start_time,
+        current_time=posix_time_millis(),
+        metrics=ServiceMetrics(
+            mongo_pool=mongo_pool_stats(),
+            token_cache=token_info_cache().stats(),
+            account_cache=account_info_cache().stats(),
+            invalid_token_cache=invalid_token_cache().stats(),
+            token_lookups=token_info_lookups().stats(),
+            account_lookups=account_info_lookups().stats(),
+            token_refresh=token_refresh_scheduler().stats(),
+            orcid_profile_cache=orcid_profile_cache().stats(),
+            orcid_response_cache=orcid_response_cache().stats(),
+            linking_session_reaper=linking_session_reaper().stats(),
+        ),
     )
@@ -1,12 +1,16 @@
-import json
-from typing import List
+from typing import List, Optional, Union
 
 import aiohttp
 
 from orcidlink import process
-from orcidlink.jsonrpc.errors import NotFoundError, UpstreamError
+from orcidlink.jsonrpc.errors import JSONRPCError, NotFoundError, UpstreamError
+from orcidlink.lib import json_codec
+from orcidlink.lib.concurrency import run_concurrently, run_write_concurrently
 from orcidlink.lib.service_clients import orcid_api
-from orcidlink.lib.service_clients.orcid_common import ORCIDStringValue
+from orcidlink.lib.service_clients.http_session import client_session, http_session
+from orcidlink.lib.service_clients.orcid_api_errors import (
+    orcid_api_error_to_json_rpc_error,
+)
 from orcidlink.lib.type import ServiceBaseModel
 from orcidlink.model import NewWork, ORCIDWorkGroup, Work, WorkUpdate
 from orcidlink.runtime import config
@@ -21,6 +25,8 @@ async def get_works(username: str) -> List[ORCIDWorkGroup]:
     token = link_record.orcid_auth.access_token
     orcid_id = link_record.orcid_auth.orcid
 
+    # The works are limited, as they are parsed, to those added by KBase (see
+    # ORCID_WORKS_SOURCE_CLIENT_ID).
     orcid_works = await orcid_api.orcid_api(token).get_works(orcid_id)
 
     result: List[ORCIDWorkGroup] = []
@@ -34,14 +40,7 @@ async def get_works(username: str) -> List[ORCIDWorkGroup]:
                 ],
                 works=[
                     to_service.transform_work_summary(work_summary)
-                    # TODO: Need to make the KBase source configurable, as it will be
-                    # different, between, say, CI and prod, or at least development and
-                    # prod.
                     for work_summary in group.work_summary
-                    # TODO: replace with source_client_id and compare to the client id
-                    # in the config.
-                    if work_summary.source.source_name is not None
-                    and work_summary.source.source_name.value == "KBase CI"
                 ],
             )
         )
@@ -61,75 +60,97 @@ async def get_work(username: str, put_code: int) -> GetWorkResult:
     token = link_record.orcid_auth.access_token
     orcid_id = link_record.orcid_auth.orcid
 
-    # try:
-    raw_work = await orcid_api.orcid_api(token).get_work(orcid_id, put_code)
-    profile = await orcid_api.orcid_api(token).get_profile(orcid_id)
+    client = orcid_api.orcid_api(token)
+    raw_work, profile = await run_concurrently(
+        client.get_work(orcid_id, put_code), client.get_profile(orcid_id)
+    )
     return GetWorkResult(work=to_service.transform_work(profile, raw_work.bulk[0].work))
 
 
-class CreateWorkResult(ServiceBaseModel):
-    work: Work
+class WorkError(ServiceBaseModel):
+    # The JSON-RPC error code and message corresponding to the ORCID API error.
+    code: int
+    message: str
+    orcidErrorCode: Optional[int] = None
+    orcidMessage: Optional[str] = None
 
 
-async def create_work(username: str, new_work: NewWork) -> CreateWorkResult:
-    link_record = await process.link_record_for_user(username)
-    if link_record is None:
-        raise NotFoundError("ORCID Profile Not Found")
+class WorkDetail(ServiceBaseModel):
+    putCode: int
+    work: Optional[Work] = None
+    error: Optional[WorkError] = None
 
-    token = link_record.orcid_auth.access_token
-    orcid_id = link_record.orcid_auth.orcid
 
-    #
-    # Create initial work record
-    #
+class GetWorksDetailResult(ServiceBaseModel):
+    works: List[WorkDetail]
 
-    external_ids: List[orcid_api.ExternalId] = [
-        orcid_api.ExternalId(
-            external_id_type="doi",
-            external_id_value=new_work.doi,
-            external_id_normalized=None,
-            # TODO: doi url should be configurable
-            external_id_url=ORCIDStringValue(value=f"https://doi.org/{new_work.doi}"),
-            external_id_relationship="self",
-        )
-    ]
 
-    # external_ids: List[orcid_api.ORCIDExternalId] = []
-    # if new_work.externalIds is not None:
-    for _, externalId in enumerate(new_work.externalIds):
-        external_ids.append(
-            orcid_api.ExternalId(
-                external_id_type=externalId.type,
-                external_id_value=externalId.value,
-                external_id_url=ORCIDStringValue(value=externalId.url),
-                external_id_relationship=externalId.relationship,
-            )
+def bulk_work_error(bulk_work: orcid_api.BulkWork) -> WorkError:
+    """
+    Returns the error for a bulk work item which holds no work.
+    """
+    if bulk_work.error is None:
+        return WorkError(
+            code=UpstreamError.CODE,
+            message="The ORCID API returned neither a work nor an error",
         )
 
-    citation = orcid_api.Citation(
-        citation_type=new_work.citation.type,
-        citation_value=new_work.citation.value,
+    error = orcid_api_error_to_json_rpc_error(bulk_work.error)
+    return WorkError(
+        code=error.CODE,
+        message=error.MESSAGE,
+        orcidErrorCode=bulk_work.error.error_code,
+        orcidMessage=bulk_work.error.developer_message,
     )
 
-    contributors: List[orcid_api.Contributor] = []
 
-    self_contributors = to_orcid.transform_contributor_self(new_work.selfContributor)
-    contributors.extend(self_contributors)
+def work_detail(
+    profile: orcid_api.ORCIDProfile, put_code: int, bulk_work: orcid_api.BulkWork
+) -> WorkDetail:
+    if bulk_work.work is not None:
+        return WorkDetail(
+            putCode=put_code, work=to_service.transform_work(profile, bulk_work.work)
+        )
+    return WorkDetail(putCode=put_code, error=bulk_work_error(bulk_work))
+
+
+async def get_works_detail(username: str, put_codes: List[int]) -> GetWorksDetailResult:
+    """
+    Gets the work activity records with the given put codes, in the same order.
+
+    Each work, or the error reading it, is returned independently, so that one work
+    which cannot be read does not prevent the others from being returned.
+    """
+    link_record = await process.link_record_for_user(username)
+    if link_record is None:
+        raise NotFoundError("ORCID Link Not Found")
 
-    contributors.extend(to_orcid.transform_contributors(new_work.otherContributors))
+    if len(put_codes) == 0:
+        return GetWorksDetailResult(works=[])
 
-    work_record = orcid_api.NewWork(
-        type=new_work.workType,
-        title=orcid_api.Title(title=ORCIDStringValue(value=new_work.title)),
-        journal_title=ORCIDStringValue(value=new_work.journal),
-        url=ORCIDStringValue(value=new_work.url),
-        external_ids=orcid_api.ExternalIds(external_id=external_ids),
-        publication_date=to_orcid.parse_date(new_work.date),
-        short_description=new_work.shortDescription,
-        citation=citation,
-        contributors=orcid_api.ContributorWrapper(contributor=contributors),
+    token = link_record.orcid_auth.access_token
+    orcid_id = link_record.orcid_auth.orcid
+
+    # All of the works are transformed against a single fetch of the profile.
+    client = orcid_api.orcid_api(token)
+    bulk_works, profile = await run_concurrently(
+        client.get_works_detail(orcid_id, put_codes), client.get_profile(orcid_id)
     )
+    return GetWorksDetailResult(
+        works=[
+            work_detail(profile, put_code, bulk_work)
+            for put_code, bulk_work in zip(put_codes, bulk_works)
+        ]
+    )
+
 
+class CreateWorkResult(ServiceBaseModel):
+    work: Work
+
+
+async def post_work(
+    orcid_id: str, token: str, content: orcid_api.CreateWorkInput
+) -> orcid_api.GetWorkResult:
     url = orcid_api.orcid_api_url(f"{orcid_id}/works")
     header = {
         "Accept": "application/vnd.orcid+json",
@@ -137,6 +158,31 @@ async def create_work(username: str, new_work: NewWork) -> CreateWorkResult:
         "Authorization": f"Bearer {token}",
     }
 
+    # TODO: propagate everywhere. Or, perhaps better,
+    # wrap this common use case into a function or class.
+    timeout = config().request_timeout
+    async with client_session(http_session(config().orcid_api_base_url)) as session:
+        async with session.post(
+            url,
+            raise_for_status=True,
+            timeout=timeout,
+            headers=header,
+            data=json_codec.dumps(content.model_dump(by_alias=True)),
+        ) as response:
+            result = json_codec.loads(await response.read())
+    return orcid_api.GetWorkResult.model_validate(result)
+
+
+async def create_work(username: str, new_work: NewWork) -> CreateWorkResult:
+    link_record = await process.link_record_for_user(username)
+    if link_record is None:
+        raise NotFoundError("ORCID Profile Not Found")
+
+    token = link_record.orcid_auth.access_token
+    orcid_id = link_record.orcid_auth.orcid
+
+    work_record = to_orcid.translate_new_work(new_work)
+
     # Note that we use the "bulk" endpoint because it nicely returns the newly created
     # work record. This both saves a trip and is more explicit than the singular
     # endpoint POST /work, which returns 201 and a location for the new work record,
@@ -145,28 +191,20 @@ async def create_work(username: str, new_work: NewWork) -> CreateWorkResult:
     # TODO: also this endpoint and probably many others return a 200 response with error
     # data.
     content = orcid_api.CreateWorkInput(
-        bulk=(orcid_api.NewWorkWrapper(work=work_record),)
+        bulk=[orcid_api.NewWorkWrapper(work=work_record)]
     )
 
-    # TODO: propagate everywhere. Or, perhaps better,
-    # wrap this common use case into a function or class.
-    timeout = config().request_timeout
+    # The profile is required only for the owner's ORCID iD and name, which the new
+    # work does not affect, so it is fetched while the work is created. Should the
+    # fetch fail, the work is still created, and the error is raised once it has been.
     try:
-        async with aiohttp.ClientSession(raise_for_status=True) as session:
-            async with session.post(
-                url,
-                timeout=timeout,
-                headers=header,
-                data=json.dumps(content.model_dump(by_alias=True)),
-            ) as response:
-                result = await response.json()
-                work_record2 = orcid_api.GetWorkResult.model_validate(result)
-                # TODO: handle errors here; they are not always
-                profile = await orcid_api.orcid_api(token).get_profile(orcid_id)
-                new_work_record = to_service.transform_work(
-                    profile, work_record2.bulk[0].work
-                )
-                return CreateWorkResult(work=new_work_record)
+        work_record2, profile = await run_write_concurrently(
+            post_work(orcid_id, token, content),
+            orcid_api.orcid_api(token).get_profile(orcid_id),
+        )
+        # TODO: handle errors here; they are not always
+        new_work_record = to_service.transform_work(profile, work_record2.bulk[0].work)
+        return CreateWorkResult(work=new_work_record)
     except aiohttp.ClientError:
         # TODO: richer error here.
         raise UpstreamError(
@@ -175,6 +213,112 @@ async def create_work(username: str, new_work: NewWork) -> CreateWorkResult:
             #     "description": str(ex),
             # },
         )
+    finally:
+        # Either the work was created, or the outcome is unknown; also, a profile
+        # cached by the concurrent fetch may predate the new work.
+        orcid_api.record_modified(orcid_id)
+
+
+class CreatedWork(ServiceBaseModel):
+    work: Optional[Work] = None
+    error: Optional[WorkError] = None
+
+
+class CreateWorksResult(ServiceBaseModel):
+    works: List[CreatedWork]
+
+
+async def create_works_chunk(
+    client: orcid_api.ORCIDAPIClient,
+    orcid_id: str,
+    work_records: List[orcid_api.NewWork],
+) -> Union[List[orcid_api.BulkWork], WorkError]:
+    """
+    Creates a chunk of works in a single bulk request, returning the bulk work items,
+    or the error for the chunk as a whole if the request failed.
+    """
+    try:
+        result = await client.create_works_bulk(orcid_id, work_records)
+        return result.bulk
+    except JSONRPCError as error:
+        return WorkError(code=error.CODE, message=error.MESSAGE)
+    except aiohttp.ClientError:
+        return WorkError(
+            code=UpstreamError.CODE,
+            message="An error was encountered saving the work records",
+        )
+
+
+async def create_works(username: str, new_works: List[NewWork]) -> CreateWorksResult:
+    """
+    Creates the work activity records, returning, in the same order, each created work
+    or the error creating it.
+
+    The works are created by bulk requests of up to ORCID_BULK_WORKS_LIMIT works, made
+    one after the other; a work which cannot be created (e.g. because it duplicates an
+    existing work), or a chunk whose request fails, does not prevent the others from
+    being created. Nor does a failure to fetch the owner's profile, which is reported
+    as the error for each work created.
+    """
+    link_record = await process.link_record_for_user(username)
+    if link_record is None:
+        raise NotFoundError("ORCID Profile Not Found")
+
+    if len(new_works) == 0:
+        return CreateWorksResult(works=[])
+
+    token = link_record.orcid_auth.access_token
+    orcid_id = link_record.orcid_auth.orcid
+
+    work_records = [to_orcid.translate_new_work(new_work) for new_work in new_works]
+    limit = orcid_api.ORCID_BULK_WORKS_LIMIT
+    chunks = [
+        work_records[start : start + limit]
+        for start in range(0, len(work_records), limit)
+    ]
+
+    client = orcid_api.orcid_api(token)
+
+    async def create_chunks() -> List[Union[List[orcid_api.BulkWork], WorkError]]:
+        return [await create_works_chunk(client, orcid_id, chunk) for chunk in chunks]
+
+    async def get_profile() -> Union[orcid_api.ORCIDProfile, WorkError]:
+        try:
+            return await client.get_profile(orcid_id)
+        except JSONRPCError as error:
+            return WorkError(code=error.CODE, message=error.MESSAGE)
+        except aiohttp.ClientError:
+            return WorkError(
+                code=UpstreamError.CODE,
+                message="An error was encountered fetching the ORCID profile",
+            )
+
+    # As for create_work, the profile is fetched while the works are created, and all
+    # of the works are transformed against that single fetch. Every chunk is created
+    # whether or not the fetch succeeds; if it fails, each created work is reported
+    # with the error, as it cannot be transformed.
+    try:
+        chunk_results, profile = await run_write_concurrently(
+            create_chunks(), get_profile()
+        )
+    finally:
+        orcid_api.record_modified(orcid_id)
+
+    works: List[CreatedWork] = []
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        if isinstance(chunk_result, WorkError):
+            works.extend(CreatedWork(error=chunk_result) for _ in chunk)
+            continue
+        for bulk_work in chunk_result:
+            if bulk_work.work is None:
+                works.append(CreatedWork(error=bulk_work_error(bulk_work)))
+            elif isinstance(profile, WorkError):
+                works.append(CreatedWork(error=profile))
+            else:
+                works.append(
+                    CreatedWork(work=to_service.transform_work(profile, bulk_work.work))
+                )
+    return CreateWorksResult(works=works)
 
 
 class SaveWorkResult(ServiceBaseModel):
@@ -193,12 +337,17 @@ async def save_work(username: str, work_update: WorkUpdate) -> SaveWorkResult:
 
     work_record_updated = to_orcid.translate_work_update(work_update)
 
-    # TODO: check this
-    raw_work_record = await orcid_api.orcid_api(token).save_work(
-        orcid_id, put_code, work_record_updated
-    )
-
-    profile = await orcid_api.orcid_api(token).get_profile(orcid_id)
+    # As for create_work, the profile is fetched while the work is saved, without
+    # affecting the save.
+    client = orcid_api.orcid_api(token)
+    try:
+        # TODO: check this
+        raw_work_record, profile = await run_write_concurrently(
+            client.save_work(orcid_id, put_code, work_record_updated),
+            client.get_profile(orcid_id),
+        )
+    finally:
+        orcid_api.record_modified(orcid_id)
     return SaveWorkResult(work=to_service.transform_work(profile, raw_work_record))
 
 
@@ -216,9 +365,10 @@ async def delete_work(username: str, put_code: int) -> None:
     }
     url = orcid_api.orcid_api_url(f"{orcid_id}/work/{put_code}")
 
-    async with aiohttp.ClientSession() as session:
+    async with client_session(http_session(config().orcid_api_base_url)) as session:
         async with session.delete(url, headers=header) as response:
             if response.status == 204:
+                orcid_api.record_modified(orcid_id)
                 return None
 
             # TODO: richer error
@@ -4,11 +4,10 @@ from orcidlink.jsonrpc.errors import AuthorizationRequiredError
 from orcidlink.lib.service_clients.kbase_auth import (
     AccountInfo,
     AuthError,
-    KBaseAuth,
     TokenInfo,
     auth_error_to_jsonrpc_error,
+    kbase_auth,
 )
-from orcidlink.runtime import config
 
 
 async def ensure_authorization2(
@@ -26,10 +25,7 @@ async def ensure_authorization2(
     if authorization is None:
         raise AuthorizationRequiredError("Authorization required but missing")
 
-    auth = KBaseAuth(
-        url=config().auth_url,
-        timeout=config().request_timeout,
-    )
+    auth = kbase_auth()
 
     # TODO: rectify with JSON-RPC errors. Ultimately, all API calls will be JSON-RPC,
     # with just some OAuth stuff remaining as "REST-ish"
@@ -49,10 +45,7 @@ async def ensure_account2(
     if authorization is None:
         raise AuthorizationRequiredError("Authorization required but missing")
 
-    auth = KBaseAuth(
-        url=config().auth_url,
-        timeout=config().request_timeout,
-    )
+    auth = kbase_auth()
 
     # TODO: rectify with JSON-RPC errors. Ultimately, all API calls will be JSON-RPC,
     # with just some OAuth stuff remaining as "REST-ish"
@@ -4,11 +4,10 @@ from orcidlink.jsonrpc.errors import AlreadyLinkedError
 from orcidlink.lib.responses import UIError
 from orcidlink.lib.service_clients.kbase_auth import (
     AuthError,
-    KBaseAuth,
     TokenInfo,
     auth_error_to_ui_error,
+    kbase_auth,
 )
-from orcidlink.runtime import config
 
 """
 A set of convenience functions for usage by endpoint handlers to ensure that a 
@@ -35,10 +34,7 @@ async def ensure_authorization_ui(
             "The chosen ORCID account is already linked to another KBase account",
         )
 
-    auth = KBaseAuth(
-        url=config().auth_url,
-        timeout=config().request_timeout,
-    )
+    auth = kbase_auth()
     try:
         token_info = await auth.get_token_info(authorization)
     except AuthError as ae:
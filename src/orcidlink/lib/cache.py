@@ -0,0 +1,108 @@
+"""
+A bounded, time-limited cache with usage counters.
+
+Entries are evicted least-recently-used first when the cache is full, and expire after
+the cache's lifetime, or earlier if the entry's own lifetime (as determined by the
+optional `lifetime_of` function) is shorter. Hits, misses and evictions are tallied so
+that the cache's effectiveness may be reported via the `status` method.
+"""
+
+import time
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+
+import cachetools
+from pydantic import Field
+
+from orcidlink.lib.type import ServiceBaseModel
+
+V = TypeVar("V")
+
+
+class CacheStats(ServiceBaseModel):
+    size: int = Field(...)
+    max_size: int = Field(...)
+    hits: int = Field(...)
+    misses: int = Field(...)
+    evictions: int = Field(...)
+
+
+class _TLRUCache(cachetools.TLRUCache):  # type: ignore
+    """
+    A TLRU cache which counts entries evicted to make space for new entries.
+
+    The underlying cache calls `popitem` only when it is full; expired entries are
+    removed separately.
+    """
+
+    evictions: int = 0
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class TimedLRUCache(Generic[V]):
+    def __init__(
+        self,
+        max_size: int,
+        lifetime: float,
+        lifetime_of: Optional[Callable[[V], float]] = None,
+    ):
+        """
+        Constructor
+
+        The lifetime, and that returned by `lifetime_of` for a given value, are in
+        seconds.
+        """
+        self.max_size = max_size
+        self.lifetime = lifetime
+        self.lifetime_of = lifetime_of
+        self.hits = 0
+        self.misses = 0
+        self.cache = _TLRUCache(
+            maxsize=max_size, ttu=self.expires_at, timer=time.monotonic
+        )
+
+    def expires_at(self, key: str, value: V, now: float) -> float:
+        lifetime = self.lifetime
+        if self.lifetime_of is not None:
+            lifetime = min(lifetime, self.lifetime_of(value))
+        return now + lifetime
+
+    def get(self, key: str) -> Optional[V]:
+        value: Optional[V] = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def peek(self, key: str) -> Optional[V]:
+        """
+        As get, but not counted as a usage of the cache.
+        """
+        value: Optional[V] = self.cache.get(key)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        """
+        Adds the value to the cache; a value which has already expired is not added.
+        """
+        self.cache[key] = value
+
+    def delete(self, key: str) -> None:
+        self.cache.pop(key, None)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> CacheStats:
+        self.cache.expire()
+        return CacheStats(
+            size=len(self.cache),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.cache.evictions,
+        )
@@ -0,0 +1,80 @@
+"""
+Runs independent upstream calls concurrently.
+
+Many service methods make several upstream calls which do not depend upon each other,
+such as fetching a work record and the profile of its owner. Run one after the other,
+the latency of the method is the sum of the latencies of the calls; run concurrently,
+it is that of the slowest.
+
+The same goes for a number of similar calls, such as reading a large set of works in
+several chunks.
+
+The calls are run in a task group, so that if one fails the others are cancelled.
+Rather than the exception group raised by the task group, the first exception is
+raised as-is, so that callers (and the JSON-RPC error handling) see the same
+exceptions as they would for sequential calls.
+
+A write must not be cancelled in this way, though, as its outcome would be unknown;
+`run_write_concurrently` runs a write alongside a read which only the write may cancel.
+"""
+
+import asyncio
+from typing import Any, Coroutine, Iterable, List, Set, Tuple, TypeVar
+
+A = TypeVar("A")
+B = TypeVar("B")
+
+# Writes which continue after their caller has been cancelled; the event loop holds
+# only weak references to tasks.
+_background_writes: Set["asyncio.Task[Any]"] = set()
+
+
+async def run_concurrently(
+    first: Coroutine[Any, Any, A], second: Coroutine[Any, Any, B]
+) -> Tuple[A, B]:
+    """
+    Runs the two calls concurrently, returning both of their results.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            first_task = group.create_task(first)
+            second_task = group.create_task(second)
+    except BaseExceptionGroup as group_error:
+        raise group_error.exceptions[0] from None
+    return first_task.result(), second_task.result()
+
+
+async def run_all_concurrently(calls: Iterable[Coroutine[Any, Any, A]]) -> List[A]:
+    """
+    Runs the calls concurrently, returning their results in the order of the calls.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(call) for call in calls]
+    except BaseExceptionGroup as group_error:
+        raise group_error.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+async def run_write_concurrently(
+    write: Coroutine[Any, Any, A], read: Coroutine[Any, Any, B]
+) -> Tuple[A, B]:
+    """
+    Runs a write and a read concurrently, returning both of their results.
+
+    The write always runs to completion: if the read fails, the read's exception is
+    raised only once the write has completed, and if the caller is cancelled the write
+    continues in the background. If the write fails, the read is cancelled and the
+    write's exception is raised.
+    """
+    write_task = asyncio.create_task(write)
+    _background_writes.add(write_task)
+    write_task.add_done_callback(_background_writes.discard)
+    read_task = asyncio.create_task(read)
+    try:
+        write_result = await asyncio.shield(write_task)
+    except BaseException:
+        read_task.cancel()
+        await asyncio.gather(read_task, return_exceptions=True)
+        raise
+    return write_result, await read_task
@@ -62,10 +62,37 @@ class IntEnvironmentVariable(ServiceBaseModel):
 class IntEnvironmentVariables(ServiceBaseModel):
     token_cache_lifetime: IntEnvironmentVariable = Field(...)
     token_cache_max_items: IntEnvironmentVariable = Field(...)
+    account_cache_lifetime: IntEnvironmentVariable = Field(...)
+    account_cache_max_items: IntEnvironmentVariable = Field(...)
+    invalid_token_cache_lifetime: IntEnvironmentVariable = Field(...)
+    orcid_profile_cache_lifetime: IntEnvironmentVariable = Field(...)
+    orcid_profile_cache_max_items: IntEnvironmentVariable = Field(...)
+    orcid_response_cache_lifetime: IntEnvironmentVariable = Field(...)
+    orcid_response_cache_max_items: IntEnvironmentVariable = Field(...)
     request_timeout: IntEnvironmentVariable = Field(...)
     mongo_port: IntEnvironmentVariable = Field(...)
     linking_session_lifetime: IntEnvironmentVariable = Field(...)
     orcid_authorization_retirement_age: IntEnvironmentVariable = Field(...)
+    token_refresh_lease_duration: IntEnvironmentVariable = Field(...)
+    token_refresh_interval: IntEnvironmentVariable = Field(...)
+    token_refresh_lookahead: IntEnvironmentVariable = Field(...)
+    token_refresh_concurrency: IntEnvironmentVariable = Field(...)
+    token_refresh_batch_size: IntEnvironmentVariable = Field(...)
+    linking_session_reaper_interval: IntEnvironmentVariable = Field(...)
+    linking_session_reaper_batch_size: IntEnvironmentVariable = Field(...)
+    linking_session_revocation_concurrency: IntEnvironmentVariable = Field(...)
+    linking_session_revocation_retries: IntEnvironmentVariable = Field(...)
+    mongo_min_pool_size: IntEnvironmentVariable = Field(...)
+    mongo_max_pool_size: IntEnvironmentVariable = Field(...)
+    mongo_max_idle_time: IntEnvironmentVariable = Field(...)
+    mongo_wait_queue_timeout: IntEnvironmentVariable = Field(...)
+    mongo_cursor_batch_size: IntEnvironmentVariable = Field(...)
+    storage_validate_reads: IntEnvironmentVariable = Field(...)
+    stats_cache_lifetime: IntEnvironmentVariable = Field(...)
+    http_connection_limit: IntEnvironmentVariable = Field(...)
+    http_connection_limit_per_host: IntEnvironmentVariable = Field(...)
+    http_dns_cache_ttl: IntEnvironmentVariable = Field(...)
+    http_keepalive_timeout: IntEnvironmentVariable = Field(...)
 
 
 INT_CONSTANT_DEFAULTS = IntEnvironmentVariables(
@@ -89,6 +116,72 @@ INT_CONSTANT_DEFAULTS = IntEnvironmentVariables(
             "The caching strategy determines behavior when the cache is full."
         ),
     ),
+    account_cache_lifetime=IntEnvironmentVariable(
+        value=30,
+        unit="second",
+        required=True,
+        env_name="ACCOUNT_CACHE_LIFETIME",
+        description=(
+            "The duration, in seconds, for which KBase Auth Service account info "
+            "may be cached. Kept short so that role changes take effect promptly."
+        ),
+    ),
+    account_cache_max_items=IntEnvironmentVariable(
+        value=1000,
+        unit="items",
+        required=True,
+        env_name="ACCOUNT_CACHE_MAX_ITEMS",
+        description=(
+            "The number of KBase Auth account info records which may be cached at "
+            "one time."
+        ),
+    ),
+    invalid_token_cache_lifetime=IntEnvironmentVariable(
+        value=60,
+        unit="second",
+        required=True,
+        env_name="INVALID_TOKEN_CACHE_LIFETIME",
+        description=(
+            "The duration, in seconds, for which a token reported as invalid by the "
+            "KBase Auth Service is remembered as invalid."
+        ),
+    ),
+    orcid_profile_cache_lifetime=IntEnvironmentVariable(
+        value=300,
+        unit="second",
+        required=True,
+        env_name="ORCID_PROFILE_CACHE_LIFETIME",
+        description=(
+            "The duration, in seconds, for which an ORCID profile may be cached."
+        ),
+    ),
+    orcid_profile_cache_max_items=IntEnvironmentVariable(
+        value=1000,
+        unit="items",
+        required=True,
+        env_name="ORCID_PROFILE_CACHE_MAX_ITEMS",
+        description=("The number of ORCID profiles which may be cached at one time."),
+    ),
+    orcid_response_cache_lifetime=IntEnvironmentVariable(
+        value=3600,
+        unit="second",
+        required=True,
+        env_name="ORCID_RESPONSE_CACHE_LIFETIME",
+        description=(
+            "The duration, in seconds, for which an ORCID API response is retained "
+            "for revalidation."
+        ),
+    ),
+    orcid_response_cache_max_items=IntEnvironmentVariable(
+        value=1000,
+        unit="items",
+        required=True,
+        env_name="ORCID_RESPONSE_CACHE_MAX_ITEMS",
+        description=(
+            "The number of ORCID API responses which may be retained for "
+            "revalidation at one time."
+        ),
+    ),
     request_timeout=IntEnvironmentVariable(
         value=60,
         unit="second",
@@ -113,6 +206,213 @@ INT_CONSTANT_DEFAULTS = IntEnvironmentVariables(
         unit="second",
         description=(""),
     ),
+    token_refresh_lease_duration=IntEnvironmentVariable(
+        required=True,
+        env_name="TOKEN_REFRESH_LEASE_DURATION",
+        value=120,
+        unit="second",
+        description=(
+            "The duration, in seconds, for which a service instance refreshing the "
+            "ORCID tokens for a link holds the refresh lease on the link; other "
+            "instances wait for the refresh, or take over once the lease expires."
+        ),
+    ),
+    token_refresh_interval=IntEnvironmentVariable(
+        required=True,
+        env_name="TOKEN_REFRESH_INTERVAL",
+        value=900,
+        unit="second",
+        description=(
+            "The interval, in seconds, at which links are checked for ORCID tokens "
+            "approaching retirement, which are then refreshed in the background. A "
+            "value of 0 disables background refreshing."
+        ),
+    ),
+    token_refresh_lookahead=IntEnvironmentVariable(
+        required=True,
+        env_name="TOKEN_REFRESH_LOOKAHEAD",
+        value=86400,
+        unit="second",
+        description=(
+            "Links whose ORCID tokens retire within this duration, in seconds, are "
+            "refreshed in the background."
+        ),
+    ),
+    token_refresh_concurrency=IntEnvironmentVariable(
+        required=True,
+        env_name="TOKEN_REFRESH_CONCURRENCY",
+        value=4,
+        unit="refresh",
+        description=(
+            "The maximum number of background token refreshes which may be in "
+            "progress at one time."
+        ),
+    ),
+    token_refresh_batch_size=IntEnvironmentVariable(
+        required=True,
+        env_name="TOKEN_REFRESH_BATCH_SIZE",
+        value=100,
+        unit="link",
+        description=(
+            "The maximum number of links refreshed in the background at each "
+            "interval."
+        ),
+    ),
+    linking_session_reaper_interval=IntEnvironmentVariable(
+        required=True,
+        env_name="LINKING_SESSION_REAPER_INTERVAL",
+        value=0,
+        unit="second",
+        description=(
+            "The interval at which expired completed linking sessions are revoked "
+            "and deleted in the background; a non-zero interval also enables the "
+            "expiry of initial and started linking sessions by MongoDB TTL indexes. "
+            "0 disables both, leaving expired linking sessions to the "
+            "delete-expired-linking-sessions method."
+        ),
+    ),
+    linking_session_reaper_batch_size=IntEnvironmentVariable(
+        required=True,
+        env_name="LINKING_SESSION_REAPER_BATCH_SIZE",
+        value=100,
+        unit="session",
+        description=(
+            "The maximum number of expired linking sessions revoked and deleted in "
+            "the background at each interval."
+        ),
+    ),
+    linking_session_revocation_concurrency=IntEnvironmentVariable(
+        required=True,
+        env_name="LINKING_SESSION_REVOCATION_CONCURRENCY",
+        value=4,
+        unit="session",
+        description=(
+            "The maximum number of expired linking sessions whose ORCID tokens are "
+            "being revoked at one time, by the reaper or the "
+            "delete-expired-linking-sessions method."
+        ),
+    ),
+    linking_session_revocation_retries=IntEnvironmentVariable(
+        required=True,
+        env_name="LINKING_SESSION_REVOCATION_RETRIES",
+        value=2,
+        unit="retry",
+        description=(
+            "The number of times a failed revocation of an expired linking "
+            "session's ORCID tokens is retried, with exponential backoff, before "
+            "the session is left for a later attempt."
+        ),
+    ),
+    mongo_min_pool_size=IntEnvironmentVariable(
+        required=True,
+        env_name="MONGO_MIN_POOL_SIZE",
+        value=0,
+        unit="connections",
+        description=(
+            "The minimum number of connections the shared MongoDB client keeps open "
+            "to the server."
+        ),
+    ),
+    mongo_max_pool_size=IntEnvironmentVariable(
+        required=True,
+        env_name="MONGO_MAX_POOL_SIZE",
+        value=100,
+        unit="connections",
+        description=(
+            "The maximum number of concurrent connections the shared MongoDB client "
+            "may open to the server; further operations wait for a free connection."
+        ),
+    ),
+    mongo_max_idle_time=IntEnvironmentVariable(
+        required=True,
+        env_name="MONGO_MAX_IDLE_TIME",
+        value=300,
+        unit="second",
+        description=(
+            "The duration, in seconds, a pooled MongoDB connection may remain idle "
+            "before it is closed."
+        ),
+    ),
+    mongo_wait_queue_timeout=IntEnvironmentVariable(
+        required=True,
+        env_name="MONGO_WAIT_QUEUE_TIMEOUT",
+        value=10,
+        unit="second",
+        description=(
+            "The duration, in seconds, an operation may wait for a pooled MongoDB "
+            "connection to become available before failing."
+        ),
+    ),
+    mongo_cursor_batch_size=IntEnvironmentVariable(
+        required=True,
+        env_name="MONGO_CURSOR_BATCH_SIZE",
+        value=100,
+        unit="items",
+        description=(
+            "The number of documents fetched from MongoDB in each batch when "
+            "iterating over query results."
+        ),
+    ),
+    storage_validate_reads=IntEnvironmentVariable(
+        required=True,
+        env_name="STORAGE_VALIDATE_READS",
+        value=0,
+        unit="flag",
+        description=(
+            "If 1, documents read from MongoDB are validated as they are decoded; "
+            "if 0, they are trusted and decoded without validation."
+        ),
+    ),
+    stats_cache_lifetime=IntEnvironmentVariable(
+        required=True,
+        env_name="STATS_CACHE_LIFETIME",
+        value=0,
+        unit="second",
+        description=(
+            "The duration, in seconds, for which link and linking session statistics "
+            "may be cached; 0 disables caching."
+        ),
+    ),
+    http_connection_limit=IntEnvironmentVariable(
+        required=True,
+        env_name="HTTP_CONNECTION_LIMIT",
+        value=100,
+        unit="connection",
+        description=(
+            "The maximum number of simultaneous connections each shared upstream "
+            "HTTP session may open."
+        ),
+    ),
+    http_connection_limit_per_host=IntEnvironmentVariable(
+        required=True,
+        env_name="HTTP_CONNECTION_LIMIT_PER_HOST",
+        value=20,
+        unit="connection",
+        description=(
+            "The maximum number of simultaneous connections a shared upstream HTTP "
+            "session may open to a single host."
+        ),
+    ),
+    http_dns_cache_ttl=IntEnvironmentVariable(
+        required=True,
+        env_name="HTTP_DNS_CACHE_TTL",
+        value=300,
+        unit="second",
+        description=(
+            "The duration, in seconds, for which upstream host name resolution is "
+            "cached."
+        ),
+    ),
+    http_keepalive_timeout=IntEnvironmentVariable(
+        required=True,
+        env_name="HTTP_KEEPALIVE_TIMEOUT",
+        value=30,
+        unit="second",
+        description=(
+            "The duration, in seconds, an idle upstream HTTP connection is kept open "
+            "for reuse."
+        ),
+    ),
 )
 
 
@@ -134,6 +434,7 @@ class StrEnvironmentVariables(ServiceBaseModel):
     orcid_site_base_url: StrEnvironmentVariable = Field(...)
     orcid_client_id: StrEnvironmentVariable = Field(...)
     orcid_client_secret: StrEnvironmentVariable = Field(...)
+    orcid_works_source_client_id: StrEnvironmentVariable = Field(...)
     manager_role: StrEnvironmentVariable = Field(...)
     mongo_host: StrEnvironmentVariable = Field(...)
     mongo_database: StrEnvironmentVariable = Field(...)
@@ -169,6 +470,14 @@ STR_ENVIRONMENT_VARIABLE_DEFAULTS = StrEnvironmentVariables(
     orcid_client_secret=StrEnvironmentVariable(
         required=True, env_name="ORCID_CLIENT_SECRET", description=("")
     ),
+    orcid_works_source_client_id=StrEnvironmentVariable(
+        required=False,
+        env_name="ORCID_WORKS_SOURCE_CLIENT_ID",
+        description=(
+            "The ORCID client id of the source of the works which are listed as "
+            "KBase works; defaults to ORCID_CLIENT_ID"
+        ),
+    ),
     orcid_scopes=StrEnvironmentVariable(
         required=True,
         env_name="ORCID_SCOPES",
@@ -208,6 +517,13 @@ class RuntimeConfig(ServiceBaseModel):
     request_timeout: int = Field(...)
     token_cache_lifetime: int = Field(...)
     token_cache_max_items: int = Field(...)
+    account_cache_lifetime: int = Field(...)
+    account_cache_max_items: int = Field(...)
+    invalid_token_cache_lifetime: int = Field(...)
+    orcid_profile_cache_lifetime: int = Field(...)
+    orcid_profile_cache_max_items: int = Field(...)
+    orcid_response_cache_lifetime: int = Field(...)
+    orcid_response_cache_max_items: int = Field(...)
     log_level: str = Field(...)
     manager_role: str = Field(...)
 
@@ -216,8 +532,18 @@ class RuntimeConfig(ServiceBaseModel):
     orcid_site_base_url: str = Field(...)
     orcid_client_id: str = Field(...)
     orcid_client_secret: str = Field(...)
+    orcid_works_source_client_id: str = Field(...)
     orcid_scopes: str = Field(...)
     orcid_authorization_retirement_age: int = Field(...)
+    token_refresh_lease_duration: int = Field(...)
+    token_refresh_interval: int = Field(...)
+    token_refresh_lookahead: int = Field(...)
+    token_refresh_concurrency: int = Field(...)
+    token_refresh_batch_size: int = Field(...)
+    linking_session_reaper_interval: int = Field(...)
+    linking_session_reaper_batch_size: int = Field(...)
+    linking_session_revocation_concurrency: int = Field(...)
+    linking_session_revocation_retries: int = Field(...)
 
     linking_session_lifetime: int = Field(...)
     linking_session_return_url: str = Field(...)
@@ -227,6 +553,18 @@ class RuntimeConfig(ServiceBaseModel):
     mongo_database: str = Field(...)
     mongo_username: str = Field(...)
     mongo_password: str = Field(...)
+    mongo_min_pool_size: int = Field(...)
+    mongo_max_pool_size: int = Field(...)
+    mongo_max_idle_time: int = Field(...)
+    mongo_wait_queue_timeout: int = Field(...)
+    mongo_cursor_batch_size: int = Field(...)
+    storage_validate_reads: int = Field(...)
+    stats_cache_lifetime: int = Field(...)
+
+    http_connection_limit: int = Field(...)
+    http_connection_limit_per_host: int = Field(...)
+    http_dns_cache_ttl: int = Field(...)
+    http_keepalive_timeout: int = Field(...)
 
     ui_origin: str = Field(...)
 
@@ -242,6 +580,9 @@ class ServiceConfig:
         self.kbase_endpoint = self.get_str_environment_variable(
             STR_ENVIRONMENT_VARIABLE_DEFAULTS.kbase_endpoint
         )
+        orcid_client_id = self.get_str_environment_variable(
+            STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_client_id
+        )
         self.runtime_config = RuntimeConfig(
             service_directory=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.service_directory
@@ -258,9 +599,57 @@ class ServiceConfig:
             token_cache_max_items=self.get_int_environment_variable(
                 INT_CONSTANT_DEFAULTS.token_cache_max_items
             ),
+            account_cache_lifetime=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.account_cache_lifetime
+            ),
+            account_cache_max_items=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.account_cache_max_items
+            ),
+            invalid_token_cache_lifetime=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.invalid_token_cache_lifetime
+            ),
+            orcid_profile_cache_lifetime=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.orcid_profile_cache_lifetime
+            ),
+            orcid_profile_cache_max_items=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.orcid_profile_cache_max_items
+            ),
+            orcid_response_cache_lifetime=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.orcid_response_cache_lifetime
+            ),
+            orcid_response_cache_max_items=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.orcid_response_cache_max_items
+            ),
             orcid_authorization_retirement_age=self.get_int_environment_variable(
                 INT_CONSTANT_DEFAULTS.orcid_authorization_retirement_age
             ),
+            token_refresh_lease_duration=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.token_refresh_lease_duration
+            ),
+            token_refresh_interval=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.token_refresh_interval
+            ),
+            token_refresh_lookahead=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.token_refresh_lookahead
+            ),
+            token_refresh_concurrency=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.token_refresh_concurrency
+            ),
+            token_refresh_batch_size=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.token_refresh_batch_size
+            ),
+            linking_session_reaper_interval=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.linking_session_reaper_interval
+            ),
+            linking_session_reaper_batch_size=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.linking_session_reaper_batch_size
+            ),
+            linking_session_revocation_concurrency=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.linking_session_revocation_concurrency
+            ),
+            linking_session_revocation_retries=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.linking_session_revocation_retries
+            ),
             log_level=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.log_level
             ),
@@ -276,12 +665,14 @@ class ServiceConfig:
             orcid_site_base_url=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_site_base_url
             ),
-            orcid_client_id=self.get_str_environment_variable(
-                STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_client_id
-            ),
+            orcid_client_id=orcid_client_id,
             orcid_client_secret=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_client_secret
             ),
+            orcid_works_source_client_id=self.get_optional_str_environment_variable(
+                STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_works_source_client_id
+            )
+            or orcid_client_id,
             orcid_scopes=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.orcid_scopes
             ),
@@ -306,6 +697,39 @@ class ServiceConfig:
             mongo_password=self.get_str_environment_variable(
                 STR_ENVIRONMENT_VARIABLE_DEFAULTS.mongo_password
             ),
+            mongo_min_pool_size=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.mongo_min_pool_size
+            ),
+            mongo_max_pool_size=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.mongo_max_pool_size
+            ),
+            mongo_max_idle_time=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.mongo_max_idle_time
+            ),
+            mongo_wait_queue_timeout=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.mongo_wait_queue_timeout
+            ),
+            mongo_cursor_batch_size=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.mongo_cursor_batch_size
+            ),
+            storage_validate_reads=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.storage_validate_reads
+            ),
+            stats_cache_lifetime=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.stats_cache_lifetime
+            ),
+            http_connection_limit=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.http_connection_limit
+            ),
+            http_connection_limit_per_host=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.http_connection_limit_per_host
+            ),
+            http_dns_cache_ttl=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.http_dns_cache_ttl
+            ),
+            http_keepalive_timeout=self.get_int_environment_variable(
+                INT_CONSTANT_DEFAULTS.http_keepalive_timeout
+            ),
             ui_origin=self.get_ui_origin(),
             auth_url=self.get_service_url(SERVICE_DEFAULTS.auth2),
             orcidlink_url=self.get_own_url(SERVICE_DEFAULTS.orcid_link),
@@ -362,6 +786,17 @@ class ServiceConfig:
             " and there is no default value"
         )
 
+    @staticmethod
+    def get_optional_str_environment_variable(
+        environment_variable: StrEnvironmentVariable,
+    ) -> Optional[str]:
+        value = os.environ.get(environment_variable.env_name)
+
+        if value is not None:
+            return value
+
+        return environment_variable.value
+
     # misc
 
     def get_ui_origin(self) -> str:
@@ -0,0 +1,83 @@
+"""
+The JSON codec used for the bodies of requests to, and responses from, upstream
+services.
+
+ORCID records for active researchers run to hundreds of kilobytes of JSON. Decoding
+such a body to a string (with charset detection) and then parsing it with the standard
+library's `json` module is a significant part of the cost of a request. So `orjson`,
+a dependency of the service, is used instead. It parses the raw bytes of a response
+body directly, and serializes to bytes, several times faster than the standard
+library. Should it not be installed, the standard library is used. The standard
+library also parses bytes directly, detecting the UTF encoding as JSON requires.
+
+Both codecs raise `json.JSONDecodeError` (which `orjson.JSONDecodeError` subclasses)
+for invalid JSON, so callers handle errors the same way whichever codec is in use.
+
+The codec in use may be replaced with `set_json_codec` (e.g. to compare codecs, as
+`src/misc/benchmark-json-codec.py` does).
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+
+class JSONCodec:
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[bytes | str], Any],
+        dumps: Callable[[Any], bytes],
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+
+def stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+STDLIB_CODEC = JSONCodec(name="json", loads=json.loads, dumps=stdlib_dumps)
+
+
+def orjson_codec() -> Optional[JSONCodec]:
+    """
+    Returns the orjson codec, or None if orjson is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover
+        return None
+    return JSONCodec(name="orjson", loads=orjson.loads, dumps=orjson.dumps)
+
+
+ORJSON_CODEC = orjson_codec()
+
+_codec: JSONCodec = ORJSON_CODEC or STDLIB_CODEC
+
+
+def json_codec() -> JSONCodec:
+    """
+    Returns the JSON codec in use: orjson if it is installed, otherwise the standard
+    library.
+    """
+    return _codec
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    global _codec
+    _codec = codec
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parses JSON, preferably from the raw bytes of a body.
+    """
+    return _codec.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes a value as JSON, to bytes suitable for a request body.
+    """
+    return _codec.dumps(value)
@@ -0,0 +1,76 @@
+"""
+Runs a task periodically, in the background, on the running event loop.
+
+Background work, such as refreshing retiring ORCID tokens or reaping expired linking
+sessions, is run at an interval, with jitter, so that multiple service instances do
+not run in lockstep. A failed run (e.g. because the database is unavailable) is
+reported, but does not stop subsequent runs.
+
+A zero (or negative) interval disables the task.
+"""
+
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# The fraction of the interval by which each interval is randomly lengthened or
+# shortened.
+INTERVAL_JITTER = 0.1
+
+
+class PeriodicTask(ABC):
+    def __init__(self, interval: int):
+        """
+        Constructor
+
+        The interval is in seconds.
+        """
+        self.interval = interval
+        self.task: Optional[asyncio.Task[None]] = None
+
+    @abstractmethod
+    async def run_once(self) -> None:
+        """
+        Performs a single run of the task.
+        """
+
+    @abstractmethod
+    def report_error(self, error: Exception) -> None:
+        """
+        Reports an error raised by a run of the task.
+        """
+
+    def start(self) -> None:
+        """
+        Starts running in the background on the running event loop, unless disabled
+        by a zero interval.
+        """
+        if self.interval <= 0 or self.running():
+            return
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.task is None:
+            return
+        task, self.task = self.task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def next_delay(self) -> float:
+        return self.interval * random.uniform(1 - INTERVAL_JITTER, 1 + INTERVAL_JITTER)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.next_delay())
+            try:
+                await self.run_once()
+            except Exception as ex:
+                # A failed run must not stop subsequent runs.
+                self.report_error(ex)
@@ -114,6 +114,31 @@ SESSION_ID_PARAM = Body(..., description="KBase linking session identifier")
 
 PUT_CODE_PARAM = Body(..., description="ORCID Work activity record put code")
 
+# The maximum number of works which may be read in a single call.
+PUT_CODES_LIMIT = 1000
+
+PUT_CODES_PARAM = Body(
+    ...,
+    max_length=PUT_CODES_LIMIT,
+    description=(
+        "ORCID Work activity record put codes, of which there may be no more than "
+        f"{PUT_CODES_LIMIT}"
+    ),
+)
+
+# The maximum number of works which may be created in a single call; they are created
+# by up to NEW_WORKS_LIMIT / ORCID_BULK_WORKS_LIMIT bulk requests, one after the other.
+NEW_WORKS_LIMIT = 500
+
+NEW_WORKS_PARAM = Body(
+    ...,
+    max_length=NEW_WORKS_LIMIT,
+    description=(
+        "New work activity records, of which there may be no more than "
+        f"{NEW_WORKS_LIMIT}"
+    ),
+)
+
 ResponseMapping = Mapping[Union[int, str], Dict[str, Any]]
 
 AUTH_RESPONSES: ResponseMapping = {
@@ -0,0 +1,124 @@
+"""
+Provides shared HTTP client sessions for calls to upstream services.
+
+Each aiohttp client session owns a connection pool, so creating a session for each
+request means that every request pays for DNS resolution, a TCP connection and a TLS
+handshake. Rather, the service opens one long-lived session per upstream host (KBase
+auth, the ORCID API, and the ORCID OAuth API) when it starts (see the `lifespan` in
+`main.py`), and closes them when it shuts down. Clients are handed the session for
+their host, and connections are kept alive and reused across requests.
+
+Note that an aiohttp session is bound to the event loop on which it is created. As with
+the MongoDB client, sessions are maintained for each event loop. Where no shared
+session has been opened for the running loop (e.g. when a client is used outside of the
+service), a transient session is created for the duration of each request.
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from orcidlink.runtime import config
+
+_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]
+] = weakref.WeakKeyDictionary()
+
+
+def origin(url: str) -> str:
+    """
+    Returns the origin (scheme, host and port) of a url, which is the granularity at
+    which sessions are shared.
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def make_connector() -> aiohttp.TCPConnector:
+    return aiohttp.TCPConnector(
+        limit=config().http_connection_limit,
+        limit_per_host=config().http_connection_limit_per_host,
+        ttl_dns_cache=config().http_dns_cache_ttl,
+        keepalive_timeout=config().http_keepalive_timeout,
+        force_close=False,
+    )
+
+
+def make_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=make_connector(), version=aiohttp.HttpVersion11
+    )
+
+
+def upstream_urls() -> List[str]:
+    """
+    The base urls of all upstream services the service calls.
+    """
+    return [
+        config().auth_url,
+        config().orcid_api_base_url,
+        config().orcid_oauth_base_url,
+    ]
+
+
+def open_http_sessions() -> None:
+    """
+    Opens a shared session for each upstream host, for the running event loop.
+
+    Must be called from within a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _sessions.setdefault(loop, {})
+    for url in upstream_urls():
+        key = origin(url)
+        if key not in sessions:
+            sessions[key] = make_session()
+
+
+async def close_http_sessions() -> None:
+    """
+    Closes the shared sessions for the running event loop, if any have been opened.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    sessions = _sessions.pop(loop, {})
+    for session in sessions.values():
+        await session.close()
+
+
+def http_session(url: str) -> Optional[aiohttp.ClientSession]:
+    """
+    Returns the shared session for the host of the given url, for the running event
+    loop, or None if there is no such session.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    session = _sessions.get(loop, {}).get(origin(url))
+    if session is None or session.closed:
+        return None
+    return session
+
+
+@asynccontextmanager
+async def client_session(
+    session: Optional[aiohttp.ClientSession],
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Provides the given shared session, which is left open on exit, or if it is None,
+    a transient session which is closed on exit.
+    """
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as transient_session:
+            yield transient_session
@@ -5,15 +5,22 @@ The SDK version has been modified to integrate with this codebase, such as
 using httpx, pydantic models.
 """
 
+import hashlib
 import json
+import time
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 from pydantic import Field
 
 from orcidlink.jsonrpc import errors
+from orcidlink.lib import json_codec
+from orcidlink.lib.cache import TimedLRUCache
 from orcidlink.lib.responses import UIError
+from orcidlink.lib.service_clients.http_session import client_session, http_session
+from orcidlink.lib.single_flight import SingleFlight
 from orcidlink.lib.type import ServiceBaseModel
+from orcidlink.runtime import config
 
 #
 # Auth Exceptions
@@ -94,25 +101,122 @@ class AccountInfo(ServiceBaseModel):
     policyids: List[PolicyAgreement]
 
 
+def token_key(token: str) -> str:
+    """
+    The cache key for a token; tokens are not retained in memory as-is.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_info_lifetime(token_info: TokenInfo) -> float:
+    """
+    The duration, in seconds, for which the auth service allows token info to be
+    cached - the lesser of the "cachefor" advice and the time remaining until the
+    token expires. Both are provided by the auth service in milliseconds.
+    """
+    return min(token_info.cachefor / 1000, token_info.expires / 1000 - time.time())
+
+
+_token_info_cache: Optional[TimedLRUCache[TokenInfo]] = None
+_account_info_cache: Optional[TimedLRUCache[AccountInfo]] = None
+_invalid_token_cache: Optional[TimedLRUCache[bool]] = None
+
+# Concurrent lookups for the same token share a single call to the auth service.
+_token_info_lookups: SingleFlight[TokenInfo] = SingleFlight()
+_account_info_lookups: SingleFlight[AccountInfo] = SingleFlight()
+
+
+def token_info_cache() -> TimedLRUCache[TokenInfo]:
+    """
+    Returns the process-wide token info cache, creating it if necessary.
+    """
+    global _token_info_cache
+    if _token_info_cache is None:
+        _token_info_cache = TimedLRUCache(
+            max_size=config().token_cache_max_items,
+            lifetime=config().token_cache_lifetime,
+            lifetime_of=token_info_lifetime,
+        )
+    return _token_info_cache
+
+
+def account_info_cache() -> TimedLRUCache[AccountInfo]:
+    """
+    Returns the process-wide account info cache, creating it if necessary.
+
+    Account info carries the user's roles, so its lifetime is kept short in order that
+    role changes propagate promptly.
+    """
+    global _account_info_cache
+    if _account_info_cache is None:
+        _account_info_cache = TimedLRUCache(
+            max_size=config().account_cache_max_items,
+            lifetime=config().account_cache_lifetime,
+        )
+    return _account_info_cache
+
+
+def token_info_lookups() -> SingleFlight[TokenInfo]:
+    return _token_info_lookups
+
+
+def account_info_lookups() -> SingleFlight[AccountInfo]:
+    return _account_info_lookups
+
+
+def invalid_token_cache() -> TimedLRUCache[bool]:
+    """
+    Returns the process-wide cache of tokens reported as invalid by the auth service,
+    creating it if necessary.
+    """
+    global _invalid_token_cache
+    if _invalid_token_cache is None:
+        _invalid_token_cache = TimedLRUCache(
+            max_size=config().token_cache_max_items,
+            lifetime=config().invalid_token_cache_lifetime,
+        )
+    return _invalid_token_cache
+
+
 class KBaseAuth(object):
     """
     A basic KBase auth client which only implements methods utilized by this service.
 
-    Note that this is not a caching client. The primary task of auth in the service
-    is to validate a token, and to obtain the username and roles for the user who owns
-    the token.
+    The primary task of auth in the service is to validate a token, and to obtain the
+    username and roles for the user who owns the token. As the same token is typically
+    presented with many requests, token info and account info may be cached by
+    providing the respective caches. Tokens the auth service reports as invalid may
+    likewise be remembered, by providing an invalid token cache.
+
+    Concurrent lookups for the same token may be coalesced into a single call to the
+    auth service by providing the respective single-flight coordinators.
+
+    Requests are made with the given session, typically the service's shared session
+    for the auth service; if none is provided, each request uses a transient session.
     """
 
     def __init__(
         self,
         url: str,
         timeout: int,
+        session: Optional[aiohttp.ClientSession] = None,
+        token_cache: Optional[TimedLRUCache[TokenInfo]] = None,
+        account_cache: Optional[TimedLRUCache[AccountInfo]] = None,
+        invalid_token_cache: Optional[TimedLRUCache[bool]] = None,
+        token_lookups: Optional[SingleFlight[TokenInfo]] = None,
+        account_lookups: Optional[SingleFlight[AccountInfo]] = None,
     ):
         """
         Constructor
         """
         self.url = url
         self.timeout = timeout
+        self.session = session
+        self.token_cache = token_cache
+        self.account_cache = account_cache
+        self.invalid_token_cache = invalid_token_cache
+        self.token_lookups = token_lookups
+        self.account_lookups = account_lookups
 
     async def _get(self, path: str, authorization: str) -> Any:
         """
@@ -124,32 +228,31 @@ class KBaseAuth(object):
 
         It raises several errors, under the following conditions:
 
-        - ContentTypeError - if the wrong content type (not application/json)
-          is returned (raised by aiohttp)
-        - JSONDecodeError - if the response does not parse correctly as
-          JSON (raised by aiohttp)
+        - ContentTypeAuthError - if the wrong content type (not application/json)
+          is returned
+        - JSONDecodeAuthError - if the response does not parse correctly as
+          JSON
         - AuthorizationRequiredAuthError - if the error returned by the
           auth service is 10020 (invalid token),
         - OtherAuthError - for any other error reported by the auth service
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with client_session(self.session) as session:
                 url = f"{self.url}/api/V2/{path}"
                 async with session.get(
                     url, headers={"authorization": authorization}, timeout=self.timeout
                 ) as response:
-                    json_result = await response.json()
-
-        except aiohttp.ContentTypeError as cte:
-            # Raised if it is not application/json
-            # data = exceptions.ContentTypeErrorData()
-            # if cte.headers is not None:
-            #     data.originalContentType = cte.headers["content-type"]
-            error_data: Dict[str, Any] = {}
-            if cte.headers is not None:
-                error_data["originalContentType"] = cte.headers["content-type"]
-
-            raise ContentTypeAuthError("Wrong content type", error_data) from cte
+                    if response.content_type != "application/json":
+                        error_data: Dict[str, Any] = {}
+                        if "content-type" in response.headers:
+                            error_data["originalContentType"] = response.headers[
+                                "content-type"
+                            ]
+                        raise ContentTypeAuthError("Wrong content type", error_data)
+
+                    # The body is parsed from its raw bytes, rather than first being
+                    # decoded to a string (see lib/json_codec.py).
+                    json_result = json_codec.loads(await response.read())
 
         except json.JSONDecodeError as jde:
             raise JSONDecodeAuthError(
@@ -172,6 +275,25 @@ class KBaseAuth(object):
 
         return json_result
 
+    async def _get_for_token(self, path: str, token: str) -> Any:
+        """
+        As _get, with the token as authorization, but rejects a token known to be
+        invalid without calling the auth service, and records a token which the auth
+        service reports as invalid, if the client has an invalid token cache.
+        """
+        if self.invalid_token_cache is None:
+            return await self._get(path, token)
+
+        key = token_key(token)
+        if self.invalid_token_cache.get(key) is not None:
+            raise AuthorizationRequiredAuthError("Authorization Required")
+
+        try:
+            return await self._get(path, token)
+        except AuthorizationRequiredAuthError:
+            self.invalid_token_cache.set(key, True)
+            raise
+
     async def get_token_info(self, token: str) -> TokenInfo:
         """
         Fetches token information from the auth service and returns it in a
@@ -179,10 +301,29 @@ class KBaseAuth(object):
 
         Other than errors thrown by _get, it may throw a ValidationError if the data
         returned from the auth service is not compliant with the TokenInfo type
-        """
-        json_result = await self._get("token", token)
 
-        return TokenInfo.model_validate(json_result)
+        If the client has a token cache, token info is returned from it if present,
+        and added to it otherwise. Errors are not cached.
+        """
+        key = token_key(token)
+        if self.token_cache is not None:
+            token_info = self.token_cache.get(key)
+            if token_info is not None:
+                return token_info
+
+        if self.token_lookups is None:
+            return await self._fetch_token_info(key, token)
+
+        return await self.token_lookups.run(
+            key, lambda: self._fetch_token_info(key, token)
+        )
+
+    async def _fetch_token_info(self, key: str, token: str) -> TokenInfo:
+        json_result = await self._get_for_token("token", token)
+        token_info = TokenInfo.model_validate(json_result)
+        if self.token_cache is not None:
+            self.token_cache.set(key, token_info)
+        return token_info
 
     async def get_me(self, token: str) -> AccountInfo:
         """
@@ -191,16 +332,53 @@ class KBaseAuth(object):
 
         Other than errors thrown by _get, it may throw a ValidationError if the data
         returned from the auth service is not compliant with the AccountINfo type
+
+        If the client has an account cache, account info is returned from it if
+        present, and added to it otherwise. Errors are not cached.
         """
         if token == "":
             raise AuthorizationRequiredAuthError("Token may not be empty")
 
-        json_result = await self._get("me", token)
+        key = token_key(token)
+        if self.account_cache is not None:
+            account_info = self.account_cache.get(key)
+            if account_info is not None:
+                return account_info
+
+        if self.account_lookups is None:
+            return await self._fetch_account_info(key, token)
+
+        return await self.account_lookups.run(
+            key, lambda: self._fetch_account_info(key, token)
+        )
+
+    async def _fetch_account_info(self, key: str, token: str) -> AccountInfo:
+        json_result = await self._get_for_token("me", token)
 
         # TODO: we need this model validation to trigger a ui error.
         # though, to be fair, this would be an internal error, not something the user
         # can do anything about.
-        return AccountInfo.model_validate(json_result)
+        account_info = AccountInfo.model_validate(json_result)
+        if self.account_cache is not None:
+            self.account_cache.set(key, account_info)
+        return account_info
+
+
+def kbase_auth() -> KBaseAuth:
+    """
+    Creates an instance of KBaseAuth for the service, using the shared session and
+    caches.
+    """
+    return KBaseAuth(
+        url=config().auth_url,
+        timeout=config().request_timeout,
+        session=http_session(config().auth_url),
+        token_cache=token_info_cache(),
+        account_cache=account_info_cache(),
+        invalid_token_cache=invalid_token_cache(),
+        token_lookups=token_info_lookups(),
+        account_lookups=account_info_lookups(),
+    )
 
 
 def auth_error_to_jsonrpc_error(error: AuthError) -> errors.JSONRPCError:
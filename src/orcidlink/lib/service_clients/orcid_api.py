@@ -21,15 +21,18 @@ Otherwise, all errors are raised as "UpstreamError" with the original error wrap
 logging and possibly for reporting to the user.
 """
 
+import asyncio
 import json
 import logging
 from typing import (
     Any,
+    Callable,
     Generic,
     List,
     Literal,
     Optional,
     Tuple,
+    Type,
     TypeAlias,
     TypeVar,
     Union,
@@ -38,10 +41,14 @@ from typing import (
 import aiohttp
 from asgi_correlation_id import correlation_id
 from multidict import CIMultiDict
-from pydantic import Field
+from pydantic import Field, ValidationError
 
 from orcidlink.jsonrpc.errors import UpstreamError
+from orcidlink.lib import json_codec
+from orcidlink.lib.cache import CacheStats, TimedLRUCache
+from orcidlink.lib.concurrency import run_all_concurrently
 from orcidlink.lib.json_support import JSONObject, JSONValue, json_path
+from orcidlink.lib.service_clients.http_session import client_session, http_session
 from orcidlink.lib.service_clients.orcid_api_errors import (
     OAuthBearerError,
     ORCIDAPIError,
@@ -56,6 +63,15 @@ from orcidlink.lib.type import ServiceBaseModel
 from orcidlink.runtime import config
 
 ORCID_API_CONTENT_TYPE = "application/vnd.orcid+json"
+
+# The maximum number of works which ORCID will read, or create, in a single bulk
+# request.
+ORCID_BULK_WORKS_LIMIT = 100
+
+# The maximum number of bulk requests made concurrently to read the works for a single
+# call.
+ORCID_BULK_WORKS_CONCURRENCY = 4
+
 #
 # API Type modeling via Pydantic classses.
 #
@@ -628,9 +644,25 @@ class GetWorkResult(ServiceBaseModel):
     bulk: Tuple[WorkWrapper]
 
 
+class BulkWork(ServiceBaseModel):
+    """
+    An item of a bulk read, or creation, of works: either the work, or the error
+    reading or creating it.
+    """
+
+    work: Optional[Work] = Field(default=None)
+    error: Optional[ORCIDAPIError] = Field(default=None)
+
+
+class GetBulkWorksResult(ServiceBaseModel):
+    bulk: List[BulkWork]
+
+
 class CreateWorkInput(ServiceBaseModel):
-    bulk: Tuple[NewWorkWrapper]
+    bulk: List[NewWorkWrapper]
+
 
+ResponseModel = TypeVar("ResponseModel", bound=ServiceBaseModel)
 
 #
 # Exceptions
@@ -640,21 +672,10 @@ class CreateWorkInput(ServiceBaseModel):
 #
 
 
-async def handle_json_response(response: aiohttp.ClientResponse) -> Any:
+def check_content_type(response: aiohttp.ClientResponse) -> None:
     """
-    Given a response from the ORCID API, as an aiohttp response object, extract and
-    return JSON from the body, handling any erroneous conditions.
-
-    ORCID API Errors? The documentation is terrible, but here are some resources:
-
-    - https://github.com/ORCID/ORCID-Source/blob/main/orcid-api-web/tutorial/api_errors.md,
-      general discussion of errors in the context of response codes, messages. Not very
-      useful for us as we ignore the response code, and just use the error code.
-    - Listing of error codes and messages in the orcid-core codebase. This is the only
-      place I found the actual error codes itemized:
-      https://github.com/ORCID/ORCID-Source/blob/b0016f3284875e48e81631bea149be831da78d22/orcid-core/src/main/resources/i18n/api_en.properties#L53
+    Ensures that a response from the ORCID API holds ORCID JSON.
     """
-
     # Just some basic sanity testing; also, forced by using type analysis
     content_type_raw = response.headers.get("Content-Type")
     if content_type_raw is None:
@@ -677,11 +698,74 @@ async def handle_json_response(response: aiohttp.ClientResponse) -> Any:
             )
         )
 
+
+async def handle_json_response(
+    response: aiohttp.ClientResponse, bulk_item_errors: bool = False
+) -> Any:
+    """
+    Given a response from the ORCID API, as an aiohttp response object, extract and
+    return JSON from the body, handling any erroneous conditions.
+
+    A successful response to a bulk request may hold an error for any of its items, in
+    place of the item. If bulk_item_errors is set, as for a bulk read of several works,
+    such a response is returned as is, leaving the caller to handle the error of each
+    item; otherwise the error of the first item, if any, is raised.
+
+    ORCID API Errors? The documentation is terrible, but here are some resources:
+
+    - https://github.com/ORCID/ORCID-Source/blob/main/orcid-api-web/tutorial/api_errors.md,
+      general discussion of errors in the context of response codes, messages. Not very
+      useful for us as we ignore the response code, and just use the error code.
+    - Listing of error codes and messages in the orcid-core codebase. This is the only
+      place I found the actual error codes itemized:
+      https://github.com/ORCID/ORCID-Source/blob/b0016f3284875e48e81631bea149be831da78d22/orcid-core/src/main/resources/i18n/api_en.properties#L53
+    """
+
+    check_content_type(response)
+    return handle_json_body(response.status, await response.read(), bulk_item_errors)
+
+
+async def handle_model_response(
+    response: aiohttp.ClientResponse,
+    model: Type[ResponseModel],
+    bulk_item_errors: bool = False,
+) -> ResponseModel:
+    """
+    Given a response from the ORCID API, as an aiohttp response object, return the
+    body as the given model, handling any erroneous conditions as does
+    handle_json_response.
+
+    A successful response is validated as the model directly from the JSON of the
+    body, which pydantic does in a single pass, without first parsing the body into
+    Python objects which are then validated in a second pass. For a large resource,
+    such as a profile, this is both faster and holds far less in memory.
+
+    Only if the response is not successful, or its body is not the model (e.g. it is
+    a bulk response holding an error), is the body parsed and handled by
+    handle_json_body, which raises the appropriate error.
+    """
+    check_content_type(response)
+    body = await response.read()
+    if response.status == 200:
+        try:
+            return model.model_validate_json(body)
+        except ValidationError:
+            pass
+    return model.model_validate(
+        handle_json_body(response.status, body, bulk_item_errors)
+    )
+
+
+def handle_json_body(status: int, body: bytes, bulk_item_errors: bool) -> Any:
+    """
+    Parses and returns the JSON body of a response from the ORCID API with the given
+    status, raising the error if it holds one.
+    """
     # Perform the JSON parsing manually, as the aiohttp "json()" method will return
-    # None for an empty body (which is simply wrong).
+    # None for an empty body (which is simply wrong). The body is parsed from its raw
+    # bytes, sparing decoding it to a string first.
     try:
-        text_response = await response.text()
-        json_response = json.loads(text_response)
+        json_response = json_codec.loads(body)
     except json.JSONDecodeError as jde:
         log_error("Error decoding JSON response", "failed_call", {"error": str(jde)})
         raise UpstreamError(
@@ -696,7 +780,9 @@ async def handle_json_response(response: aiohttp.ClientResponse) -> Any:
     # and is in a 200 response. This is probably because all bulk calls can have
     # some bulk items returned, and others with errors
     #
-    if response.status == 200:
+    if status == 200:
+        if bulk_item_errors:
+            return json_response
         # let's just handle the case of a work not found.
         found, simple_bulk_error = json_path(json_response, ["bulk", 0, "error"])
         if not found:
@@ -775,6 +861,195 @@ def log_error(message: str, event: str, extra: dict[str, Any]) -> None:
     )
 
 
+def profile_last_modified(profile: ORCIDProfile) -> int:
+    """
+    The most recent last-modified-date in the profile, or 0 if there is none.
+    """
+    last_modified_dates = [
+        date.value
+        for date in [
+            profile.person.last_modified_date,
+            profile.activities_summary.last_modified_date,
+        ]
+        if date is not None
+    ]
+    return max(last_modified_dates, default=0)
+
+
+class ORCIDProfileCache:
+    """
+    A cache of ORCID profiles, keyed by ORCID iD.
+
+    A profile expires after the cache lifetime, and is invalidated earlier if the ORCID
+    record is known to have changed - either because the service has itself modified
+    the record, or because ORCID has reported a last-modified-date for the record more
+    recent than the cached profile.
+    """
+
+    def __init__(self, max_size: int, lifetime: int):
+        self.cache: TimedLRUCache[ORCIDProfile] = TimedLRUCache(
+            max_size=max_size, lifetime=lifetime
+        )
+
+    def get(self, orcid_id: str) -> Optional[ORCIDProfile]:
+        return self.cache.get(orcid_id)
+
+    def set(self, orcid_id: str, profile: ORCIDProfile) -> None:
+        self.cache.set(orcid_id, profile)
+
+    def invalidate(self, orcid_id: str, modified_at: Optional[int] = None) -> None:
+        """
+        Invalidates the cached profile for the ORCID iD; if the time at which the
+        record was modified is provided, only if the profile is older than that.
+        """
+        if modified_at is not None:
+            profile = self.cache.peek(orcid_id)
+            if profile is None or profile_last_modified(profile) >= modified_at:
+                return
+        self.cache.delete(orcid_id)
+
+    def stats(self) -> CacheStats:
+        return self.cache.stats()
+
+
+_profile_cache: Optional[ORCIDProfileCache] = None
+
+
+def orcid_profile_cache() -> ORCIDProfileCache:
+    """
+    Returns the process-wide ORCID profile cache, creating it if necessary.
+    """
+    global _profile_cache
+    if _profile_cache is None:
+        _profile_cache = ORCIDProfileCache(
+            max_size=config().orcid_profile_cache_max_items,
+            lifetime=config().orcid_profile_cache_lifetime,
+        )
+    return _profile_cache
+
+
+def filter_works_by_source(works: Any, source_client_id: str) -> Any:
+    """
+    Filters the JSON of a works response, before it is validated, to the work summaries
+    whose source is the given ORCID client, dropping any group left without any.
+
+    A researcher's record may hold hundreds of works, of which only a few were added
+    through KBase; filtering the raw JSON spares validating the rest.
+    """
+    groups: List[JSONValue] = []
+    for group in works.get("group", []):
+        work_summaries = [
+            work_summary
+            for work_summary in group.get("work-summary", [])
+            if json_path(work_summary, ["source", "source-client-id", "path"])
+            == (True, source_client_id)
+        ]
+        if len(work_summaries) > 0:
+            groups.append({**group, "work-summary": work_summaries})
+    return {**works, "group": groups}
+
+
+class ValidatedResponse:
+    """
+    A parsed ORCID API response, together with the validators (the ETag and
+    Last-Modified headers) with which the response may be revalidated.
+    """
+
+    def __init__(
+        self,
+        value: ServiceBaseModel,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_header(self) -> CIMultiDict[str]:
+        header: CIMultiDict[str] = CIMultiDict()
+        if self.etag is not None:
+            header["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            header["If-Modified-Since"] = self.last_modified
+        return header
+
+
+class ResponseCacheStats(CacheStats):
+    not_modified: int = Field(...)
+
+
+class ORCIDResponseCache:
+    """
+    A cache of parsed ORCID API responses, keyed by the request path (e.g.
+    "0000-0003-4997-3076/works").
+
+    Unlike the profile cache, a cached response is not used as-is; rather, it is
+    revalidated with a conditional request. If ORCID reports that the resource is not
+    modified, the cached response is used, sparing the download, JSON decoding and
+    model validation of the resource.
+
+    Responses are invalidated when the service modifies the record, as the
+    Last-Modified validator has a resolution of only one second.
+    """
+
+    def __init__(self, max_size: int, lifetime: int):
+        self.cache: TimedLRUCache[ValidatedResponse] = TimedLRUCache(
+            max_size=max_size, lifetime=lifetime
+        )
+        self.not_modified = 0
+
+    def get(self, path: str) -> Optional[ValidatedResponse]:
+        return self.cache.get(path)
+
+    def set(self, path: str, response: ValidatedResponse) -> None:
+        self.cache.set(path, response)
+
+    def revalidated(self, path: str, response: ValidatedResponse) -> None:
+        """
+        Records that the cached response was reported as not modified, which renews
+        its lifetime.
+        """
+        self.not_modified += 1
+        self.cache.set(path, response)
+
+    def invalidate(self, orcid_id: str) -> None:
+        """
+        Invalidates all cached responses for the ORCID iD.
+        """
+        for path in [f"{orcid_id}/record", f"{orcid_id}/works"]:
+            self.cache.delete(path)
+
+    def stats(self) -> ResponseCacheStats:
+        return ResponseCacheStats(
+            **self.cache.stats().model_dump(), not_modified=self.not_modified
+        )
+
+
+_response_cache: Optional[ORCIDResponseCache] = None
+
+
+def orcid_response_cache() -> ORCIDResponseCache:
+    """
+    Returns the process-wide ORCID response cache, creating it if necessary.
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ORCIDResponseCache(
+            max_size=config().orcid_response_cache_max_items,
+            lifetime=config().orcid_response_cache_lifetime,
+        )
+    return _response_cache
+
+
+def record_modified(orcid_id: str) -> None:
+    """
+    Invalidates the process-wide caches for an ORCID record which the service has
+    modified.
+    """
+    orcid_profile_cache().invalidate(orcid_id)
+    orcid_response_cache().invalidate(orcid_id)
+
+
 class ORCIDAPIClient:
     base_url: str
     access_token: str
@@ -789,12 +1064,34 @@ class ORCIDAPIClient:
     Note also that this API uses the content type "application/vnd.orcid+json", rather
     than "application/json" as the ORCID OAuth API does, and as one might expect.
 
+    Requests are made with the given session, typically the service's shared session
+    for the ORCID API; if none is provided, each request uses a transient session.
+
+    Profiles are cached in the given profile cache, if any, and profile and works
+    responses are revalidated against those in the given response cache, if any; both
+    are kept consistent with changes to the record made through the client.
+
+    If a works source client id is given, only works whose source is that ORCID client
+    (i.e. KBase) are returned by get_works (see filter_works_by_source).
+
     See: https://oauth.net/2/access-tokens/
     """
 
-    def __init__(self, url: str, access_token: str):
+    def __init__(
+        self,
+        url: str,
+        access_token: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        profile_cache: Optional[ORCIDProfileCache] = None,
+        response_cache: Optional[ORCIDResponseCache] = None,
+        works_source_client_id: Optional[str] = None,
+    ):
         self.base_url: str = url
         self.access_token: str = access_token
+        self.session = session
+        self.profile_cache = profile_cache
+        self.response_cache = response_cache
+        self.works_source_client_id = works_source_client_id
 
     def url(self, path: str) -> str:
         return f"{self.base_url}/{path}"
@@ -808,6 +1105,68 @@ class ORCIDAPIClient:
             ]
         )
 
+    def record_modified(self, orcid_id: str) -> None:
+        if self.profile_cache is not None:
+            self.profile_cache.invalidate(orcid_id)
+        if self.response_cache is not None:
+            self.response_cache.invalidate(orcid_id)
+
+    async def get_validated(
+        self,
+        path: str,
+        model: Type[ResponseModel],
+        prefilter: Optional[Callable[[Any], Any]] = None,
+    ) -> ResponseModel:
+        """
+        Gets the resource at the path, as the given model.
+
+        If a prefilter is given, it is applied to the JSON of the response before the
+        JSON is validated as the model.
+
+        If a response for the path is cached, the request is made conditional upon the
+        resource having been modified since; if it has not, the cached response is
+        returned without being downloaded or parsed again.
+        """
+        cached: Optional[ValidatedResponse] = None
+        cached_value: Optional[ResponseModel] = None
+        header = self.header()
+        if self.response_cache is not None:
+            cached = self.response_cache.get(path)
+            if cached is not None and isinstance(cached.value, model):
+                cached_value = cached.value
+                header.extend(cached.conditional_header())
+
+        async with client_session(self.session) as session:
+            async with session.get(self.url(path), headers=header) as response:
+                if response.status == 304 and cached_value is not None:
+                    if self.response_cache is not None and cached is not None:
+                        self.response_cache.revalidated(path, cached)
+                    log_info(
+                        f"ORCID API {path} not modified",
+                        "not_modified",
+                        {"path": path},
+                    )
+                    return cached_value
+
+                if prefilter is None:
+                    value = await handle_model_response(response, model)
+                else:
+                    # The prefilter works on the parsed JSON, so the response cannot
+                    # be validated directly from the body.
+                    value = model.model_validate(
+                        prefilter(await handle_json_response(response))
+                    )
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if self.response_cache is not None and (
+                    etag is not None or last_modified is not None
+                ):
+                    self.response_cache.set(
+                        path, ValidatedResponse(value, etag, last_modified)
+                    )
+                return value
+
     async def get_profile(self, orcid_id: str) -> ORCIDProfile:
         """
         Get the ORCID profile for the user associated with the orcid_id.
@@ -833,23 +1192,25 @@ class ORCIDAPIClient:
         required" - that is, the profile access requires authorization, it has been
         provided, and it is inadequate.
         """
+        if self.profile_cache is not None:
+            cached_profile = self.profile_cache.get(orcid_id)
+            if cached_profile is not None:
+                return cached_profile
+
         log_info(
             f"Calling ORCID API {orcid_id}/record",
             "before_call",
             {"params": {"orcid_id": orcid_id}},
         )
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.url(f"{orcid_id}/record"), headers=self.header()
-            ) as response:
-                result = await handle_json_response(response)
-                orcid_profile = ORCIDProfile.model_validate(result)
-                log_info(
-                    f"Successfully called ORCID API {orcid_id}/record",
-                    "successful_call",
-                    {"result": {"orcid_profile": orcid_profile}},
-                )
-                return orcid_profile
+        orcid_profile = await self.get_validated(f"{orcid_id}/record", ORCIDProfile)
+        if self.profile_cache is not None:
+            self.profile_cache.set(orcid_id, orcid_profile)
+        log_info(
+            f"Successfully called ORCID API {orcid_id}/record",
+            "successful_call",
+            {"result": {"orcid_profile": orcid_profile}},
+        )
+        return orcid_profile
 
     #
     # Works
@@ -866,16 +1227,24 @@ class ORCIDAPIClient:
             "before_call",
             {"url": url, "params": {"orcid_id": orcid_id}},
         )
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.header()) as response:
-                result = await handle_json_response(response)
-                works = Works.model_validate(result)
-                log_info(
-                    f"Successfully called GET ORCID API {orcid_id}/works",
-                    "successful_call",
-                    {"result": {"works": works}},
-                )
-                return works
+        source_client_id = self.works_source_client_id
+        works = await self.get_validated(
+            f"{orcid_id}/works",
+            Works,
+            (
+                None
+                if source_client_id is None
+                else lambda result: filter_works_by_source(result, source_client_id)
+            ),
+        )
+        if self.profile_cache is not None and works.last_modified_date is not None:
+            self.profile_cache.invalidate(orcid_id, works.last_modified_date.value)
+        log_info(
+            f"Successfully called GET ORCID API {orcid_id}/works",
+            "successful_call",
+            {"result": {"works": works}},
+        )
+        return works
 
     async def get_work(self, orcid_id: str, put_code: int) -> GetWorkResult:
         """
@@ -887,10 +1256,9 @@ class ORCIDAPIClient:
             "before_call",
             {"url": url, "params": {"orcid_id": orcid_id, "put_code": put_code}},
         )
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.session) as session:
             async with session.get(url, headers=self.header()) as response:
-                result = await handle_json_response(response)
-                work = GetWorkResult.model_validate(result)
+                work = await handle_model_response(response, GetWorkResult)
                 log_info(
                     f"Successfully called ORCID API GET {orcid_id}/works/{put_code}",
                     "successful_call",
@@ -898,6 +1266,102 @@ class ORCIDAPIClient:
                 )
                 return work
 
+    async def get_works_detail(
+        self, orcid_id: str, put_codes: List[int]
+    ) -> List[BulkWork]:
+        """
+        Get the work activity records with the given put codes, in the same order.
+
+        The works are read in bulk, in chunks of up to ORCID_BULK_WORKS_LIMIT put codes,
+        of which up to ORCID_BULK_WORKS_CONCURRENCY are read concurrently. A work which
+        could not be read (e.g. because there is no work with its put code) is returned
+        with its error, rather than failing the entire call.
+        """
+        chunks = [
+            put_codes[start : start + ORCID_BULK_WORKS_LIMIT]
+            for start in range(0, len(put_codes), ORCID_BULK_WORKS_LIMIT)
+        ]
+        semaphore = asyncio.Semaphore(ORCID_BULK_WORKS_CONCURRENCY)
+
+        async def get_chunk(chunk: List[int]) -> GetBulkWorksResult:
+            async with semaphore:
+                return await self.get_works_bulk(orcid_id, chunk)
+
+        results = await run_all_concurrently([get_chunk(chunk) for chunk in chunks])
+        return [bulk_work for result in results for bulk_work in result.bulk]
+
+    async def get_works_bulk(
+        self, orcid_id: str, put_codes: List[int]
+    ) -> GetBulkWorksResult:
+        """
+        Get the work activity records with the given put codes, of which there may be
+        no more than ORCID_BULK_WORKS_LIMIT, in a single bulk read.
+        """
+        path = f"{orcid_id}/works/{','.join(str(put_code) for put_code in put_codes)}"
+        url = self.url(path)
+        log_info(
+            f"Calling ORCID API GET {path}",
+            "before_call",
+            {"url": url, "params": {"orcid_id": orcid_id, "put_codes": put_codes}},
+        )
+        async with client_session(self.session) as session:
+            async with session.get(url, headers=self.header()) as response:
+                works = await handle_model_response(
+                    response, GetBulkWorksResult, bulk_item_errors=True
+                )
+                if len(works.bulk) != len(put_codes):
+                    raise UpstreamError(
+                        "The ORCID API returned the wrong number of works",
+                    )
+                log_info(
+                    f"Successfully called ORCID API GET {path}",
+                    "successful_call",
+                    {"result": {"count": len(works.bulk)}},
+                )
+                return works
+
+    async def create_works_bulk(
+        self, orcid_id: str, work_records: List[NewWork]
+    ) -> GetBulkWorksResult:
+        """
+        Create work activity records, of which there may be no more than
+        ORCID_BULK_WORKS_LIMIT, in a single bulk request.
+
+        Each work is created independently; the result holds, in the same order, each
+        created work or the error creating it.
+        """
+        path = f"{orcid_id}/works"
+        url = self.url(path)
+        log_info(
+            f"Calling ORCID API POST {path}",
+            "before_call",
+            {"url": url, "params": {"orcid_id": orcid_id, "count": len(work_records)}},
+        )
+        content = CreateWorkInput(
+            bulk=[NewWorkWrapper(work=work_record) for work_record in work_records]
+        )
+        async with client_session(self.session) as session:
+            async with session.post(
+                url,
+                headers=self.header(),
+                data=json_codec.dumps(content.model_dump(by_alias=True)),
+            ) as response:
+                # Even if the request fails, some works may have been created.
+                self.record_modified(orcid_id)
+                works = await handle_model_response(
+                    response, GetBulkWorksResult, bulk_item_errors=True
+                )
+                if len(works.bulk) != len(work_records):
+                    raise UpstreamError(
+                        "The ORCID API returned the wrong number of works",
+                    )
+                log_info(
+                    f"Successfully called ORCID API POST {path}",
+                    "successful_call",
+                    {"result": {"count": len(works.bulk)}},
+                )
+                return works
+
     async def save_work(
         self, orcid_id: str, put_code: int, work_record: WorkUpdate
     ) -> Work:
@@ -910,14 +1374,14 @@ class ORCIDAPIClient:
             "before_call",
             {"url": url, "params": {"orcid_id": orcid_id, "put_code": put_code}},
         )
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.session) as session:
             async with session.put(
                 url,
                 headers=self.header(),
-                data=json.dumps(work_record.model_dump(by_alias=True)),
+                data=json_codec.dumps(work_record.model_dump(by_alias=True)),
             ) as response:
-                result = await handle_json_response(response)
-                work = Work.model_validate(result)
+                work = await handle_model_response(response, Work)
+                self.record_modified(orcid_id)
                 log_info(
                     f"Successfully called PUT {orcid_id}/works/{put_code}",
                     "successful_call",
@@ -933,4 +1397,11 @@ def orcid_api(token: str) -> ORCIDAPIClient:
     This API provides all interactions we support with ORCID on behalf of a user, other
     than OAuth flow and OAuth/Auth interactions below.
     """
-    return ORCIDAPIClient(url=config().orcid_api_base_url, access_token=token)
+    return ORCIDAPIClient(
+        url=config().orcid_api_base_url,
+        access_token=token,
+        session=http_session(config().orcid_api_base_url),
+        profile_cache=orcid_profile_cache(),
+        response_cache=orcid_response_cache(),
+        works_source_client_id=config().orcid_works_source_client_id,
+    )
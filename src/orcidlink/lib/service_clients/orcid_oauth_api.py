@@ -1,7 +1,7 @@
 import json
 import logging
 from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 from asgi_correlation_id import correlation_id
@@ -9,6 +9,8 @@ from multidict import CIMultiDict
 
 from orcidlink import model
 from orcidlink.jsonrpc.errors import ContentTypeError, JSONDecodeError, UpstreamError
+from orcidlink.lib import json_codec
+from orcidlink.lib.service_clients.http_session import client_session, http_session
 from orcidlink.lib.service_clients.orcid_oauth_api_errors import (
     OAuthAPIError,
     orcid_oauth_api_to_json_rpc_error,
@@ -58,12 +60,16 @@ class ORCIDOAuthAPIClient:
     An OAuth client supporting API operations.
 
     For interactive endpoints which support 3-legged OAuth flow, see "orcid_oauth_interactive.py"
+
+    Requests are made with the given session, typically the service's shared session
+    for the ORCID OAuth API; if none is provided, each request uses a transient session.
     """
 
     url: str
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: Optional[aiohttp.ClientSession] = None):
         self.base_url: str = url
+        self.session = session
 
     def url_path(self, path: str) -> str:
         return f"{self.base_url}/{path}"
@@ -113,8 +119,7 @@ class ORCIDOAuthAPIClient:
             )
             raise ContentTypeError(f"Expected JSON response, got {content_type}")
         try:
-            text_response = await response.text()
-            json_response = json.loads(text_response)
+            json_response = json_codec.loads(await response.read())
         except json.JSONDecodeError as jde:
             log_error(
                 "Error decoding JSON response", "failed_call", {"error": str(jde)}
@@ -146,12 +151,12 @@ class ORCIDOAuthAPIClient:
         response object, extract and return JSON from the body, handling
         any erroneous conditions.
         """
-        text_response = await response.text()
+        body = await response.read()
 
         #
         # The "normal" response
         #
-        if len(text_response) == 0:
+        if len(body) == 0:
             return None
 
         if response.status == 200:
@@ -159,7 +164,7 @@ class ORCIDOAuthAPIClient:
             raise UpstreamError("Expected empty response")
 
         try:
-            json_response = json.loads(text_response)
+            json_response = json_codec.loads(body)
         except json.JSONDecodeError as jde:
             log_error(
                 "Error decoding JSON response", "failed_call", {"error": str(jde)}
@@ -208,7 +213,7 @@ class ORCIDOAuthAPIClient:
 
         # TODO: determine all possible ORCID errors here, or the
         # pattern with which we can return useful info
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.session) as session:
             async with session.post(url, headers=header, data=data) as response:
                 empty_response = await self.handle_empty_response(response)
 
@@ -247,7 +252,7 @@ class ORCIDOAuthAPIClient:
             {"url": url, "data": redacted_dict(data, ["token"])},
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.session) as session:
             async with session.post(url, headers=header, data=data) as response:
                 json_response = await self.handle_json_response(response)
 
@@ -294,7 +299,7 @@ class ORCIDOAuthAPIClient:
             {"url": url, "data": redacted_dict(data, ["code"])},
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.session) as session:
             async with session.post(url, headers=header, data=data) as response:
                 json_response = await self.handle_json_response(response)
                 if isinstance(json_response, OAuthAPIError):
@@ -318,4 +323,7 @@ def orcid_oauth_api() -> ORCIDOAuthAPIClient:
     This not for support of OAuth flow, but rather interactions with ORCID OAuth or
     simply Auth services.
     """
-    return ORCIDOAuthAPIClient(url=config().orcid_oauth_base_url)
+    return ORCIDOAuthAPIClient(
+        url=config().orcid_oauth_base_url,
+        session=http_session(config().orcid_oauth_base_url),
+    )
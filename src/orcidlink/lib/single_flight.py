@@ -0,0 +1,77 @@
+"""
+Coalesces concurrent calls for the same key into a single call.
+
+When several requests need the same upstream result at the same moment (e.g. a UI
+page load which fires many requests with the same KBase token), only the first
+caller actually makes the call; the others wait for, and share, its result. If the
+call raises an exception, it is raised for every waiter.
+
+Note that tasks are bound to the event loop on which they are created, so in-flight
+calls are tracked for each event loop.
+"""
+
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+from pydantic import Field
+
+from orcidlink.lib.type import ServiceBaseModel
+
+V = TypeVar("V")
+
+
+class SingleFlightStats(ServiceBaseModel):
+    in_flight: int = Field(...)
+    calls: int = Field(...)
+    coalesced: int = Field(...)
+
+
+class SingleFlight(Generic[V]):
+    def __init__(self) -> None:
+        self.in_flight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Task[V]]
+        ] = weakref.WeakKeyDictionary()
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[V]]) -> V:
+        """
+        Returns the result of the call in flight for the key, if there is one,
+        otherwise makes the call.
+
+        Cancellation of a waiter does not cancel the shared call.
+        """
+        in_flight = self.in_flight.setdefault(asyncio.get_running_loop(), {})
+
+        task = in_flight.get(key)
+        if task is None:
+            self.calls += 1
+
+            async def make_call() -> V:
+                return await call()
+
+            task = asyncio.create_task(make_call())
+            in_flight[key] = task
+
+            def done(completed: "asyncio.Task[V]") -> None:
+                if in_flight.get(key) is completed:
+                    del in_flight[key]
+                # Waiters receive the exception via their own await; retrieving it
+                # here keeps it from being reported as unretrieved should every
+                # waiter have been cancelled.
+                if not completed.cancelled():
+                    completed.exception()
+
+            task.add_done_callback(done)
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            in_flight=sum(len(in_flight) for in_flight in self.in_flight.values()),
+            calls=self.calls,
+            coalesced=self.coalesced,
+        )
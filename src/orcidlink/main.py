@@ -44,6 +44,7 @@ from orcidlink.jsonrpc.methods.linking_sessions import (
     get_linking_session,
 )
 from orcidlink.jsonrpc.methods.manage import (
+    DeleteExpiredLinkingSessionsResult,
     FindLinksResult,
     GetLinkingSessionsResult,
     GetLinkResult,
@@ -68,24 +69,34 @@ from orcidlink.jsonrpc.methods.profile import get_profile
 from orcidlink.jsonrpc.methods.status import StatusResult, status_method
 from orcidlink.jsonrpc.methods.works import (
     CreateWorkResult,
+    CreateWorksResult,
     GetWorkResult,
+    GetWorksDetailResult,
     SaveWorkResult,
     create_work,
+    create_works,
     delete_work,
     get_work,
     get_works,
+    get_works_detail,
     save_work,
 )
 from orcidlink.jsonrpc.utils import ensure_account2, ensure_authorization2
 from orcidlink.lib import logger
 from orcidlink.lib.responses import (
     AUTHORIZATION_HEADER,
+    NEW_WORKS_PARAM,
     PUT_CODE_PARAM,
+    PUT_CODES_PARAM,
     SESSION_ID_PARAM,
     USERNAME_PARAM,
     UIError,
     ui_error_response,
 )
+from orcidlink.lib.service_clients.http_session import (
+    close_http_sessions,
+    open_http_sessions,
+)
 from orcidlink.lib.type import ServiceBaseModel
 from orcidlink.model import (
     LinkingSessionCompletePublic,
@@ -96,8 +107,15 @@ from orcidlink.model import (
     ORCIDWorkGroup,
     WorkUpdate,
 )
-from orcidlink.routers import linking_sessions
+from orcidlink.routers import linking_sessions, links
 from orcidlink.runtime import config, stats
+from orcidlink.session_reaper import linking_session_reaper
+from orcidlink.storage.storage_model import (
+    close_mongo_client,
+    mongo_client,
+    report_missing_indexes,
+)
+from orcidlink.token_refresh import token_refresh_scheduler
 
 ###############################################################################
 # FastAPI application setup
@@ -187,7 +205,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
     """
     stats()
     logger.log_level(config_to_log_level(config().log_level))
-    yield
+
+    # The shared MongoDB client is created here so that connection problems surface
+    # at startup, and is closed when the service shuts down.
+    mongo_client()
+
+    # The database indexes are created by service initialization; any missing are
+    # reported, as their absence makes queries scan entire collections.
+    await report_missing_indexes()
+
+    # Likewise, a shared HTTP session is opened for each upstream service, so that
+    # connections are pooled and kept alive across requests.
+    open_http_sessions()
+
+    # ORCID tokens approaching retirement are refreshed in the background.
+    token_refresh_scheduler().start()
+
+    # As are expired linking sessions, if so configured.
+    linking_session_reaper().start()
+    try:
+        yield
+    finally:
+        await linking_session_reaper().stop()
+        await token_refresh_scheduler().stop()
+        await close_http_sessions()
+        close_mongo_client()
 
 
 # TODO: add fancy FastAPI configuration https://fastapi.tiangolo.com/tutorial/metadata/
@@ -485,13 +527,13 @@ async def get_linking_sessions_handler(
 @api_v1.method(name="delete-expired-linking-sessions", errors=[*COMMON_ERRORS])  # type: ignore
 async def delete_expired_linking_sessions_handler(
     authorization: str = AUTHORIZATION_HEADER,
-) -> None:
+) -> DeleteExpiredLinkingSessionsResult:
     _, account_info = await ensure_account2(authorization)
 
     if config().manager_role not in account_info.customroles:
         raise NotAuthorizedError("Not authorized for management operations")
 
-    await delete_expired_linking_sessions()
+    return await delete_expired_linking_sessions()
 
 
 @api_v1.method(name="delete-linking-session-initial", errors=[*COMMON_ERRORS])  # type: ignore
@@ -599,6 +641,21 @@ async def get_orcid_work_handler(
     return result
 
 
+@api_v1.method(name="get-orcid-works-detail", errors=[*COMMON_ERRORS])  # type: ignore
+async def get_orcid_works_detail_handler(
+    username: str = USERNAME_PARAM,
+    put_codes: List[int] = PUT_CODES_PARAM,
+    authorization: str = AUTHORIZATION_HEADER,
+) -> GetWorksDetailResult:
+    _, token_info = await ensure_authorization2(authorization)
+
+    if username != token_info.user:
+        raise NotAuthorizedError()
+
+    result = await get_works_detail(username, put_codes)
+    return result
+
+
 @api_v1.method(name="create-orcid-work", errors=[*COMMON_ERRORS])  # type: ignore
 async def create_work_handler(
     username: str = USERNAME_PARAM,
@@ -614,6 +671,21 @@ async def create_work_handler(
     return result
 
 
+@api_v1.method(name="create-orcid-works", errors=[*COMMON_ERRORS])  # type: ignore
+async def create_works_handler(
+    username: str = USERNAME_PARAM,
+    new_works: List[NewWork] = NEW_WORKS_PARAM,
+    authorization: str = AUTHORIZATION_HEADER,
+) -> CreateWorksResult:
+    _, token_info = await ensure_authorization2(authorization)
+
+    if username != token_info.user:
+        raise NotAuthorizedError()
+
+    result = await create_works(username, new_works)
+    return result
+
+
 @api_v1.method(name="update-orcid-work", errors=[*COMMON_ERRORS])  # type: ignore
 async def save_work_handler(
     username: str = USERNAME_PARAM,
@@ -654,6 +726,7 @@ app.add_middleware(CorrelationIdMiddleware)
 # directory.
 ###############################################################################
 app.include_router(linking_sessions.router)
+app.include_router(links.router)
 
 ###############################################################################
 #
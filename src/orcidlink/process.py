@@ -1,12 +1,23 @@
+import asyncio
+import uuid
 from typing import Optional
 
 from orcidlink.jsonrpc.errors import NotAuthorizedError, NotFoundError
 from orcidlink.lib.service_clients.orcid_oauth_api import orcid_oauth_api
+from orcidlink.lib.single_flight import SingleFlight
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.model import LinkingSessionInitial, LinkingSessionStarted, LinkRecord
 from orcidlink.runtime import config
 from orcidlink.storage.storage_model import storage_model
 
+# The interval, in seconds, at which an instance waiting for another instance to
+# refresh a link checks for the refreshed link.
+REFRESH_LEASE_POLL_INTERVAL = 0.25
+
+# Concurrent token refreshes for the same user within the process share a single
+# refresh.
+_token_refreshes: SingleFlight[LinkRecord] = SingleFlight()
+
 
 async def delete_link(username: str) -> None:
     """
@@ -61,22 +72,67 @@ async def link_record_for_orcid_id(orcid_id: str) -> Optional[LinkRecord]:
 
 
 async def refresh_token_for_link(link_record: LinkRecord) -> LinkRecord:
-    now = posix_time_millis()
+    """
+    Refreshes the ORCID tokens for a link, returning the updated link record.
 
-    # refresh the tokens
-    orcid_auth = await orcid_oauth_api().refresh_token(
-        link_record.orcid_auth.refresh_token
+    ORCID revokes the existing tokens when they are refreshed, so concurrent refreshes
+    for the same link would invalidate each other. Within the process, concurrent
+    refreshes for a user share a single refresh; across service instances, only the
+    holder of the refresh lease on the link record refreshes it, and the others return
+    the refreshed link record.
+    """
+    return await _token_refreshes.run(
+        link_record.username, lambda: _refresh_token_for_link(link_record)
     )
 
+
+async def _refresh_token_for_link(link_record: LinkRecord) -> LinkRecord:
+    storage = storage_model()
+    username = link_record.username
+    refresh_token = link_record.orcid_auth.refresh_token
+    lease_id = str(uuid.uuid4())
+
+    while not await storage.acquire_link_refresh_lease(
+        username,
+        refresh_token,
+        lease_id,
+        posix_time_millis() + config().token_refresh_lease_duration * 1000,
+    ):
+        # Either another instance has refreshed the link, or holds the lease and is
+        # refreshing it; in the latter case wait for it to finish, or for the lease to
+        # expire.
+        current_link_record = await storage.get_link_record(username)
+        if current_link_record is None:
+            raise NotFoundError("User does not have an ORCID Link")
+        if current_link_record.orcid_auth.refresh_token != refresh_token:
+            return current_link_record
+        await asyncio.sleep(REFRESH_LEASE_POLL_INTERVAL)
+
+    try:
+        # refresh the tokens
+        orcid_auth = await orcid_oauth_api().refresh_token(refresh_token)
+    except Exception:
+        await storage.release_link_refresh_lease(username, lease_id)
+        raise
+
+    now = posix_time_millis()
     link_record.orcid_auth = orcid_auth
-    link_record.created_at = posix_time_millis()
+    link_record.created_at = now
     link_record.expires_at = (
         link_record.created_at + config().linking_session_lifetime * 1000
     )
     link_record.retires_at = now + config().orcid_authorization_retirement_age * 1000
 
-    # update the link with the new orcid_auth
-    await storage_model().save_link_record(link_record)
+    # update the link with the new orcid_auth; as the old refresh token has been
+    # revoked by the refresh, this is the only valid refresh.
+    if not await storage.save_refreshed_link_record(link_record, refresh_token):
+        # The link was replaced or removed while we held the lease (e.g. the lease
+        # expired and another instance took over the refresh), so the refreshed
+        # tokens were not saved; the stored link is authoritative.
+        current_link_record = await storage.get_link_record(username)
+        if current_link_record is None:
+            raise NotFoundError("User does not have an ORCID Link")
+        return current_link_record
 
     return link_record
 
@@ -111,3 +167,30 @@ async def get_linking_session_started(
         raise NotAuthorizedError("Username does not match linking session")
 
     return session_record
+
+
+async def start_linking_session(
+    session_id: str,
+    username: str,
+    return_link: str | None,
+    skip_prompt: bool,
+    ui_options: str,
+) -> LinkingSessionStarted:
+    """
+    Starts the user's initial linking session.
+
+    The session is started by a single update, which succeeds only for an initial
+    session owned by the user; only if it fails is the session fetched, to determine
+    why.
+    """
+    model = storage_model()
+
+    try:
+        return await model.update_linking_session_to_started(
+            session_id, return_link, skip_prompt, ui_options, username=username
+        )
+    except NotFoundError:
+        # Raises if the session does not exist or is owned by another user.
+        await get_linking_session_initial(session_id, username)
+        # Otherwise, it was started concurrently.
+        raise
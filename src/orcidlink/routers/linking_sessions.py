@@ -18,6 +18,8 @@ from fastapi_jsonrpc import InvalidParams
 from pydantic import Field
 from starlette.responses import RedirectResponse
 
+from orcidlink import process
+
 # from orcidlink.lib import errors, exceptions
 from orcidlink.jsonrpc.errors import (
     AlreadyLinkedError,
@@ -32,7 +34,7 @@ from orcidlink.lib.auth import ensure_authorization_ui
 from orcidlink.lib.responses import AUTH_RESPONSES, STD_RESPONSES, UIError
 from orcidlink.lib.service_clients.orcid_api import AuthorizeParams
 from orcidlink.lib.service_clients.orcid_oauth_api import orcid_oauth_api
-from orcidlink.process import get_linking_session_initial, get_linking_session_started
+from orcidlink.process import get_linking_session_started
 from orcidlink.routers.interactive_route import InteractiveRoute
 from orcidlink.runtime import config
 from orcidlink.storage.storage_model import storage_model
@@ -208,59 +210,15 @@ async def start_linking_session(
         },
     )
 
-    # We don't need the record, but we want to ensure it exists
-    # and is owned by this user.
+    # Starting the session also ensures that it exists, is owned by this user, and
+    # has not already been started.
     try:
-        await get_linking_session_initial(session_id, token_info.user)
+        await process.start_linking_session(
+            session_id, token_info.user, return_link, skip_prompt, ui_options
+        )
     except JSONRPCError as je:
         raise UIError(je.CODE, je.MESSAGE)
 
-    log_info(
-        "Starting start_linking_session",
-        "start",
-        {
-            "params": {
-                "DEBUG": "HERE 2",
-                
-                "session_id": session_id,
-                "token_info": token_info, 
-                "return_link": return_link,
-                "skip_prompt": skip_prompt,
-                "ui_option": ui_options
-            }
-        },
-    )
-
-    # TODO: enhance session record to record the status - so that we can prevent
-    # starting a session twice!
-
-    model = storage_model()
-    try:
-        await model.update_linking_session_to_started(
-            session_id, return_link, skip_prompt, ui_options
-        )
-    except Exception as ex:
-        log_info(
-            "Starting start_linking_session",
-            "start",
-            {
-                "params": {
-                    "DEBUG": "HERE 3",
-                    "error": str(ex)
-                }
-            },
-        )
-
-    log_info(
-        "Starting start_linking_session",
-        "start",
-        {
-            "params": {
-                "DEBUG": "HERE 4"
-            }
-        },
-    )
-
     # The redirect uri is back to ourselves ... this completes the interaction with
     # ORCID, after which we redirect back to whichever url the front end wants to
     # return to.
@@ -460,7 +418,11 @@ async def linking_sessions_continue(
     # Note that this is approximate, as it uses our time, not the
     # ORCID server time.
 
-    await model.update_linking_session_to_finished(session_id, orcid_auth)
+    try:
+        await model.update_linking_session_to_finished(session_id, orcid_auth)
+    except JSONRPCError as je:
+        # The session was completed, or deleted, concurrently.
+        raise UIError(je.CODE, je.MESSAGE)
 
     #
     # Redirect back to the orcidlink interface, with some
@@ -0,0 +1,243 @@
+"""
+Bulk export and import of links, for managers.
+
+The `find-links` method returns links a page at a time, in a single JSON-RPC
+response, so backing up the links collection, or reporting on all of it, means
+assembling every page in memory. These endpoints instead stream links as NDJSON
+(newline-delimited JSON, one link record per line). Both run in constant memory
+however many links there are:
+- export writes each link as it is read from a database cursor
+- import reads the request body a line at a time, and creates links in unordered
+  bulk inserts of `MONGO_CURSOR_BATCH_SIZE` links
+
+Unlike the interactive linking session endpoints, these endpoints are used by
+management tools, not browsers, so errors are returned as JSON, in the form of a
+JSON-RPC error object, rather than as redirects to the user interface.
+"""
+
+from typing import Any, AsyncIterator, List, Optional, Tuple, Type, Union
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import Field, ValidationError
+
+from orcidlink.jsonrpc.errors import (
+    AuthorizationRequiredError,
+    ContentTypeError,
+    JSONDecodeError,
+    JSONRPCError,
+    NotAuthorizedError,
+    UpstreamError,
+)
+from orcidlink.jsonrpc.utils import ensure_account2
+from orcidlink.lib.responses import (
+    AUTH_RESPONSES,
+    AUTHORIZATION_HEADER,
+    STD_RESPONSES,
+    ResponseMapping,
+)
+from orcidlink.lib.type import ServiceBaseModel
+from orcidlink.model import LinkRecord, LinkRecordPublic
+from orcidlink.runtime import config
+from orcidlink.storage.storage_model import storage_model
+
+router = APIRouter(prefix="/links")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+FULL_QUERY = Query(
+    default=False,
+    description=(
+        "Whether to export full link records, including ORCID tokens, as required to "
+        "restore them by import, rather than the public view of each link"
+    ),
+)
+
+
+MANAGER_RESPONSES: ResponseMapping = {
+    403: {"description": "KBase account is not that of a manager"},
+    502: {"description": "KBase auth service failed in checking the auth token"},
+}
+
+
+class ImportLinkError(ServiceBaseModel):
+    # The line of the request body, counting from 1.
+    line: int = Field(...)
+    username: Optional[str] = Field(default=None)
+    message: str = Field(...)
+
+
+class ImportLinksResult(ServiceBaseModel):
+    created: int = Field(...)
+    errors: List[ImportLinkError] = Field(...)
+
+
+def error_message(error: JSONRPCError) -> str:
+    # Errors are raised with a message describing the specific error as their data.
+    data: Any = error.data
+    return data if isinstance(data, str) else error.MESSAGE
+
+
+def error_status_code(error: JSONRPCError) -> int:
+    """
+    Returns the HTTP status code for an error in authorizing a request: 401 if the
+    request is not authorized, or 502 if the auth service failed or responded with
+    something other than the expected JSON.
+    """
+    if isinstance(error, (AuthorizationRequiredError, NotAuthorizedError)):
+        return 401
+    if isinstance(error, (UpstreamError, ContentTypeError, JSONDecodeError)):
+        return 502
+    return 500
+
+
+def error_response(error: JSONRPCError, status_code: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"code": error.CODE, "message": error_message(error)},
+    )
+
+
+async def ensure_manager(authorization: Optional[str]) -> Optional[JSONResponse]:
+    """
+    Ensures that the KBase auth token is that of a manager, returning the error
+    response if it is not.
+    """
+    try:
+        _, account_info = await ensure_account2(authorization)
+    except JSONRPCError as error:
+        return error_response(error, error_status_code(error))
+
+    if config().manager_role not in account_info.customroles:
+        return error_response(
+            NotAuthorizedError("Not authorized for management operations"), 403
+        )
+
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Iterates over the lines of a streamed body, holding only the current line in
+    memory.
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    response_model=None,
+    responses={
+        200: {
+            "description": "The links, as NDJSON",
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+        **AUTH_RESPONSES,
+        **MANAGER_RESPONSES,
+        **STD_RESPONSES,
+    },
+    tags=["link"],
+)
+async def export_links(
+    full: bool = FULL_QUERY,
+    authorization: Optional[str] = AUTHORIZATION_HEADER,
+) -> Union[StreamingResponse, JSONResponse]:
+    """
+    Export Links
+
+    Streams all links, ordered by username, as NDJSON.
+    """
+    error = await ensure_manager(authorization)
+    if error is not None:
+        return error
+
+    model: Union[Type[LinkRecord], Type[LinkRecordPublic]] = (
+        LinkRecord if full else LinkRecordPublic
+    )
+
+    async def ndjson() -> AsyncIterator[str]:
+        async for link in storage_model().iter_link_records_as(
+            model, sort=[("username", 1)]
+        ):
+            yield link.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post(
+    "/import",
+    response_model=ImportLinksResult,
+    responses={**AUTH_RESPONSES, **MANAGER_RESPONSES, **STD_RESPONSES},
+    tags=["link"],
+)
+async def import_links(
+    request: Request,
+    authorization: Optional[str] = AUTHORIZATION_HEADER,
+) -> Any:
+    """
+    Import Links
+
+    Creates links from full link records, one per line of an NDJSON request body, as
+    produced by a full export.
+
+    Each link is created independently; a link which is invalid, or whose user or
+    ORCID account is already linked, is reported by the line on which it appears,
+    and does not prevent the creation of the others.
+    """
+    error = await ensure_manager(authorization)
+    if error is not None:
+        return error
+
+    storage = storage_model()
+    created = 0
+    errors: List[ImportLinkError] = []
+    # The line of each link awaiting creation.
+    batch: List[Tuple[int, LinkRecord]] = []
+
+    async def create_batch() -> None:
+        nonlocal created, batch
+        failures = await storage.create_link_records([link for _, link in batch])
+        for index, message in failures:
+            line, link = batch[index]
+            errors.append(
+                ImportLinkError(line=line, username=link.username, message=message)
+            )
+        created += len(batch) - len(failures)
+        batch = []
+
+    line_number = 0
+    async for line in iter_lines(request.stream()):
+        line_number += 1
+        if line.strip() == b"":
+            continue
+        try:
+            link = LinkRecord.model_validate_json(line)
+        except ValidationError as ve:
+            errors.append(
+                ImportLinkError(line=line_number, message=validation_message(ve))
+            )
+            continue
+        batch.append((line_number, link))
+        if len(batch) == config().mongo_cursor_batch_size:
+            await create_batch()
+    if len(batch) > 0:
+        await create_batch()
+
+    # Errors in creating links are only known once their batch is created.
+    errors.sort(key=lambda error: error.line)
+    return ImportLinksResult(created=created, errors=errors)
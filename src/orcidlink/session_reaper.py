@@ -0,0 +1,223 @@
+"""
+Background removal of expired linking sessions.
+
+Expired linking sessions are otherwise only removed when a manager calls the
+`delete-expired-linking-sessions` method, so the linking session collections grow
+in the meantime, slowing every scan of them.
+
+When the reaper is enabled, by a non-zero interval, linking sessions are stored with
+the date at which they expire, and MongoDB deletes expired initial and started
+sessions itself, by TTL indexes (see `storage/indexes.py`), which are created by
+service initialization. Completed sessions, however, hold ORCID tokens which must be
+revoked before the session is deleted. So at each interval (with jitter, so that
+multiple service instances do not scan in lockstep) the reaper revokes the tokens
+for, and deletes, a batch of expired completed sessions, longest expired first,
+with bounded concurrency. The number of such sessions remaining is recorded as the
+reaper backlog.
+
+Revocation, which is shared with the `delete-expired-linking-sessions` method, runs
+with bounded concurrency over the shared ORCID OAuth connection pool. A failed
+revocation is retried with exponential backoff; a session whose tokens still cannot
+be revoked is retained, to be retried later. The sessions which were revoked are
+deleted together.
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+from pydantic import Field
+
+from orcidlink.lib.periodic_task import PeriodicTask
+from orcidlink.lib.service_clients.orcid_oauth_api import orcid_oauth_api
+from orcidlink.lib.type import ServiceBaseModel
+from orcidlink.lib.utils import posix_time_millis
+from orcidlink.model import LinkingSessionComplete
+from orcidlink.runtime import config
+from orcidlink.storage.storage_model import storage_model
+from orcidlink.storage.storage_model_mongo import StorageModelMongo
+
+# The delay, in seconds, before the first retry of a failed revocation; each
+# subsequent retry waits twice as long as the last.
+RETRY_DELAY = 1.0
+
+
+def log_info(message: str, event: str, extra: dict[str, Any]) -> None:
+    logger = logging.getLogger("session_reaper")
+    logger.info(message, extra={"type": "session_reaper", "event": event, **extra})
+
+
+def log_error(message: str, event: str, extra: dict[str, Any]) -> None:
+    logger = logging.getLogger("session_reaper")
+    logger.error(message, extra={"type": "session_reaper", "event": event, **extra})
+
+
+class RevocationFailure(ServiceBaseModel):
+    session_id: str = Field(...)
+    error: str = Field(...)
+
+
+class RevocationResult(ServiceBaseModel):
+    # The number of sessions whose tokens were revoked, and which were deleted.
+    revoked: int = Field(...)
+    failures: List[RevocationFailure] = Field(...)
+
+
+async def revoke_access_token(access_token: str, retries: int) -> None:
+    """
+    Revokes the ORCID access token, retrying failures with exponential backoff.
+    """
+    for attempt in range(retries + 1):
+        try:
+            await orcid_oauth_api().revoke_access_token(access_token)
+            return
+        except Exception:
+            if attempt == retries:
+                raise
+        await asyncio.sleep(RETRY_DELAY * 2**attempt)
+
+
+async def revoke_linking_sessions(
+    storage: StorageModelMongo,
+    sessions: List[LinkingSessionComplete],
+    now: int,
+    concurrency: int,
+    retries: int,
+) -> RevocationResult:
+    """
+    Revokes the ORCID tokens of the completed linking sessions, which had expired as
+    of the given time, with bounded concurrency, and deletes those which were
+    revoked.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def revoke(session: LinkingSessionComplete) -> Optional[RevocationFailure]:
+        async with semaphore:
+            try:
+                await revoke_access_token(session.orcid_auth.access_token, retries)
+            except Exception as ex:
+                log_error(
+                    "Error revoking linking session",
+                    "revoke_failed",
+                    {"session_id": session.session_id, "error": str(ex)},
+                )
+                return RevocationFailure(session_id=session.session_id, error=str(ex))
+            return None
+
+    results = await asyncio.gather(*[revoke(session) for session in sessions])
+
+    revoked = [
+        session.session_id
+        for session, failure in zip(sessions, results)
+        if failure is None
+    ]
+    await storage.delete_expired_completed_sessions(revoked, now)
+
+    return RevocationResult(
+        revoked=len(revoked),
+        failures=[failure for failure in results if failure is not None],
+    )
+
+
+class LinkingSessionReaperStats(ServiceBaseModel):
+    running: bool = Field(...)
+    backlog: int = Field(...)
+    scans: int = Field(...)
+    last_scan_at: Optional[int] = Field(default=None)
+    reaped: int = Field(...)
+    failed: int = Field(...)
+
+
+class LinkingSessionReaper(PeriodicTask):
+    def __init__(self, interval: int, batch_size: int, concurrency: int, retries: int):
+        """
+        Constructor
+
+        The interval is in seconds.
+        """
+        super().__init__(interval)
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backlog = 0
+        self.scans = 0
+        self.last_scan_at: Optional[int] = None
+        self.reaped = 0
+        self.failed = 0
+
+    async def run_once(self) -> None:
+        await self.reap_expired_sessions()
+
+    def report_error(self, error: Exception) -> None:
+        log_error(
+            "Error reaping expired linking sessions",
+            "scan_failed",
+            {"error": str(error)},
+        )
+
+    async def reap_expired_sessions(self) -> int:
+        """
+        Revokes the ORCID tokens for, and deletes, a batch of expired completed
+        linking sessions, returning the number successfully reaped.
+        """
+        storage = storage_model()
+        now = posix_time_millis()
+
+        self.scans += 1
+        self.last_scan_at = now
+        self.backlog = await storage.count_expired_completed_sessions(now)
+        if self.backlog == 0:
+            return 0
+
+        expired_sessions = [
+            session
+            async for session in storage.iter_expired_completed_sessions(
+                now, limit=self.batch_size
+            )
+        ]
+
+        result = await revoke_linking_sessions(
+            storage, expired_sessions, now, self.concurrency, self.retries
+        )
+        self.reaped += result.revoked
+        self.failed += len(result.failures)
+        self.backlog -= result.revoked
+
+        log_info(
+            "Reaped expired linking sessions",
+            "scan_completed",
+            {
+                "reaped": result.revoked,
+                "failed": len(result.failures),
+                "backlog": self.backlog,
+            },
+        )
+        return result.revoked
+
+    def stats(self) -> LinkingSessionReaperStats:
+        return LinkingSessionReaperStats(
+            running=self.running(),
+            backlog=self.backlog,
+            scans=self.scans,
+            last_scan_at=self.last_scan_at,
+            reaped=self.reaped,
+            failed=self.failed,
+        )
+
+
+_reaper: Optional[LinkingSessionReaper] = None
+
+
+def linking_session_reaper() -> LinkingSessionReaper:
+    """
+    Returns the process-wide linking session reaper, creating it if necessary.
+    """
+    global _reaper
+    if _reaper is None:
+        _reaper = LinkingSessionReaper(
+            interval=config().linking_session_reaper_interval,
+            batch_size=config().linking_session_reaper_batch_size,
+            concurrency=config().linking_session_revocation_concurrency,
+            retries=config().linking_session_revocation_retries,
+        )
+    return _reaper
@@ -0,0 +1,83 @@
+"""
+Decodes documents read from the database as models.
+
+The documents stored by the storage model were written from validated models, and the
+linking session collection is further guarded by a schema validator (see `schema/`).
+Fully validating each document as it is read back repeats that work for every
+document, which dominates the cost of methods which list links or linking sessions.
+
+So, unless read validation is enabled (by `STORAGE_VALIDATE_READS`, as it is for the
+tests, so that any divergence between the models and the stored documents is
+caught), documents are trusted, and models are constructed from them directly,
+without validation.
+
+A model constructed from a document takes only the fields of that model. A public
+model, such as `LinkRecordPublic`, is therefore built directly from the stored
+document, rather than by validating the full model, dumping it, and validating the
+dump as the public model.
+"""
+
+import types
+import typing
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# For each model, the name of each of its fields, and the model of the field's value
+# if it is itself a model.
+_field_plans: Dict[Type[BaseModel], List[Tuple[str, Optional[Type[BaseModel]]]]] = {}
+
+
+def field_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    Returns the model for a field annotated as a model, or an optional model.
+    """
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        for arg in typing.get_args(annotation):
+            model = field_model(arg)
+            if model is not None:
+                return model
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def field_plan(model: Type[BaseModel]) -> List[Tuple[str, Optional[Type[BaseModel]]]]:
+    plan = _field_plans.get(model)
+    if plan is None:
+        plan = [
+            (name, field_model(field.annotation))
+            for name, field in model.model_fields.items()
+        ]
+        _field_plans[model] = plan
+    return plan
+
+
+def construct_model(model: Type[Model], doc: Mapping[str, Any]) -> Model:
+    """
+    Constructs the model, and any models nested within it, from the document without
+    validation.
+
+    Fields absent from the model, such as the document's `_id`, are dropped.
+    """
+    values: Dict[str, Any] = {}
+    for name, nested_model in field_plan(model):
+        if name not in doc:
+            continue
+        value = doc[name]
+        if nested_model is not None and isinstance(value, dict):
+            value = construct_model(nested_model, value)  # type: ignore
+        values[name] = value
+    return model.model_construct(**values)
+
+
+def decode_model(model: Type[Model], doc: Mapping[str, Any], validate: bool) -> Model:
+    """
+    Decodes the document as the model, validating it only if required.
+    """
+    if validate:
+        return model.model_validate(doc)
+    return construct_model(model, doc)
@@ -0,0 +1,99 @@
+"""
+The indexes required by the storage model's queries.
+
+The indexes are created by service initialization (see
+`boot/service_initialization.py`), and their presence is verified when the service
+starts (see `storage_model.report_missing_indexes`), so that a database lacking
+them is reported rather than silently scanning entire collections.
+
+Note that the unique index on the ORCID id of a link also enforces, atomically, the
+rule that an ORCID account may be linked to only one KBase account.
+
+When linking sessions expire by TTL (see `session_reaper.py`), initial and started
+linking sessions are deleted by MongoDB once past the date held in their
+`expires_at_date` field. Completed linking sessions hold ORCID tokens, which must be
+revoked before the session is deleted, so the field is removed when a session is
+completed, leaving it to the reaper.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from pydantic import Field
+
+from orcidlink.lib.type import ServiceBaseModel
+
+
+class IndexSpec(ServiceBaseModel):
+    collection: str = Field(...)
+    field: str = Field(...)
+    unique: bool = Field(default=False)
+    # If set, a TTL index: documents are deleted this many seconds after the date
+    # held in the field.
+    expire_after_seconds: Optional[int] = Field(default=None)
+
+
+REQUIRED_INDEXES: List[IndexSpec] = [
+    # Links are looked up by owner, and by ORCID id when linking and by managers.
+    IndexSpec(collection="links", field="username", unique=True),
+    IndexSpec(collection="links", field="orcid_auth.orcid", unique=True),
+    # Link stats are counted by creation time.
+    IndexSpec(collection="links", field="created_at"),
+    # Linking sessions are looked up by session id, and are counted and deleted by
+    # expiration time.
+    IndexSpec(collection="linking_sessions", field="session_id", unique=True),
+    IndexSpec(collection="linking_sessions", field="expires_at"),
+]
+
+TTL_INDEXES: List[IndexSpec] = [
+    IndexSpec(
+        collection="linking_sessions", field="expires_at_date", expire_after_seconds=0
+    ),
+]
+
+
+def required_indexes(session_ttl: bool) -> List[IndexSpec]:
+    """
+    Returns the indexes required by the storage model, including the TTL indexes
+    if linking sessions expire by TTL.
+    """
+    if session_ttl:
+        return REQUIRED_INDEXES + TTL_INDEXES
+    return REQUIRED_INDEXES
+
+
+def has_index(index_information: Mapping[str, Dict[str, Any]], spec: IndexSpec) -> bool:
+    """
+    Determines whether the indexes of a collection, as given by pymongo's
+    `index_information`, include the required index.
+
+    An ascending or descending index on the field will do, as will a unique index
+    when a non-unique one is required.
+    """
+    for index in index_information.values():
+        key = [(field, abs(direction)) for field, direction in index["key"]]
+        if key != [(spec.field, 1)]:
+            continue
+        if spec.unique and not index.get("unique", False):
+            continue
+        if (
+            spec.expire_after_seconds is not None
+            and index.get("expireAfterSeconds") != spec.expire_after_seconds
+        ):
+            continue
+        return True
+    return False
+
+
+def missing_indexes(
+    index_information: Mapping[str, Mapping[str, Dict[str, Any]]],
+    required: List[IndexSpec] = REQUIRED_INDEXES,
+) -> List[IndexSpec]:
+    """
+    Returns the required indexes absent from the given indexes, which are those
+    returned by pymongo's `index_information` for each collection.
+    """
+    return [
+        spec
+        for spec in required
+        if not has_index(index_information.get(spec.collection, {}), spec)
+    ]
@@ -0,0 +1,143 @@
+"""
+Connection pool monitoring for the shared MongoDB client.
+
+The service uses a single, process-wide Motor client (see `storage_model.py`), whose
+underlying pymongo connection pool is sized by configuration. This module provides
+a pymongo connection pool listener which tallies pool activity, so that the pool
+sizing may be evaluated against actual usage.
+
+Note that pool events are published by pymongo from its own threads, so all
+updates are guarded by a lock.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque
+
+from pydantic import Field
+from pymongo import monitoring
+
+from orcidlink.lib.type import ServiceBaseModel
+
+# The window, in seconds, over which the connection creation rate is calculated.
+CREATION_RATE_WINDOW = 60
+
+
+class MongoPoolStats(ServiceBaseModel):
+    checked_out: int = Field(...)
+    checkouts: int = Field(...)
+    checkout_failures: int = Field(...)
+    wait_time_total: float = Field(...)
+    wait_time_max: float = Field(...)
+    wait_time_average: float = Field(...)
+    connections_created: int = Field(...)
+    connections_closed: int = Field(...)
+    creations_per_second: float = Field(...)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Collects connection pool metrics for a MongoDB client.
+
+    Wait times are in milliseconds, and reflect the duration of a connection
+    checkout as reported by pymongo, which includes any time spent waiting for
+    a connection to become available in the pool as well as connection creation.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.creation_times: Deque[float] = deque()
+
+    def record_wait(self, duration: float) -> None:
+        wait_time = duration * 1000
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def prune_creation_times(self, now: float) -> None:
+        while (
+            len(self.creation_times) > 0
+            and self.creation_times[0] < now - CREATION_RATE_WINDOW
+        ):
+            self.creation_times.popleft()
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        now = time.monotonic()
+        with self.lock:
+            self.connections_created += 1
+            self.creation_times.append(now)
+            self.prune_creation_times(now)
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self.lock:
+            self.connections_closed += 1
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        with self.lock:
+            self.checked_out += 1
+            self.checkouts += 1
+            # The wait is not reported by all pymongo versions.
+            if event.duration is not None:
+                self.record_wait(event.duration)
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        with self.lock:
+            self.checkout_failures += 1
+            if event.duration is not None:
+                self.record_wait(event.duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self.lock:
+            self.checked_out -= 1
+
+    # The remaining pool events are not interesting for metrics, but must be
+    # implemented by a ConnectionPoolListener.
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+    def stats(self) -> MongoPoolStats:
+        with self.lock:
+            self.prune_creation_times(time.monotonic())
+            attempts = self.checkouts + self.checkout_failures
+            return MongoPoolStats(
+                checked_out=self.checked_out,
+                checkouts=self.checkouts,
+                checkout_failures=self.checkout_failures,
+                wait_time_total=self.wait_time_total,
+                wait_time_max=self.wait_time_max,
+                wait_time_average=(
+                    self.wait_time_total / attempts if attempts > 0 else 0.0
+                ),
+                connections_created=self.connections_created,
+                connections_closed=self.connections_closed,
+                creations_per_second=len(self.creation_times) / CREATION_RATE_WINDOW,
+            )
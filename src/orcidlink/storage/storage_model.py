@@ -1,12 +1,127 @@
+"""
+Provides the storage model, backed by a single, shared MongoDB client.
+
+Creating a MongoDB client is expensive - each one establishes its own connection
+pool, authenticates each connection, and starts server monitoring threads. So rather
+than create a client for each usage of the storage model, a process-wide client is
+created on first use (or at service startup, see the `lifespan` in `main.py`) and
+closed when the service shuts down.
+
+Note that a Motor client is bound to the event loop on which it is first used. In the
+service there is a single event loop, and therefore a single client, but in other
+contexts (such as tests, which may run the app on a separate loop) a client is
+maintained for each event loop.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import List
+
+import motor.motor_asyncio
+
 from orcidlink.runtime import config
+from orcidlink.storage.indexes import IndexSpec
+from orcidlink.storage.mongo_pool import MongoPoolMetrics, MongoPoolStats
 from orcidlink.storage.storage_model_mongo import StorageModelMongo
 
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, motor.motor_asyncio.AsyncIOMotorClient
+] = weakref.WeakKeyDictionary()
+_pool_metrics = MongoPoolMetrics()
+
+
+def make_mongo_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    return motor.motor_asyncio.AsyncIOMotorClient(
+        host=config().mongo_host,
+        port=config().mongo_port,
+        username=config().mongo_username,
+        password=config().mongo_password,
+        authSource=config().mongo_database,
+        retrywrites=False,
+        minPoolSize=config().mongo_min_pool_size,
+        maxPoolSize=config().mongo_max_pool_size,
+        maxIdleTimeMS=config().mongo_max_idle_time * 1000,
+        waitQueueTimeoutMS=config().mongo_wait_queue_timeout * 1000,
+        event_listeners=[_pool_metrics],
+    )
+
+
+def mongo_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """
+    Returns the shared MongoDB client, creating it if necessary.
+
+    Outside of a running event loop a new client is returned; it will be bound to
+    the loop on which it is first used.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return make_mongo_client()
+
+    client = _clients.get(loop)
+    if client is None:
+        client = make_mongo_client()
+        _clients[loop] = client
+    return client
+
+
+def close_mongo_client() -> None:
+    """
+    Closes the shared MongoDB client for the running event loop, if it has been
+    created.
+
+    A subsequent usage of the storage model will create a new client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    client = _clients.pop(loop, None)
+    if client is not None:
+        client.close()
+
+
+def mongo_pool_stats() -> MongoPoolStats:
+    return _pool_metrics.stats()
+
 
 def storage_model() -> StorageModelMongo:
     return StorageModelMongo(
-        config().mongo_host,
-        config().mongo_port,
+        mongo_client(),
         config().mongo_database,
-        config().mongo_username,
-        config().mongo_password,
+        batch_size=config().mongo_cursor_batch_size,
+        session_ttl=config().linking_session_reaper_interval > 0,
+        validate_reads=config().storage_validate_reads != 0,
     )
+
+
+async def report_missing_indexes() -> List[IndexSpec]:
+    """
+    Logs, and returns, any indexes required by the storage model which are absent
+    from the database.
+
+    Missing indexes do not prevent the service from working, but make its queries
+    scan entire collections; they are created by service initialization.
+    """
+    logger = logging.getLogger("storage")
+    try:
+        missing = await storage_model().missing_indexes()
+    except Exception as ex:
+        logger.error(
+            "Error checking database indexes",
+            extra={"type": "storage", "event": "index_check_failed", "error": str(ex)},
+        )
+        return []
+
+    if len(missing) > 0:
+        logger.warning(
+            "Database indexes missing",
+            extra={
+                "type": "storage",
+                "event": "indexes_missing",
+                "indexes": [spec.model_dump() for spec in missing],
+            },
+        )
+    return missing
@@ -1,8 +1,25 @@
-from typing import Any, List, Optional
+import asyncio
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import motor.motor_asyncio
+import pymongo
+import pymongo.errors
+from bson import ObjectId
+from pydantic import Field
 
-from orcidlink.jsonrpc.errors import NotFoundError
+from orcidlink.jsonrpc.errors import AlreadyLinkedError, NotFoundError
 
 # from orcidlink.lib import errors, exceptions
 from orcidlink.lib.type import ServiceBaseModel
@@ -12,8 +29,14 @@ from orcidlink.model import (
     LinkingSessionInitial,
     LinkingSessionStarted,
     LinkRecord,
+    LinkRecordPublicNonOwner,
     ORCIDAuth,
 )
+from orcidlink.storage.decode import decode_model
+from orcidlink.storage.indexes import IndexSpec, missing_indexes, required_indexes
+
+# The code of the MongoDB write error for a violation of a unique index.
+DUPLICATE_KEY_ERROR_CODE = 11000
 
 
 class LinkStats(ServiceBaseModel):
@@ -41,19 +64,135 @@ class ExpiredSessions(ServiceBaseModel):
     completed_sessions: List[LinkingSessionComplete]
 
 
+class KeysetPosition(ServiceBaseModel):
+    """
+    The position of a document in a sorted query: the values of the sort fields, and
+    the _id, of the document.
+    """
+
+    values: List[Any] = Field(...)
+    id: str = Field(...)
+
+
+Model = TypeVar("Model", bound=ServiceBaseModel)
+
+
+class LinkRecordsPage(ServiceBaseModel, Generic[Model]):
+    # The link records, as a full or public model.
+    links: List[Model] = Field(...)
+    # The position of the last link, if there may be more links following it.
+    next: Optional[KeysetPosition] = Field(default=None)
+
+
+def document_value(doc: Dict[str, Any], field_name: str) -> Any:
+    """
+    Returns the value of a possibly dotted field name (e.g. "orcid_auth.orcid") in the
+    document, or None if it is absent.
+    """
+    value: Any = doc
+    for key in field_name.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)  # type: ignore
+    return value
+
+
+def keyset_filter(sort: List[Tuple[str, int]], values: List[Any]) -> Dict[str, Any]:
+    """
+    Returns a filter matching the documents which follow the position given by the
+    values of the sort fields, for a sort which ends with a unique field.
+
+    E.g. for a sort by a, then b, the filter matches documents with a greater a, or
+    with an equal a and greater b. Each clause is an equality on a prefix of the sort
+    fields and a range on the next, which an index on the sort fields serves
+    directly, rather than scanning past all of the preceding documents as skipping
+    does.
+    """
+    clauses: List[Dict[str, Any]] = []
+    for index, (field_name, direction) in enumerate(sort):
+        clause: Dict[str, Any] = {
+            prefix_field_name: value
+            for (prefix_field_name, _), value in zip(sort[:index], values[:index])
+        }
+        operator = "$lt" if direction == pymongo.DESCENDING else "$gt"
+        clause[field_name] = {operator: values[index]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
 class StorageModelMongo:
     def __init__(
-        self, host: str, port: int, database: str, username: str, password: str
+        self,
+        client: motor.motor_asyncio.AsyncIOMotorClient,
+        database: str,
+        batch_size: int = 100,
+        session_ttl: bool = False,
+        validate_reads: bool = True,
     ):
-        self.client = motor.motor_asyncio.AsyncIOMotorClient(
-            host=host,
-            port=port,
-            username=username,
-            password=password,
-            authSource=database,
-            retrywrites=False,
-        )
+        """
+        Note that the client is shared, and owned by the caller; the storage model
+        never closes it.
+
+        Query results are fetched from the database in batches of the given size.
+
+        If session_ttl is set, linking sessions are stored with the date at which they
+        expire, so that initial and started sessions may be expired by TTL indexes
+        (see `indexes.py`).
+
+        Unless validate_reads is set, documents read from the database are trusted,
+        and decoded as models without validation (see `decode.py`).
+        """
+        self.client = client
         self.db = self.client[database]
+        self.batch_size = batch_size
+        self.session_ttl = session_ttl
+        self.validate_reads = validate_reads
+
+    def decode(self, model: Type[Model], doc: Mapping[str, Any]) -> Model:
+        return decode_model(model, doc, self.validate_reads)
+
+    async def missing_indexes(self) -> List[IndexSpec]:
+        """
+        Returns the indexes required by the storage model which are absent from the
+        database.
+        """
+        required = required_indexes(self.session_ttl)
+        collections = {spec.collection for spec in required}
+        index_information = {
+            collection: await self.db[collection].index_information()
+            for collection in collections
+        }
+        return missing_indexes(index_information, required)
+
+    async def iter_documents(
+        self,
+        collection: motor.motor_asyncio.AsyncIOMotorCollection,
+        model: Type[Model],
+        filter: Optional[Any] = None,
+        sort: Optional[Any] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Model]:
+        """
+        Iterates over the documents in the collection which match the filter, each
+        decoded as the given model.
+
+        Documents are fetched in batches as the iteration proceeds, and decoded one at
+        a time, so that only a single batch is held in memory.
+        """
+        cursor = collection.find(
+            filter=filter if filter is not None else {},
+            sort=sort if sort is not None else [],
+            skip=offset or 0,
+            limit=limit or 0,
+            batch_size=self.batch_size,
+        )
+        try:
+            async for doc in cursor:
+                yield self.decode(model, doc)
+        finally:
+            # Releases the server-side cursor if the iteration is abandoned early.
+            await cursor.close()
 
     ##
     # Operations on the user record.
@@ -66,7 +205,75 @@ class StorageModelMongo:
         if record is None:
             return None
 
-        return LinkRecord.model_validate(record)
+        return self.decode(LinkRecord, record)
+
+    async def link_record_exists(self, username: str) -> bool:
+        """
+        Determines whether the user has a link record.
+
+        Only the username is projected, so the query may be answered from the index
+        on username alone.
+        """
+        record = await self.db.links.find_one(
+            {"username": username}, projection={"_id": 0, "username": 1}
+        )
+        return record is not None
+
+    async def get_link_record_public_non_owner(
+        self, username: str
+    ) -> Optional[LinkRecordPublicNonOwner]:
+        """
+        Gets the public view of a link record, for users other than its owner.
+
+        Only the fields of the public view are fetched from the database.
+        """
+        record = await self.db.links.find_one(
+            {"username": username},
+            projection={
+                "_id": 0,
+                "username": 1,
+                "orcid_auth.orcid": 1,
+                "orcid_auth.name": 1,
+            },
+        )
+
+        if record is None:
+            return None
+
+        return self.decode(LinkRecordPublicNonOwner, record)
+
+    def iter_link_records(
+        self,
+        filter: Optional[Any] = None,
+        sort: Optional[Any] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[LinkRecord]:
+        """
+        Iterates over link records, optionally filtered by a search condition, sorted,
+        and with a given range by offset and limit.
+
+        This feature is designed for usage by management tools.
+        """
+        return self.iter_link_records_as(
+            LinkRecord, filter, sort=sort, offset=offset, limit=limit
+        )
+
+    def iter_link_records_as(
+        self,
+        model: Type[Model],
+        filter: Optional[Any] = None,
+        sort: Optional[Any] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Model]:
+        """
+        As iter_link_records, but with each link record decoded as the given model,
+        such as a public view of the link record.
+        """
+        return self.iter_documents(
+            self.db.links, model, filter, sort=sort, offset=offset, limit=limit
+        )
 
     async def get_link_records(
         self,
@@ -76,27 +283,70 @@ class StorageModelMongo:
         limit: Optional[int] = None,
     ) -> List[LinkRecord]:
         """
-        Gets link records, optionally filtered by a search condition, sorted, and
-        with a given range by offset and limit.
+        As iter_link_records, but returns the link records as a list.
+        """
+        return [
+            link
+            async for link in self.iter_link_records(
+                filter=filter, sort=sort, offset=offset, limit=limit
+            )
+        ]
 
-        Currently none of the options are implemented, and it returns all link records.
+    async def get_link_records_page(
+        self,
+        filter: Optional[Dict[str, Any]],
+        sort: List[Tuple[str, int]],
+        limit: int,
+        after: Optional[KeysetPosition] = None,
+    ) -> LinkRecordsPage[LinkRecord]:
+        return await self.get_link_records_page_as(
+            LinkRecord, filter, sort, limit, after=after
+        )
 
-        This feature is designed for usage by management tools.
+    async def get_link_records_page_as(
+        self,
+        model: Type[Model],
+        filter: Optional[Dict[str, Any]],
+        sort: List[Tuple[str, int]],
+        limit: int,
+        after: Optional[KeysetPosition] = None,
+    ) -> LinkRecordsPage[Model]:
         """
-        cursor = self.db.links.find(
-            filter=filter if filter is not None else {},
-            sort=sort if sort is not None else [],
-            skip=offset or 0,
-            limit=limit or 0,
-        )
+        Gets a page of link records, optionally filtered by a search condition,
+        sorted, and following the given position.
 
-        links: List[LinkRecord] = []
+        The sort is completed by _id, so that each link has a distinct position; the
+        position of the last link on the page, if there are more, is returned for use
+        in getting the next page.
 
-        for doc in await cursor.to_list(length=100):
-            link = LinkRecord.model_validate(doc)
-            links.append(link)
+        Each link record is decoded as the given model, as for iter_link_records_as.
+        """
+        keyset_sort = [*sort, ("_id", pymongo.ASCENDING)]
+
+        query = filter if filter is not None else {}
+        if after is not None:
+            values = [*after.values, ObjectId(after.id)]
+            query = {"$and": [query, keyset_filter(keyset_sort, values)]}
+
+        # One more than the limit is fetched, to determine whether there are more.
+        cursor = self.db.links.find(filter=query, sort=keyset_sort, limit=limit + 1)
+        docs = await cursor.to_list(length=limit + 1)
+
+        next = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last_doc = docs[-1]
+            next = KeysetPosition(
+                values=[document_value(last_doc, field_name) for field_name, _ in sort],
+                id=str(last_doc["_id"]),
+            )
+
+        return LinkRecordsPage[Model](
+            links=[self.decode(model, doc) for doc in docs], next=next
+        )
 
-        return links
+    async def count_link_records(self, filter: Optional[Any] = None) -> int:
+        return await self.db.links.count_documents(filter if filter is not None else {})
 
     async def get_link_record_for_orcid_id(self, orcid_id: str) -> Optional[LinkRecord]:
         record = await self.db.links.find_one({"orcid_auth.orcid": orcid_id})
@@ -104,7 +354,7 @@ class StorageModelMongo:
         if record is None:
             return None
 
-        return LinkRecord.model_validate(record)
+        return self.decode(LinkRecord, record)
 
     async def save_link_record(self, record: LinkRecord) -> None:
         await self.db.links.update_one(
@@ -112,123 +362,231 @@ class StorageModelMongo:
         )
 
     async def create_link_record(self, record: LinkRecord) -> None:
-        await self.db.links.insert_one(record.model_dump())
+        """
+        Creates the link record; the unique indexes on the username and ORCID id
+        ensure that neither the user nor the ORCID account is already linked.
+        """
+        try:
+            await self.db.links.insert_one(record.model_dump())
+        except pymongo.errors.DuplicateKeyError:
+            raise AlreadyLinkedError("User or ORCID account already linked")
+
+    async def create_link_records(
+        self, records: List[LinkRecord]
+    ) -> List[Tuple[int, str]]:
+        """
+        Creates the link records in a single unordered bulk insert, so that the
+        failure of one record (e.g. because the user is already linked) does not
+        prevent the insertion of the others.
+
+        Returns the index, within the given records, and error message of each
+        record which could not be created.
+        """
+        if len(records) == 0:
+            return []
+        try:
+            await self.db.links.insert_many(
+                [record.model_dump() for record in records], ordered=False
+            )
+        except pymongo.errors.BulkWriteError as bwe:
+            failures: List[Tuple[int, str]] = []
+            for write_error in bwe.details.get("writeErrors", []):
+                if write_error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                    message = "User or ORCID account already linked"
+                else:
+                    message = write_error.get("errmsg", "Error creating link record")
+                failures.append((write_error["index"], message))
+            return failures
+        return []
 
     async def delete_link_record(self, username: str) -> None:
         await self.db.links.delete_one({"username": username})
 
+    ##
+    # Coordination of ORCID token refreshes.
+    # ORCID revokes the existing tokens when a link's tokens are refreshed, so only
+    # one refresh may be made with a given refresh token. A service instance must hold
+    # the refresh lease on the link record in order to refresh it, and the refreshed
+    # tokens are only saved if the link record still holds the refresh token which
+    # was used.
+    #
+    async def acquire_link_refresh_lease(
+        self, username: str, refresh_token: str, lease_id: str, expires_at: int
+    ) -> bool:
+        """
+        Acquires the refresh lease on the link record, if the record still holds the
+        given refresh token and no other unexpired lease is held.
+        """
+        result = await self.db.links.update_one(
+            {
+                "username": username,
+                "orcid_auth.refresh_token": refresh_token,
+                "$or": [
+                    {"refresh_lease": None},
+                    {"refresh_lease.expires_at": {"$lt": posix_time_millis()}},
+                ],
+            },
+            {"$set": {"refresh_lease": {"id": lease_id, "expires_at": expires_at}}},
+        )
+        return result.modified_count == 1
+
+    async def release_link_refresh_lease(self, username: str, lease_id: str) -> None:
+        await self.db.links.update_one(
+            {"username": username, "refresh_lease.id": lease_id},
+            {"$unset": {"refresh_lease": ""}},
+        )
+
+    async def save_refreshed_link_record(
+        self, record: LinkRecord, refresh_token: str
+    ) -> bool:
+        """
+        Saves the link record, with refreshed tokens, if the stored record still holds
+        the given refresh token, which was used for the refresh. Any refresh lease is
+        released.
+        """
+        result = await self.db.links.update_one(
+            {"username": record.username, "orcid_auth.refresh_token": refresh_token},
+            {"$set": record.model_dump(), "$unset": {"refresh_lease": ""}},
+        )
+        return result.modified_count == 1
+
     ################################
     # OAuth state persistence
     ################################
 
     # Linking session
-    # TODO: operate with the linking session record model, not raw dict.
+    #
+    # Linking sessions are held in a single collection, with a state field which
+    # records the progress of the session through the OAuth flow: "initial" when
+    # created, "started" once the user has been sent to ORCID, and "completed" once
+    # ORCID has returned the user's tokens. Each state transition is therefore a
+    # single, atomic update, so a session cannot be started or completed twice (e.g.
+    # by a double-click).
 
     async def create_linking_session(
         self, linking_record: LinkingSessionInitial
     ) -> None:
-        await self.db.linking_sessions_initial.insert_one(linking_record.model_dump())
+        linking_session = linking_record.model_dump()
+        linking_session["state"] = "initial"
+        if self.session_ttl:
+            # Removed once the session is completed.
+            linking_session["expires_at_date"] = datetime.datetime.fromtimestamp(
+                linking_record.expires_at / 1000, tz=datetime.timezone.utc
+            )
+        await self.db.linking_sessions.insert_one(linking_session)
 
     async def delete_linking_session_initial(self, session_id: str) -> None:
         # The UI api only supports deleting completed sessions.
         # We'll need an admin API to delete danging initial and started linking
         # sessions.
-        await self.db.linking_sessions_initial.delete_one({"session_id": session_id})
+        await self.db.linking_sessions.delete_one(
+            {"session_id": session_id, "state": "initial"}
+        )
 
     async def delete_linking_session_started(self, session_id: str) -> None:
         # The UI api only supports deleting completed sessions.
         # We'll need an admin API to delete danging initial and started linking
         # sessions.
-        await self.db.linking_sessions_started.delete_one({"session_id": session_id})
+        await self.db.linking_sessions.delete_one(
+            {"session_id": session_id, "state": "started"}
+        )
 
     async def delete_linking_session_completed(self, session_id: str) -> None:
         # The UI api only supports deleting completed sessions.
         # We'll need an admin API to delete danging initial and started linking
         # sessions.
-        await self.db.linking_sessions_completed.delete_one({"session_id": session_id})
-
-    # async def delete_expired_sessionsx(self) -> None:
-    #     now = posix_time_millis()
-
-    #     # For now, we fetch the docs, then delete them.
-    #     # This will allow us to provide an audit trail.
-    #     # If we don't implement an audit trail, we can just delete with the
-    #     # find expression.
-    #     initialized = self.db.linking_sessions_initial.find(
-    #         {"expires_at": {"$lte": now}}
-    #     )
-    #     started = self.db.linking_sessions_started.find({"expires_at": {"$lte": now}})
-    #     completed = self.db.linking_sessions_completed.find(
-    #         {"expires_at": {"$lte": now}}
-    #     )
-
-    #     for session in await initialized.to_list(length=100):
-    #         await self.db.linking_sessions_initial.delete_one(
-    #             {"session_id": {"$eq": session.get("session_id")}}
-    #         )
-
-    #     for session in await started.to_list(length=100):
-    #         await self.db.linking_sessions_started.delete_one(
-    #             {"session_id": {"$eq": session.get("session_id")}}
-    #         )
-
-    #     for session in await completed.to_list(length=100):
-    #         await self.db.linking_sessions_completed.delete_one(
-    #             {"session_id": {"$eq": session.get("session_id")}}
-    #         )
-
-    async def delete_expired_sessions(self) -> None:
-        now = posix_time_millis()
+        await self.db.linking_sessions.delete_one(
+            {"session_id": session_id, "state": "completed"}
+        )
 
-        await self.db.linking_sessions_initial.delete_many(
-            {"expires_at": {"$lte": now}}
+    async def delete_expired_completed_sessions(
+        self, session_ids: List[str], now: int
+    ) -> int:
+        """
+        Deletes the completed linking sessions with the given ids which had expired
+        as of the given time, returning the number deleted.
+        """
+        if len(session_ids) == 0:
+            return 0
+        result = await self.db.linking_sessions.delete_many(
+            {
+                "session_id": {"$in": session_ids},
+                "state": "completed",
+                "expires_at": {"$lte": now},
+            }
         )
+        return result.deleted_count
 
-        await self.db.linking_sessions_started.delete_many(
-            {"expires_at": {"$lte": now}}
+    async def delete_expired_sessions(
+        self, now: Optional[int] = None, states: Optional[List[str]] = None
+    ) -> int:
+        """
+        Deletes the linking sessions, in any of the given states (by default, all of
+        them), which had expired as of the given time, which defaults to the current
+        time. Returns the number deleted.
+        """
+        if now is None:
+            now = posix_time_millis()
+
+        filter: Dict[str, Any] = {"expires_at": {"$lte": now}}
+        if states is not None:
+            filter["state"] = {"$in": states}
+
+        result = await self.db.linking_sessions.delete_many(filter)
+        return result.deleted_count
+
+    def iter_expired_initial_sessions(
+        self, now: int
+    ) -> AsyncIterator[LinkingSessionInitial]:
+        return self.iter_documents(
+            self.db.linking_sessions,
+            LinkingSessionInitial,
+            {"state": "initial", "expires_at": {"$lte": now}},
         )
 
-        await self.db.linking_sessions_completed.delete_many(
-            {"expires_at": {"$lte": now}}
+    def iter_expired_started_sessions(
+        self, now: int
+    ) -> AsyncIterator[LinkingSessionStarted]:
+        return self.iter_documents(
+            self.db.linking_sessions,
+            LinkingSessionStarted,
+            {"state": "started", "expires_at": {"$lte": now}},
+        )
+
+    def iter_expired_completed_sessions(
+        self, now: int, limit: Optional[int] = None
+    ) -> AsyncIterator[LinkingSessionComplete]:
+        """
+        Iterates over the completed sessions which had expired as of the given time,
+        the longest expired first.
+        """
+        return self.iter_documents(
+            self.db.linking_sessions,
+            LinkingSessionComplete,
+            {"state": "completed", "expires_at": {"$lte": now}},
+            sort=[("expires_at", pymongo.ASCENDING)],
+            limit=limit,
+        )
+
+    async def count_expired_completed_sessions(self, now: int) -> int:
+        return await self.db.linking_sessions.count_documents(
+            {"state": "completed", "expires_at": {"$lte": now}}
         )
 
     async def get_expired_initial_sessions(
         self, now: int
     ) -> List[LinkingSessionInitial]:
-        initial_sessions_cursor = self.db.linking_sessions_initial.find(
-            {"expires_at": {"$lte": now}}
-        )
-        linking_sessions_initial: List[LinkingSessionInitial] = []
-        for doc in await initial_sessions_cursor.to_list(length=100):
-            link = LinkingSessionInitial.model_validate(doc)
-            linking_sessions_initial.append(link)
-
-        return linking_sessions_initial
+        return [session async for session in self.iter_expired_initial_sessions(now)]
 
     async def get_expired_started_sessions(
         self, now: int
     ) -> List[LinkingSessionStarted]:
-        started_sessions_cursor = self.db.linking_sessions_started.find(
-            {"expires_at": {"$lte": now}}
-        )
-        linking_sessions_started: List[LinkingSessionStarted] = []
-        for doc in await started_sessions_cursor.to_list(length=100):
-            link = LinkingSessionStarted.model_validate(doc)
-            linking_sessions_started.append(link)
-
-        return linking_sessions_started
+        return [session async for session in self.iter_expired_started_sessions(now)]
 
     async def get_expired_completed_sessions(
         self, now: int
     ) -> List[LinkingSessionComplete]:
-        completed_sessions_cursor = self.db.linking_sessions_completed.find(
-            {"expires_at": {"$lte": now}}
-        )
-        linking_sessions_completed: List[LinkingSessionComplete] = []
-        for doc in await completed_sessions_cursor.to_list(length=100):
-            link = LinkingSessionComplete.model_validate(doc)
-            linking_sessions_completed.append(link)
-        return linking_sessions_completed
+        return [session async for session in self.iter_expired_completed_sessions(now)]
 
     async def get_expired_sessions(self, now: int) -> ExpiredSessions:
         linking_sessions_initial = await self.get_expired_initial_sessions(now)
@@ -244,72 +602,70 @@ class StorageModelMongo:
     async def get_linking_session_initial(
         self, session_id: str
     ) -> LinkingSessionInitial | None:
-        session = await self.db.linking_sessions_initial.find_one(
-            {"session_id": session_id}
+        session = await self.db.linking_sessions.find_one(
+            {"session_id": session_id, "state": "initial"}
         )
 
         if session is None:
             return None
         else:
-            # session["kind"] = "initial"
-            return LinkingSessionInitial.model_validate(session)
+            return self.decode(LinkingSessionInitial, session)
 
     async def get_linking_session_started(
         self, session_id: str
     ) -> LinkingSessionStarted | None:
-        session = await self.db.linking_sessions_started.find_one(
-            {"session_id": session_id}
+        session = await self.db.linking_sessions.find_one(
+            {"session_id": session_id, "state": "started"}
         )
         if session is None:
             return None
         else:
-            return LinkingSessionStarted.model_validate(session)
+            return self.decode(LinkingSessionStarted, session)
 
     async def get_linking_session_completed(
         self, session_id: str
     ) -> LinkingSessionComplete | None:
-        session = await self.db.linking_sessions_completed.find_one(
-            {"session_id": session_id}
+        session = await self.db.linking_sessions.find_one(
+            {"session_id": session_id, "state": "completed"}
         )
 
         if session is None:
             return None
         else:
-            # session["kind"] = "complete"
-            return LinkingSessionComplete.model_validate(session)
+            return self.decode(LinkingSessionComplete, session)
 
-    async def get_linking_sessions_completed(self) -> List[LinkingSessionComplete]:
-        cursor = self.db.linking_sessions_completed.find({})
-
-        linking_sessions: List[LinkingSessionComplete] = []
-
-        for doc in await cursor.to_list(length=100):
-            link = LinkingSessionComplete.model_validate(doc)
-            linking_sessions.append(link)
+    def iter_linking_sessions_completed(self) -> AsyncIterator[LinkingSessionComplete]:
+        return self.iter_linking_sessions_completed_as(LinkingSessionComplete)
 
-        return linking_sessions
+    def iter_linking_sessions_completed_as(
+        self, model: Type[Model]
+    ) -> AsyncIterator[Model]:
+        """
+        Iterates over completed linking sessions, each decoded as the given model,
+        such as the public view of the session.
+        """
+        return self.iter_documents(
+            self.db.linking_sessions, model, {"state": "completed"}
+        )
 
-    async def get_linking_sessions_started(self) -> List[LinkingSessionStarted]:
-        cursor = self.db.linking_sessions_started.find({})
+    def iter_linking_sessions_started(self) -> AsyncIterator[LinkingSessionStarted]:
+        return self.iter_documents(
+            self.db.linking_sessions, LinkingSessionStarted, {"state": "started"}
+        )
 
-        linking_sessions: List[LinkingSessionStarted] = []
+    def iter_linking_sessions_initial(self) -> AsyncIterator[LinkingSessionInitial]:
+        return self.iter_documents(
+            self.db.linking_sessions, LinkingSessionInitial, {"state": "initial"}
+        )
 
-        for doc in await cursor.to_list(length=100):
-            link = LinkingSessionStarted.model_validate(doc)
-            linking_sessions.append(link)
+    async def get_linking_sessions_completed(self) -> List[LinkingSessionComplete]:
+        return [session async for session in self.iter_linking_sessions_completed()]
 
-        return linking_sessions
+    async def get_linking_sessions_started(self) -> List[LinkingSessionStarted]:
+        return [session async for session in self.iter_linking_sessions_started()]
 
     async def get_linking_sessions_initial(self) -> List[LinkingSessionInitial]:
-        cursor = self.db.linking_sessions_initial.find({})
-
-        linking_sessions: List[LinkingSessionInitial] = []
-
-        for doc in await cursor.to_list(length=100):
-            link = LinkingSessionInitial.model_validate(doc)
-            linking_sessions.append(link)
-
-        return linking_sessions
+        return [session async for session in self.iter_linking_sessions_initial()]
 
     async def update_linking_session_to_started(
         self,
@@ -317,134 +673,144 @@ class StorageModelMongo:
         return_link: str | None,
         skip_prompt: bool,
         ui_options: str,
-    ) -> None:
-        async with await self.client.start_session() as session:
-            # Get the initial linking session.
-            linking_session = await self.db.linking_sessions_initial.find_one(
-                {"session_id": session_id}, session=session
-            )
-
-            if linking_session is None:
-                raise NotFoundError("Linking session not found")
-
-            updated_linking_session = dict(linking_session)
+        username: Optional[str] = None,
+    ) -> LinkingSessionStarted:
+        """
+        Moves the initial linking session to the started state, returning the started
+        session.
 
-            updated_linking_session["return_link"] = return_link
-            updated_linking_session["skip_prompt"] = skip_prompt
-            updated_linking_session["ui_options"] = ui_options
+        If a username is given, the session must be owned by that user. If there is no
+        such initial session, e.g. because it has already been started, a
+        NotFoundError is raised.
+        """
+        filter: Dict[str, Any] = {"session_id": session_id, "state": "initial"}
+        if username is not None:
+            filter["username"] = username
+
+        linking_session = await self.db.linking_sessions.find_one_and_update(
+            filter,
+            {
+                "$set": {
+                    "state": "started",
+                    "return_link": return_link,
+                    "skip_prompt": skip_prompt,
+                    "ui_options": ui_options,
+                }
+            },
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
 
-            await self.db.linking_sessions_started.insert_one(
-                updated_linking_session, session=session
-            )
+        if linking_session is None:
+            raise NotFoundError("Linking session not found")
 
-            await self.db.linking_sessions_initial.delete_one(
-                {"session_id": session_id}, session=session
-            )
+        return self.decode(LinkingSessionStarted, linking_session)
 
     async def update_linking_session_to_finished(
         self, session_id: str, orcid_auth: ORCIDAuth
-    ) -> None:
-        async with await self.client.start_session() as session:
-            # Get the initial linking session.
-            linking_session = await self.db.linking_sessions_started.find_one(
-                {"session_id": session_id}, session=session
-            )
-
-            if linking_session is None:
-                raise NotFoundError("Linking session not found")
-                # raise exceptions.ServiceErrorY(
-                #     error=errors.ERRORS.not_found,
-                #     message="Linking session not found",
-                # )
+    ) -> LinkingSessionComplete:
+        """
+        Moves the started linking session to the completed state, recording the ORCID
+        tokens, and returning the completed session.
 
-            updated_linking_session = dict(linking_session)
+        If there is no such started session, e.g. because it has already been
+        completed, a NotFoundError is raised.
+        """
+        linking_session = await self.db.linking_sessions.find_one_and_update(
+            {"session_id": session_id, "state": "started"},
+            {
+                "$set": {"state": "completed", "orcid_auth": orcid_auth.model_dump()},
+                # Completed sessions are not expired by TTL, as their ORCID tokens
+                # must first be revoked.
+                "$unset": {"expires_at_date": ""},
+            },
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
 
-            updated_linking_session["orcid_auth"] = orcid_auth.model_dump()
+        if linking_session is None:
+            raise NotFoundError("Linking session not found")
 
-            await self.db.linking_sessions_completed.insert_one(
-                updated_linking_session, session=session
-            )
-
-            await self.db.linking_sessions_started.delete_one(
-                {"session_id": session_id}, session=session
-            )
+        return self.decode(LinkingSessionComplete, linking_session)
 
     async def reset_database(self) -> None:
         await self.db.links.drop()
-        await self.db.linking_sessions_initial.drop()
-        await self.db.linking_sessions_started.drop()
-        await self.db.linking_sessions_completed.drop()
+        await self.db.linking_sessions.drop()
         await self.db.description.drop()
 
-    async def get_stats(self) -> StatsRecord:
-        now = posix_time_millis()
-
-        day = 24 * 60 * 60 * 1000
-
-        links_last_24_hours = await self.db.links.count_documents(
-            {"created_at": {"$gte": now - day}}
-        )
-        links_last_7_days = await self.db.links.count_documents(
-            {"created_at": {"$gte": now - 7 * day}}
-        )
-        links_last_30_days = await self.db.links.count_documents(
-            {"created_at": {"$gte": now - 30 * day}}
-        )
-        links_all_time = await self.db.links.count_documents({})
-
-        linking_sessions_initial_active = (
-            await self.db.linking_sessions_initial.count_documents(
-                {"expires_at": {"$gt": now}}
-            )
-        )
-
-        linking_sessions_initial_expired = (
-            await self.db.linking_sessions_initial.count_documents(
-                {"expires_at": {"$lte": now}}
+    async def count_conditions(
+        self,
+        collection: motor.motor_asyncio.AsyncIOMotorCollection,
+        conditions: Dict[str, Any],
+    ) -> Dict[str, int]:
+        """
+        Counts the documents in the collection which satisfy each of the named
+        conditions (aggregation expressions), in a single pass over the collection.
+        """
+        pipeline = [
+            {
+                "$group": {
+                    "_id": None,
+                    **{
+                        name: {"$sum": {"$cond": [condition, 1, 0]}}
+                        for name, condition in conditions.items()
+                    },
+                }
+            }
+        ]
+        results = await collection.aggregate(pipeline).to_list(length=1)
+        # An empty collection produces no group at all.
+        if len(results) == 0:
+            return {name: 0 for name in conditions}
+        return {name: results[0][name] for name in conditions}
+
+    async def count_linking_sessions(self, now: int) -> Dict[str, LinkSessionStats]:
+        """
+        Counts the active and expired linking sessions in each state.
+        """
+        states = ["initial", "started", "completed"]
+        conditions: Dict[str, Any] = {}
+        for state in states:
+            in_state = {"$eq": ["$state", state]}
+            conditions[f"{state}_active"] = {
+                "$and": [in_state, {"$gt": ["$expires_at", now]}]
+            }
+            conditions[f"{state}_expired"] = {
+                "$and": [in_state, {"$lte": ["$expires_at", now]}]
+            }
+        counts = await self.count_conditions(self.db.linking_sessions, conditions)
+        return {
+            state: LinkSessionStats(
+                active=counts[f"{state}_active"], expired=counts[f"{state}_expired"]
             )
-        )
+            for state in states
+        }
 
-        linking_sessions_started_active = (
-            await self.db.linking_sessions_started.count_documents(
-                {"expires_at": {"$gt": now}}
-            )
-        )
+    async def get_stats(self) -> StatsRecord:
+        """
+        Gets usage statistics for links and linking sessions.
 
-        linking_sessions_started_expired = (
-            await self.db.linking_sessions_started.count_documents(
-                {"expires_at": {"$lte": now}}
-            )
-        )
+        Each collection is counted with a single aggregation, and the collections are
+        counted concurrently.
+        """
+        now = posix_time_millis()
 
-        linking_sessions_completed_active = (
-            await self.db.linking_sessions_completed.count_documents(
-                {"expires_at": {"$gt": now}}
-            )
-        )
+        day = 24 * 60 * 60 * 1000
 
-        linking_sessions_completed_expired = (
-            await self.db.linking_sessions_completed.count_documents(
-                {"expires_at": {"$lte": now}}
-            )
+        link_counts, linking_sessions = await asyncio.gather(
+            self.count_conditions(
+                self.db.links,
+                {
+                    "last_24_hours": {"$gte": ["$created_at", now - day]},
+                    "last_7_days": {"$gte": ["$created_at", now - 7 * day]},
+                    "last_30_days": {"$gte": ["$created_at", now - 30 * day]},
+                    "all_time": True,
+                },
+            ),
+            self.count_linking_sessions(now),
         )
 
         return StatsRecord(
-            links=LinkStats(
-                last_24_hours=links_last_24_hours,
-                last_7_days=links_last_7_days,
-                last_30_days=links_last_30_days,
-                all_time=links_all_time,
-            ),
-            linking_sessions_initial=LinkSessionStats(
-                active=linking_sessions_initial_active,
-                expired=linking_sessions_initial_expired,
-            ),
-            linking_sessions_started=LinkSessionStats(
-                active=linking_sessions_started_active,
-                expired=linking_sessions_started_expired,
-            ),
-            linking_sessions_completed=LinkSessionStats(
-                active=linking_sessions_completed_active,
-                expired=linking_sessions_completed_expired,
-            ),
+            links=LinkStats.model_validate(link_counts),
+            linking_sessions_initial=linking_sessions["initial"],
+            linking_sessions_started=linking_sessions["started"],
+            linking_sessions_completed=linking_sessions["completed"],
         )
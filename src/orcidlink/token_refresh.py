@@ -0,0 +1,164 @@
+"""
+Proactive, background refreshing of ORCID tokens.
+
+A link's ORCID tokens are refreshed when they are retired (see `process.py`), which
+otherwise happens lazily, in the first request to use the link after its retirement.
+The scheduler here refreshes links whose tokens are approaching retirement ahead of
+time, so that user requests need not pay for the refresh.
+
+At each interval (with jitter, so that multiple service instances do not scan in
+lockstep), links which retire within the lookahead window are refreshed, soonest
+first, with bounded concurrency. The number of such links remaining is recorded as
+the refresh backlog.
+
+Note that refreshes are coordinated with any other refresh of the same link, by this
+or another service instance, by `process.refresh_token_for_link`.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Optional
+
+import pymongo
+from pydantic import Field
+
+from orcidlink import process
+from orcidlink.lib.periodic_task import PeriodicTask
+from orcidlink.lib.type import ServiceBaseModel
+from orcidlink.lib.utils import posix_time_millis
+from orcidlink.model import LinkRecord
+from orcidlink.runtime import config
+from orcidlink.storage.storage_model import storage_model
+
+# The maximum delay, in seconds, randomly applied before each refresh in a batch, to
+# spread the refreshes out.
+REFRESH_JITTER = 1.0
+
+
+def log_info(message: str, event: str, extra: dict[str, Any]) -> None:
+    logger = logging.getLogger("token_refresh")
+    logger.info(message, extra={"type": "token_refresh", "event": event, **extra})
+
+
+def log_error(message: str, event: str, extra: dict[str, Any]) -> None:
+    logger = logging.getLogger("token_refresh")
+    logger.error(message, extra={"type": "token_refresh", "event": event, **extra})
+
+
+class TokenRefreshStats(ServiceBaseModel):
+    running: bool = Field(...)
+    backlog: int = Field(...)
+    scans: int = Field(...)
+    last_scan_at: Optional[int] = Field(default=None)
+    refreshed: int = Field(...)
+    failed: int = Field(...)
+
+
+class TokenRefreshScheduler(PeriodicTask):
+    def __init__(
+        self, interval: int, lookahead: int, concurrency: int, batch_size: int
+    ):
+        """
+        Constructor
+
+        The interval and lookahead are in seconds.
+        """
+        super().__init__(interval)
+        self.lookahead = lookahead
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.backlog = 0
+        self.scans = 0
+        self.last_scan_at: Optional[int] = None
+        self.refreshed = 0
+        self.failed = 0
+
+    async def run_once(self) -> None:
+        await self.refresh_retiring_links()
+
+    def report_error(self, error: Exception) -> None:
+        log_error(
+            "Error refreshing retiring links", "scan_failed", {"error": str(error)}
+        )
+
+    async def refresh_retiring_links(self) -> int:
+        """
+        Refreshes a batch of links whose tokens retire within the lookahead window,
+        returning the number successfully refreshed.
+        """
+        storage = storage_model()
+        retiring = {"retires_at": {"$lt": posix_time_millis() + self.lookahead * 1000}}
+
+        self.scans += 1
+        self.last_scan_at = posix_time_millis()
+        self.backlog = await storage.count_link_records(retiring)
+        if self.backlog == 0:
+            return 0
+
+        link_records = await storage.get_link_records(
+            filter=retiring,
+            sort=[("retires_at", pymongo.ASCENDING)],
+            limit=self.batch_size,
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def refresh(link_record: LinkRecord) -> bool:
+            async with semaphore:
+                await asyncio.sleep(random.uniform(0, REFRESH_JITTER))
+                try:
+                    await process.refresh_token_for_link(link_record)
+                except Exception as ex:
+                    self.failed += 1
+                    log_error(
+                        "Error refreshing link",
+                        "refresh_failed",
+                        {"username": link_record.username, "error": str(ex)},
+                    )
+                    return False
+                self.refreshed += 1
+                self.backlog -= 1
+                return True
+
+        results = await asyncio.gather(*[refresh(link) for link in link_records])
+        refreshed = sum(1 for result in results if result)
+
+        log_info(
+            "Refreshed retiring links",
+            "scan_completed",
+            {
+                "refreshed": refreshed,
+                "failed": len(results) - refreshed,
+                "backlog": self.backlog,
+            },
+        )
+        return refreshed
+
+    def stats(self) -> TokenRefreshStats:
+        return TokenRefreshStats(
+            running=self.running(),
+            backlog=self.backlog,
+            scans=self.scans,
+            last_scan_at=self.last_scan_at,
+            refreshed=self.refreshed,
+            failed=self.failed,
+        )
+
+
+_scheduler: Optional[TokenRefreshScheduler] = None
+
+
+def token_refresh_scheduler() -> TokenRefreshScheduler:
+    """
+    Returns the process-wide token refresh scheduler, creating it if necessary.
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TokenRefreshScheduler(
+            interval=config().token_refresh_interval,
+            lookahead=config().token_refresh_lookahead,
+            concurrency=config().token_refresh_concurrency,
+            batch_size=config().token_refresh_batch_size,
+        )
+    return _scheduler
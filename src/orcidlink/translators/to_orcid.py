@@ -164,3 +164,49 @@ def translate_work_update(work_update: model.WorkUpdate) -> orcid_api.WorkUpdate
         citation=citation,
         contributors=orcid_api.ContributorWrapper(contributor=contributors),
     )
+
+
+def translate_new_work(new_work: model.NewWork) -> orcid_api.NewWork:
+    external_ids: List[orcid_api.ExternalId] = [
+        orcid_api.ExternalId(
+            external_id_type="doi",
+            external_id_value=new_work.doi,
+            external_id_normalized=None,
+            # TODO: doi url should be configurable
+            external_id_url=ORCIDStringValue(value=f"https://doi.org/{new_work.doi}"),
+            external_id_relationship="self",
+        )
+    ]
+    for _, externalId in enumerate(new_work.externalIds):
+        external_ids.append(
+            orcid_api.ExternalId(
+                external_id_type=externalId.type,
+                external_id_value=externalId.value,
+                external_id_url=ORCIDStringValue(value=externalId.url),
+                external_id_relationship=externalId.relationship,
+            )
+        )
+
+    citation = orcid_api.Citation(
+        citation_type=new_work.citation.type,
+        citation_value=new_work.citation.value,
+    )
+
+    contributors: List[orcid_api.Contributor] = []
+
+    self_contributors = transform_contributor_self(new_work.selfContributor)
+    contributors.extend(self_contributors)
+
+    contributors.extend(transform_contributors(new_work.otherContributors))
+
+    return orcid_api.NewWork(
+        type=new_work.workType,
+        title=orcid_api.Title(title=ORCIDStringValue(value=new_work.title)),
+        journal_title=ORCIDStringValue(value=new_work.journal),
+        url=ORCIDStringValue(value=new_work.url),
+        external_ids=orcid_api.ExternalIds(external_id=external_ids),
+        publication_date=parse_date(new_work.date),
+        short_description=new_work.shortDescription,
+        citation=citation,
+        contributors=orcid_api.ContributorWrapper(contributor=contributors),
+    )
@@ -0,0 +1,61 @@
+import os
+from test.mocks.env import TEST_ENV
+from unittest import mock
+
+import aiohttp
+
+from orcidlink.lib.service_clients.http_session import (
+    client_session,
+    close_http_sessions,
+    http_session,
+    open_http_sessions,
+    origin,
+)
+from orcidlink.runtime import config
+
+
+def test_origin():
+    assert origin("https://ci.kbase.us/services/auth") == "https://ci.kbase.us"
+    assert origin("http://127.0.0.1:9997/v3.0") == "http://127.0.0.1:9997"
+
+
+def test_http_session_no_loop():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        assert http_session(config().auth_url) is None
+
+
+async def test_http_session_shared():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        assert http_session(config().auth_url) is None
+
+        open_http_sessions()
+        try:
+            auth_session = http_session(config().auth_url)
+            assert isinstance(auth_session, aiohttp.ClientSession)
+            assert http_session(f"{config().auth_url}/api/V2/token") is auth_session
+
+            orcid_api_session = http_session(config().orcid_api_base_url)
+            assert isinstance(orcid_api_session, aiohttp.ClientSession)
+            assert orcid_api_session is not auth_session
+
+            # Opening again keeps the existing sessions.
+            open_http_sessions()
+            assert http_session(config().auth_url) is auth_session
+        finally:
+            await close_http_sessions()
+
+        assert auth_session.closed
+        assert orcid_api_session.closed
+        assert http_session(config().auth_url) is None
+
+
+async def test_client_session():
+    async with aiohttp.ClientSession() as shared_session:
+        async with client_session(shared_session) as session:
+            assert session is shared_session
+        assert not shared_session.closed
+
+    async with client_session(None) as session:
+        transient_session = session
+        assert not transient_session.closed
+    assert transient_session.closed
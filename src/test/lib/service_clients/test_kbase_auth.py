@@ -1,12 +1,16 @@
+import asyncio
 import contextlib
 import os
+import time
 from test.mocks.env import MOCK_KBASE_SERVICES_PORT, TEST_ENV
 from test.mocks.mock_contexts import mock_auth_service, no_stderr
 from unittest import mock
 
+import aiohttp
 import pytest
 
 from orcidlink.jsonrpc.errors import ContentTypeError, JSONDecodeError, UpstreamError
+from orcidlink.lib.cache import TimedLRUCache
 from orcidlink.lib.service_clients.kbase_auth import (
     AccountInfo,
     AuthError,
@@ -16,8 +20,17 @@ from orcidlink.lib.service_clients.kbase_auth import (
     KBaseAuth,
     OtherAuthError,
     TokenInfo,
+    account_info_cache,
+    account_info_lookups,
     auth_error_to_jsonrpc_error,
+    invalid_token_cache,
+    kbase_auth,
+    token_info_cache,
+    token_info_lifetime,
+    token_info_lookups,
+    token_key,
 )
+from orcidlink.lib.single_flight import SingleFlight
 
 
 @contextlib.contextmanager
@@ -58,6 +71,127 @@ async def test_kbase_auth_get_token_info():
             assert token_info.user == "foo"
 
 
+async def test_kbase_auth_get_token_info_shared_session():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            async with aiohttp.ClientSession() as session:
+                client = KBaseAuth(url=url, timeout=1, session=session)
+                token_info = await client.get_token_info("foo")
+                assert isinstance(token_info, TokenInfo)
+                assert token_info.user == "foo"
+
+                # The shared session is not closed by the client.
+                assert not session.closed
+
+
+async def test_kbase_auth_get_token_info_cached():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            token_cache: TimedLRUCache[TokenInfo] = TimedLRUCache(
+                max_size=10, lifetime=60
+            )
+            client = KBaseAuth(url=url, timeout=1, token_cache=token_cache)
+
+            token_info = await client.get_token_info("foo")
+            assert token_info.user == "foo"
+            assert token_cache.stats().misses == 1
+
+            token_info2 = await client.get_token_info("foo")
+            assert token_info2 is token_info
+            assert token_cache.stats().hits == 1
+
+        # Now the auth service is gone, but the token info is still available.
+        token_info3 = await client.get_token_info("foo")
+        assert token_info3 is token_info
+
+        # The token itself is not retained.
+        assert token_cache.cache.get("foo") is None
+        assert token_cache.get(token_key("foo")) is token_info
+
+
+async def test_kbase_auth_get_token_info_coalesced():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            token_lookups: SingleFlight[TokenInfo] = SingleFlight()
+            client = KBaseAuth(url=url, timeout=1, token_lookups=token_lookups)
+
+            results = await asyncio.gather(
+                *[client.get_token_info("foo") for _ in range(5)]
+            )
+            for token_info in results:
+                assert token_info is results[0]
+                assert token_info.user == "foo"
+            assert token_lookups.stats().calls == 1
+            assert token_lookups.stats().coalesced == 4
+
+            results = await asyncio.gather(
+                *[client.get_token_info("invalid_token") for _ in range(3)],
+                return_exceptions=True,
+            )
+            for result in results:
+                assert isinstance(result, AuthorizationRequiredAuthError)
+            assert token_lookups.stats().calls == 2
+
+
+async def test_kbase_auth_get_me_coalesced():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            account_lookups: SingleFlight[AccountInfo] = SingleFlight()
+            client = KBaseAuth(url=url, timeout=1, account_lookups=account_lookups)
+
+            results = await asyncio.gather(*[client.get_me("foo") for _ in range(5)])
+            for account_info in results:
+                assert account_info.user == "foo"
+            assert account_lookups.stats().calls == 1
+
+
+async def test_kbase_auth_get_token_info_cached_errors_not_cached():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            token_cache: TimedLRUCache[TokenInfo] = TimedLRUCache(
+                max_size=10, lifetime=60
+            )
+            client = KBaseAuth(url=url, timeout=1, token_cache=token_cache)
+            with pytest.raises(AuthorizationRequiredAuthError):
+                await client.get_token_info("invalid_token")
+            assert token_cache.stats().size == 0
+
+
+def test_token_info_lifetime():
+    now = int(time.time() * 1000)
+    token_info = TokenInfo(
+        type="Login",
+        id="abc",
+        expires=now + 1000 * 1000,
+        created=now,
+        name=None,
+        user="foo",
+        custom={},
+        cachefor=300000,
+    )
+    # Limited by cachefor
+    assert token_info_lifetime(token_info) == 300
+
+    # Limited by token expiration
+    token_info.expires = now + 10 * 1000
+    assert 9 < token_info_lifetime(token_info) <= 10
+
+    # Expired
+    token_info.expires = now - 1000
+    assert token_info_lifetime(token_info) < 0
+
+
+def test_kbase_auth_factory():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        client = kbase_auth()
+        assert isinstance(client, KBaseAuth)
+        assert client.token_cache is token_info_cache()
+        assert client.account_cache is account_info_cache()
+        assert client.invalid_token_cache is invalid_token_cache()
+        assert client.token_lookups is token_info_lookups()
+        assert client.account_lookups is account_info_lookups()
+
+
 async def test_kbase_auth_get_token_info_other_error():
     """
     An invalid token should raise an AuthorizationRequiredError.
@@ -192,6 +326,50 @@ async def test_kbase_auth_get_me():
             assert account_info.user == "foo"
 
 
+async def test_kbase_auth_get_me_cached():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services() as url:
+            account_cache: TimedLRUCache[AccountInfo] = TimedLRUCache(
+                max_size=10, lifetime=60
+            )
+            client = KBaseAuth(url=url, timeout=1, account_cache=account_cache)
+
+            account_info = await client.get_me("foo")
+            assert account_info.user == "foo"
+            assert account_cache.stats().misses == 1
+
+        # The auth service is gone, but the account info is cached.
+        account_info2 = await client.get_me("foo")
+        assert account_info2 is account_info
+        assert account_cache.stats().hits == 1
+
+
+async def test_kbase_auth_invalid_token_cached():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        invalid_tokens: TimedLRUCache[bool] = TimedLRUCache(max_size=10, lifetime=60)
+        with mock_services() as url:
+            client = KBaseAuth(url=url, timeout=1, invalid_token_cache=invalid_tokens)
+
+            with pytest.raises(AuthorizationRequiredAuthError):
+                await client.get_token_info("invalid_token")
+            assert invalid_tokens.get(token_key("invalid_token")) is True
+
+            # Valid tokens are not affected.
+            token_info = await client.get_token_info("foo")
+            assert token_info.user == "foo"
+
+        # The auth service is gone, but the token is known to be invalid, for both
+        # token and account lookups.
+        with pytest.raises(AuthorizationRequiredAuthError):
+            await client.get_token_info("invalid_token")
+        with pytest.raises(AuthorizationRequiredAuthError):
+            await client.get_me("invalid_token")
+
+        # Whereas another token requires the auth service.
+        with pytest.raises(OtherAuthError):
+            await client.get_token_info("foo")
+
+
 async def test_kbase_auth_get_me_param_errors():
     with mock.patch.dict(os.environ, TEST_ENV, clear=True):
         with mock_services() as url:
@@ -0,0 +1,76 @@
+import time
+
+from orcidlink.lib.cache import CacheStats, TimedLRUCache
+
+
+def test_cache_get_set():
+    cache: TimedLRUCache[str] = TimedLRUCache(max_size=10, lifetime=60)
+    assert cache.get("foo") is None
+    cache.set("foo", "bar")
+    assert cache.get("foo") == "bar"
+
+    stats = cache.stats()
+    assert isinstance(stats, CacheStats)
+    assert stats.size == 1
+    assert stats.max_size == 10
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 0
+
+
+def test_cache_peek():
+    cache: TimedLRUCache[str] = TimedLRUCache(max_size=10, lifetime=60)
+    assert cache.peek("foo") is None
+    cache.set("foo", "bar")
+    assert cache.peek("foo") == "bar"
+    assert cache.stats().hits == 0
+    assert cache.stats().misses == 0
+
+
+def test_cache_delete_clear():
+    cache: TimedLRUCache[str] = TimedLRUCache(max_size=10, lifetime=60)
+    cache.set("foo", "bar")
+    cache.set("baz", "buzz")
+    cache.delete("foo")
+    cache.delete("not_there")
+    assert cache.get("foo") is None
+    assert cache.get("baz") == "buzz"
+    cache.clear()
+    assert cache.get("baz") is None
+    assert cache.stats().size == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache: TimedLRUCache[int] = TimedLRUCache(max_size=2, lifetime=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Using "a" makes "b" the least recently used.
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_cache_lifetime():
+    cache: TimedLRUCache[str] = TimedLRUCache(max_size=10, lifetime=0.1)
+    cache.set("foo", "bar")
+    assert cache.get("foo") == "bar"
+    time.sleep(0.2)
+    assert cache.get("foo") is None
+    assert cache.stats().size == 0
+
+
+def test_cache_lifetime_of():
+    cache: TimedLRUCache[float] = TimedLRUCache(
+        max_size=10, lifetime=60, lifetime_of=lambda value: value
+    )
+    cache.set("short", 0.1)
+    cache.set("long", 30)
+    # An already expired value is not added.
+    cache.set("expired", -1)
+    assert cache.get("expired") is None
+    time.sleep(0.2)
+    assert cache.get("short") is None
+    assert cache.get("long") == 30
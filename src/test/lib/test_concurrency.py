@@ -0,0 +1,142 @@
+import asyncio
+import time
+
+import pytest
+
+from orcidlink.jsonrpc.errors import UpstreamError
+from orcidlink.lib.concurrency import (
+    run_all_concurrently,
+    run_concurrently,
+    run_write_concurrently,
+)
+
+
+async def test_run_concurrently():
+    async def call(result: str) -> str:
+        await asyncio.sleep(0.2)
+        return result
+
+    start = time.monotonic()
+    result = await run_concurrently(call("first"), call("second"))
+    assert result == ("first", "second")
+    # Had the calls run sequentially, this would take at least 0.4s.
+    assert time.monotonic() - start < 0.35
+
+
+async def test_run_concurrently_error_cancels_other():
+    cancelled = False
+
+    async def slow_call() -> str:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return "slow"
+
+    async def failing_call() -> str:
+        await asyncio.sleep(0.1)
+        raise UpstreamError("Upstream failed")
+
+    # The original exception is raised, rather than an exception group.
+    with pytest.raises(UpstreamError):
+        await run_concurrently(slow_call(), failing_call())
+    assert cancelled
+
+
+async def test_run_all_concurrently():
+    async def call(result: int) -> int:
+        await asyncio.sleep(0.2)
+        return result
+
+    start = time.monotonic()
+    result = await run_all_concurrently([call(index) for index in range(5)])
+    assert result == [0, 1, 2, 3, 4]
+    assert time.monotonic() - start < 0.35
+
+    assert await run_all_concurrently([]) == []
+
+
+async def test_run_all_concurrently_error():
+    async def call(fail: bool) -> bool:
+        await asyncio.sleep(0.1)
+        if fail:
+            raise UpstreamError("Upstream failed")
+        return fail
+
+    with pytest.raises(UpstreamError):
+        await run_all_concurrently([call(False), call(True), call(False)])
+
+
+async def test_run_write_concurrently():
+    async def call(result: str) -> str:
+        await asyncio.sleep(0.2)
+        return result
+
+    start = time.monotonic()
+    result = await run_write_concurrently(call("write"), call("read"))
+    assert result == ("write", "read")
+    assert time.monotonic() - start < 0.35
+
+
+async def test_run_write_concurrently_read_error_completes_write():
+    written = False
+
+    async def write() -> str:
+        nonlocal written
+        await asyncio.sleep(0.3)
+        written = True
+        return "write"
+
+    async def failing_read() -> str:
+        await asyncio.sleep(0.1)
+        raise UpstreamError("Upstream failed")
+
+    # The read's error is raised only once the write has completed.
+    with pytest.raises(UpstreamError):
+        await run_write_concurrently(write(), failing_read())
+    assert written
+
+
+async def test_run_write_concurrently_write_error_cancels_read():
+    cancelled = False
+
+    async def failing_write() -> str:
+        await asyncio.sleep(0.1)
+        raise UpstreamError("Upstream failed")
+
+    async def slow_read() -> str:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return "slow"
+
+    with pytest.raises(UpstreamError):
+        await run_write_concurrently(failing_write(), slow_read())
+    assert cancelled
+
+
+async def test_run_write_concurrently_cancelled_completes_write():
+    written = asyncio.Event()
+
+    async def write() -> str:
+        await asyncio.sleep(0.2)
+        written.set()
+        return "write"
+
+    async def read() -> str:
+        await asyncio.sleep(10)
+        return "read"
+
+    task = asyncio.create_task(run_write_concurrently(write(), read()))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The write continues, although its caller has been cancelled.
+    await asyncio.wait_for(written.wait(), 1)
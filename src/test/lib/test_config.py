@@ -70,17 +70,46 @@ def test_get_config():
         assert config.orcidlink_url == "http://foo/services/orcidlink"
         assert config.token_cache_lifetime == 300
         assert config.token_cache_max_items == 20000
+        assert config.account_cache_lifetime == 30
+        assert config.account_cache_max_items == 1000
+        assert config.invalid_token_cache_lifetime == 60
+        assert config.orcid_profile_cache_lifetime == 300
+        assert config.orcid_profile_cache_max_items == 1000
+        assert config.orcid_response_cache_lifetime == 3600
+        assert config.orcid_response_cache_max_items == 1000
+        assert config.token_refresh_lease_duration == 120
+        assert config.token_refresh_interval == 900
+        assert config.token_refresh_lookahead == 86400
+        assert config.token_refresh_concurrency == 4
+        assert config.token_refresh_batch_size == 100
+        assert config.linking_session_reaper_interval == 0
+        assert config.linking_session_reaper_batch_size == 100
+        assert config.linking_session_revocation_concurrency == 4
+        assert config.linking_session_revocation_retries == 2
         assert config.request_timeout == 60
         assert config.ui_origin == "http://foo"
         assert config.orcid_api_base_url == "http://orcidapi"
         assert config.orcid_oauth_base_url == "http://orcidoauth"
         assert config.orcid_client_id == "CLIENT-ID"
         assert config.orcid_client_secret == "CLIENT-SECRET"
+        # The source of KBase works defaults to the service's own client.
+        assert config.orcid_works_source_client_id == "CLIENT-ID"
         assert config.mongo_host == "MONGO-HOST"
         assert config.mongo_port == 1234
         assert config.mongo_database == "MONGO-DATABASE"
         assert config.mongo_username == "MONGO-USERNAME"
         assert config.mongo_password == "MONGO-PASSWORD"
+        assert config.mongo_min_pool_size == 0
+        assert config.mongo_max_pool_size == 100
+        assert config.mongo_max_idle_time == 300
+        assert config.mongo_wait_queue_timeout == 10
+        assert config.mongo_cursor_batch_size == 100
+        assert config.storage_validate_reads == 0
+        assert config.stats_cache_lifetime == 0
+        assert config.http_connection_limit == 100
+        assert config.http_connection_limit_per_host == 20
+        assert config.http_dns_cache_ttl == 300
+        assert config.http_keepalive_timeout == 30
 
 
 TEST_ENV_BAD = {
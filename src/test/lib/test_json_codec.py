@@ -0,0 +1,58 @@
+import json
+import os
+from test.mocks.data import load_data_file
+
+import pytest
+
+from orcidlink.lib import json_codec
+
+TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
+
+CODECS = [
+    codec
+    for codec in [json_codec.STDLIB_CODEC, json_codec.ORJSON_CODEC]
+    if codec is not None
+]
+
+
+def test_json_codec_prefers_orjson():
+    if json_codec.ORJSON_CODEC is None:
+        assert json_codec.json_codec() is json_codec.STDLIB_CODEC
+    else:
+        assert json_codec.json_codec() is json_codec.ORJSON_CODEC
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_json_codec_round_trip(codec: json_codec.JSONCodec):
+    profile = load_data_file(TEST_DATA_DIR, "orcid/profile.json")
+    value = json.loads(profile)
+
+    # Bodies are parsed from their raw bytes, or from strings.
+    assert codec.loads(profile.encode("utf-8")) == value
+    assert codec.loads(profile) == value
+
+    # And serialized to bytes.
+    dumped = codec.dumps(value)
+    assert isinstance(dumped, bytes)
+    assert json.loads(dumped) == value
+
+    assert codec.loads('["ünïcödé"]'.encode("utf-8")) == ["ünïcödé"]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_json_codec_decode_error(codec: json_codec.JSONCodec):
+    # Whichever codec is in use, invalid JSON raises the standard library's error.
+    for body in [b"", b"this is not json!", b'{"foo": ']:
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(body)
+
+
+def test_set_json_codec():
+    codec = json_codec.json_codec()
+    try:
+        json_codec.set_json_codec(json_codec.STDLIB_CODEC)
+        assert json_codec.json_codec() is json_codec.STDLIB_CODEC
+        assert json_codec.loads(b'{"foo": "bar"}') == {"foo": "bar"}
+        assert json_codec.dumps({"foo": "bar"}) == b'{"foo": "bar"}'
+    finally:
+        json_codec.set_json_codec(codec)
@@ -0,0 +1,53 @@
+import asyncio
+from typing import List
+from unittest import mock
+
+from orcidlink.lib.periodic_task import PeriodicTask
+
+
+class CountingTask(PeriodicTask):
+    def __init__(self, interval: int):
+        super().__init__(interval)
+        self.runs = 0
+        self.errors: List[Exception] = []
+
+    async def run_once(self) -> None:
+        self.runs += 1
+        if self.runs == 1:
+            raise ValueError("First run failed")
+
+    def report_error(self, error: Exception) -> None:
+        self.errors.append(error)
+
+
+async def test_periodic_task():
+    task = CountingTask(interval=1)
+    # Runs every 0.1s, rather than waiting for whole seconds.
+    with mock.patch.object(task, "next_delay", return_value=0.1):
+        task.start()
+        assert task.running()
+        await asyncio.sleep(0.35)
+        await task.stop()
+    assert not task.running()
+
+    # The failed first run is reported, and does not stop subsequent runs.
+    assert task.runs >= 3
+    assert len(task.errors) == 1
+    assert str(task.errors[0]) == "First run failed"
+
+    # Stopping again is harmless.
+    await task.stop()
+
+
+async def test_periodic_task_disabled():
+    task = CountingTask(interval=0)
+    task.start()
+    assert not task.running()
+    await task.stop()
+    assert task.runs == 0
+
+
+def test_periodic_task_next_delay():
+    task = CountingTask(interval=100)
+    for _ in range(100):
+        assert 90 <= task.next_delay() <= 110
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from orcidlink.lib.single_flight import SingleFlight, SingleFlightStats
+
+
+async def test_single_flight_coalesces():
+    single_flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+
+    async def call() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return "result"
+
+    results = await asyncio.gather(*[single_flight.run("key", call) for _ in range(5)])
+    assert results == ["result"] * 5
+    assert calls == 1
+
+    stats = single_flight.stats()
+    assert isinstance(stats, SingleFlightStats)
+    assert stats.calls == 1
+    assert stats.coalesced == 4
+    assert stats.in_flight == 0
+
+    # Once complete, a subsequent call is made anew.
+    assert await single_flight.run("key", call) == "result"
+    assert calls == 2
+
+
+async def test_single_flight_different_keys():
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    async def call(value: str) -> str:
+        await asyncio.sleep(0.1)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.run("a", lambda: call("a")),
+        single_flight.run("b", lambda: call("b")),
+    )
+    assert results == ["a", "b"]
+    assert single_flight.stats().calls == 2
+
+
+async def test_single_flight_error_propagates_to_all():
+    single_flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+
+    async def call() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        raise ValueError("oops")
+
+    results = await asyncio.gather(
+        *[single_flight.run("key", call) for _ in range(3)], return_exceptions=True
+    )
+    assert calls == 1
+    for result in results:
+        assert isinstance(result, ValueError)
+    assert single_flight.stats().in_flight == 0
+
+    # Errors are not retained.
+    with pytest.raises(ValueError):
+        await single_flight.run("key", call)
+    assert calls == 2
+
+
+async def test_single_flight_waiter_cancellation():
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.2)
+        return "result"
+
+    waiter1 = asyncio.create_task(single_flight.run("key", call))
+    waiter2 = asyncio.create_task(single_flight.run("key", call))
+    await asyncio.sleep(0.05)
+    waiter1.cancel()
+    assert await waiter2 == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter1
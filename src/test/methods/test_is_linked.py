@@ -1,4 +1,5 @@
 import contextlib
+import copy
 import os
 from test.mocks.data import load_data_json
 from test.mocks.env import MOCK_KBASE_SERVICES_PORT, TEST_ENV
@@ -44,6 +45,23 @@ async def test_is_linked():
             assert_json_rpc_result(response, True)
 
 
+async def test_is_linked_retired_not_refreshed():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services():
+            await clear_database()
+            retired_link = copy.deepcopy(TEST_LINK)
+            retired_link["retires_at"] = 0
+            await create_link(retired_link)
+
+            with mock.patch(
+                "orcidlink.process.refresh_token_for_link"
+            ) as refresh_token_for_link:
+                params = {"username": "foo"}
+                response = rpc_call("is-linked", params, generate_kbase_token("foo"))
+                assert_json_rpc_result(response, True)
+                refresh_token_for_link.assert_not_called()
+
+
 async def test_is_linked_not_authorized():
     with mock.patch.dict(os.environ, TEST_ENV, clear=True):
         with mock_services():
@@ -674,6 +674,28 @@ async def test_start_linking_session_errors():
             )
 
 
+async def test_start_linking_session_error_already_started():
+    """
+    A linking session may be started only once, e.g. if the user double-clicks.
+    """
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services():
+            client = TestClient(app, raise_server_exceptions=False)
+
+            await clear_storage_model()
+
+            initial_session_info = await assert_create_linking_session(TOKEN_FOO)
+            initial_session_id = initial_session_info["session_id"]
+
+            assert_start_linking_session(
+                client, initial_session_id, kbase_session=TOKEN_FOO
+            )
+
+            assert_start_linking_session_error(
+                client, initial_session_id, 1020, TOKEN_FOO
+            )
+
+
 async def test_linking_session_continue():
     """
     Here we simulate the oauth flow with ORCID - in which
@@ -1,5 +1,7 @@
+import base64
 import contextlib
 import copy
+import json
 import os
 from test.mocks.data import load_data_json
 from test.mocks.env import MOCK_KBASE_SERVICES_PORT, MOCK_ORCID_OAUTH_PORT, TEST_ENV
@@ -22,6 +24,7 @@ from unittest import mock
 
 from fastapi.testclient import TestClient
 
+from orcidlink.jsonrpc.methods import manage
 from orcidlink.jsonrpc.methods.manage import (
     FilterByEpochTime,
     FilterByORCIDId,
@@ -35,11 +38,14 @@ from orcidlink.jsonrpc.methods.manage import (
     delete_linking_session_completed,
     delete_linking_session_initial,
     delete_linking_session_started,
+    encode_links_cursor,
 )
+from orcidlink.lib.cache import TimedLRUCache
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.main import app
 from orcidlink.model import LinkingSessionInitial, LinkRecord, ORCIDAuth
 from orcidlink.storage.storage_model import storage_model
+from orcidlink.storage.storage_model_mongo import KeysetPosition
 
 client = TestClient(app)
 
@@ -323,6 +329,76 @@ async def test_get_links_with_range():
             assert len(result["links"]) == 1
 
 
+async def test_get_links_with_cursor():
+    """
+    In which we page through links with the cursor returned with each page.
+    """
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services():
+            sm = storage_model()
+            await sm.db.links.drop()
+            usernames = ["user1", "user2", "user3", "user4", "user5"]
+            for username in usernames:
+                link = copy.deepcopy(TEST_LINK)
+                link["username"] = username
+                await sm.create_link_record(LinkRecord.model_validate(link))
+
+            def find_links(
+                sort: Optional[QuerySort], after: Optional[str] = None
+            ) -> Any:
+                query = SearchQuery(sort=sort, limit=2, after=after)
+                params = {"username": "amanager", "query": query.model_dump()}
+                return rpc_call("find-links", params, generate_kbase_token("amanager"))
+
+            def page_through(sort: Optional[QuerySort]) -> list[str]:
+                found: list[str] = []
+                after = None
+                while True:
+                    result = assert_json_rpc_result_ignore_result(
+                        find_links(sort, after)
+                    )
+                    found.extend(link["username"] for link in result["links"])
+                    after = result["next_cursor"]
+                    if after is None:
+                        return found
+
+            descending = QuerySort(
+                specs=[QuerySortSpec(field_name="username", descending=True)]
+            )
+            assert page_through(descending) == list(reversed(usernames))
+
+            # Without a sort, links are paged in the order of their _id.
+            assert page_through(None) == usernames
+
+            # A full last page has no next page.
+            await sm.delete_link_record("user5")
+            assert page_through(descending) == list(reversed(usernames[:4]))
+
+            # A cursor may only be used with the query which issued it.
+            result = assert_json_rpc_result_ignore_result(find_links(descending))
+            cursor = result["next_cursor"]
+            assert cursor is not None
+            assert_json_rpc_error(find_links(None, cursor), -32602, "Invalid params")
+            assert_json_rpc_error(
+                find_links(descending, "not-a-cursor"), -32602, "Invalid params"
+            )
+
+            # Nor may a cursor be forged with a position which is not that of a link.
+            position = KeysetPosition(values=["user3"], id="not-an-object-id")
+            forged_cursor = encode_links_cursor(
+                json.loads(base64.urlsafe_b64decode(cursor))["query"], position
+            )
+            assert_json_rpc_error(
+                find_links(descending, forged_cursor), -32602, "Invalid params"
+            )
+
+            # Nor with an offset
+            query = SearchQuery(offset=1, limit=2, after=cursor)
+            params = {"username": "amanager", "query": query.model_dump()}
+            response = rpc_call("find-links", params, generate_kbase_token("amanager"))
+            assert_json_rpc_error(response, -32602, "Invalid params")
+
+
 async def test_get_links_error_not_admin():
     """
     In this test, we attempt to delete expired linking sessions with a
@@ -369,6 +445,33 @@ async def test_get_stats():
             assert result["stats"]["links"]["all_time"] == 3
 
 
+async def test_get_stats_cached():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        sm = storage_model()
+        await sm.db.links.drop()
+
+        # Caching is disabled by default.
+        assert manage.stats_cache() is None
+
+        with mock.patch.object(
+            manage, "_stats_cache", TimedLRUCache(max_size=1, lifetime=60)
+        ):
+            result = await manage.get_stats()
+            assert result.stats.links.all_time == 0
+
+            await sm.create_link_record(LinkRecord.model_validate(TEST_LINK))
+
+            # The cached snapshot is returned until it expires.
+            result = await manage.get_stats()
+            assert result.stats.links.all_time == 0
+
+            cache = manage.stats_cache()
+            assert cache is not None
+            cache.clear()
+            result = await manage.get_stats()
+            assert result.stats.links.all_time == 1
+
+
 async def test_get_stats_error_not_admin():
     with mock.patch.dict(os.environ, TEST_ENV, clear=True):
         with mock_services():
@@ -381,10 +484,11 @@ async def test_delete_expired_linking_sessions_none():
     """
     In this test, we have not created any sessions to delete.
 
-    It should succeed with 204.
+    It should succeed, reporting that nothing was deleted.
     """
     with mock.patch.dict(os.environ, TEST_ENV, clear=True):
         with mock_services():
+            await clear_storage_model()
             params = {"username": "amanager"}
             response = rpc_call(
                 "delete-expired-linking-sessions",
@@ -392,7 +496,11 @@ async def test_delete_expired_linking_sessions_none():
                 generate_kbase_token("amanager"),
             )
             result = assert_json_rpc_result_ignore_result(response)
-            assert result is None
+            assert result == {
+                "deleted_sessions": 0,
+                "revoked_sessions": 0,
+                "failures": [],
+            }
 
 
 async def test_delete_expired_linking_sessions_some():
@@ -521,6 +629,67 @@ async def test_delete_expired_linking_sessions_all():
                 assert stats.linking_sessions_completed.expired == 0
 
 
+async def test_delete_expired_linking_sessions_revocation_failure():
+    """
+    In this test, the tokens of one of two expired completed sessions cannot be
+    revoked.
+
+    The session whose tokens were revoked is deleted, the other retained and
+    reported as a failure.
+    """
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services():
+            with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+                storage = storage_model()
+                await clear_storage_model()
+
+                now = posix_time_millis()
+                for session_id, access_token in [
+                    ("revoked-session", "access_token"),
+                    ("failed-session", "error-unauthorized-client"),
+                ]:
+                    await storage.create_linking_session(
+                        LinkingSessionInitial(
+                            session_id=session_id,
+                            username="foo",
+                            created_at=now,
+                            expires_at=now - 60_000,
+                        )
+                    )
+                    await storage.update_linking_session_to_started(
+                        session_id, "return-link", False, "ui-options"
+                    )
+                    await storage.update_linking_session_to_finished(
+                        session_id,
+                        ORCIDAuth(
+                            access_token=access_token,
+                            token_type="b",
+                            refresh_token="c",
+                            expires_in=123,
+                            scope="d",
+                            name="e",
+                            orcid="f",
+                        ),
+                    )
+
+                with mock.patch("orcidlink.session_reaper.RETRY_DELAY", 0):
+                    result = await delete_expired_linking_sessions()
+
+                assert result.deleted_sessions == 1
+                assert result.revoked_sessions == 1
+                assert len(result.failures) == 1
+                assert result.failures[0].session_id == "failed-session"
+
+                assert (
+                    await storage.get_linking_session_completed("revoked-session")
+                    is None
+                )
+                assert (
+                    await storage.get_linking_session_completed("failed-session")
+                    is not None
+                )
+
+
 async def test_delete_expired_linking_sessions_error_not_admin():
     """
     In this test, we attempt to delete expired linking sessions with a
@@ -1,4 +1,5 @@
 import contextlib
+import copy
 import os
 from test.mocks.data import load_data_json
 from test.mocks.env import MOCK_KBASE_SERVICES_PORT, TEST_ENV
@@ -9,6 +10,7 @@ from test.mocks.testing_utils import (
     clear_database,
     create_link,
     generate_kbase_token,
+    rpc_call,
 )
 from unittest import mock
 
@@ -77,3 +79,24 @@ async def test_other_link():
                 headers={"Authorization": generate_kbase_token("bar")},
             )
             assert_json_rpc_error(response, 1020, "Not Found")
+
+
+async def test_other_link_retired_not_refreshed():
+    with mock.patch.dict(os.environ, TEST_ENV, clear=True):
+        with mock_services():
+            await clear_database()
+            retired_link = copy.deepcopy(TEST_LINK_BAR)
+            retired_link["retires_at"] = 0
+            await create_link(retired_link)
+
+            with mock.patch(
+                "orcidlink.process.refresh_token_for_link"
+            ) as refresh_token_for_link:
+                response = rpc_call(
+                    "other-link", {"username": "bar"}, generate_kbase_token("foo")
+                )
+                expected = LinkRecordPublicNonOwner.model_validate(
+                    TEST_LINK_BAR
+                ).model_dump()
+                assert_json_rpc_result(response, expected)
+                refresh_token_for_link.assert_not_called()
@@ -16,10 +16,20 @@ client = TestClient(app, raise_server_exceptions=False)
 # Happy paths
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
 def test_status_method():
     result = status_method()
     assert isinstance(result, StatusResult)
     assert result.status == "ok"
+    assert result.metrics.mongo_pool.checked_out >= 0
+    assert result.metrics.token_cache.hits >= 0
+    assert result.metrics.account_cache.hits >= 0
+    assert result.metrics.invalid_token_cache.misses >= 0
+    assert result.metrics.token_lookups.coalesced >= 0
+    assert result.metrics.token_refresh.backlog >= 0
+    assert result.metrics.linking_session_reaper.running is False
+    assert result.metrics.orcid_profile_cache.hits >= 0
+    assert result.metrics.orcid_response_cache.not_modified >= 0
 
     current_time = datetime.fromtimestamp(result.current_time / 1000, tz=timezone.utc)
     now_time = datetime.now(timezone.utc)
@@ -39,6 +49,9 @@ def test_get_status():
     assert result["status"] == "ok"
     assert isinstance(result["current_time"], int)
     assert isinstance(result["start_time"], int)
+    assert isinstance(result["metrics"]["mongo_pool"]["checked_out"], int)
+    assert isinstance(result["metrics"]["mongo_pool"]["creations_per_second"], float)
+    assert isinstance(result["metrics"]["token_cache"]["max_size"], int)
     status_time = datetime.fromtimestamp(result["current_time"] / 1000, tz=timezone.utc)
     current_time = datetime.now(timezone.utc)
     time_diff = current_time - status_time
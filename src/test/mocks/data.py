@@ -1,12 +1,18 @@
 import json
 import os
+import threading
+
+# Mock services load test data in request handler threads, and may handle requests
+# concurrently; the fake filesystem used by many tests is not thread-safe.
+_load_lock = threading.Lock()
 
 
 def load_test_data(data_dir: str, collection: str, filename: str):
     # data_dir = os.environ["TEST_DATA_DIR"]
     test_data_path = f"{data_dir}/{collection}/{filename}.json"
-    with open(test_data_path) as fin:
-        return json.load(fin)
+    with _load_lock:
+        with open(test_data_path) as fin:
+            return json.load(fin)
 
 
 def load_data_file(data_dir: str, filename: str):
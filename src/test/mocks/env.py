@@ -17,5 +17,10 @@ TEST_ENV = {
     "ORCID_SITE_BASE_URL": "https://sandbox.orcid.org",
     "ORCID_CLIENT_ID": "REDACTED-CLIENT-ID",
     "ORCID_CLIENT_SECRET": "REDACTED-CLIENT-SECRET",
+    # The client which added the KBase works in the ORCID test data.
+    "ORCID_WORKS_SOURCE_CLIENT_ID": "APP-RC3PM3KSMMV3GKWS",
     "LINKING_SESSION_RETURN_URL": "https://ci.kbase.us/orcidlink/linkcontinue",
+    # Documents read from the database are validated, so that any divergence between
+    # the models and the stored documents is caught.
+    "STORAGE_VALIDATE_READS": "1",
 }
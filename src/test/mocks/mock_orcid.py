@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 from test.mocks.data import load_test_data
@@ -12,14 +13,34 @@ TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
 
 
 class MockORCIDAPI(MockService):
+    # As ORCID does, records and works are served with an ETag and Last-Modified,
+    # and conditional requests are honored.
+    LAST_MODIFIED = "Thu, 15 Dec 2022 15:53:58 GMT"
+
+    def send_json_conditional(self, output_data):
+        output = json.dumps(output_data).encode()
+        etag = f'"{hashlib.md5(output).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", ORCID_API_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(output)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(output)
+
     def do_GET(self):
         if self.path == "/0000-0003-4997-3076/record":
             test_data = load_test_data(TEST_DATA_DIR, "orcid", "profile")
-            self.send_json(test_data, ORCID_API_CONTENT_TYPE)
+            self.send_json_conditional(test_data)
 
         elif self.path == "/0000-0003-4997-3076/works":
             test_data = load_test_data(TEST_DATA_DIR, "orcid", "works_x")
-            self.send_json(test_data, ORCID_API_CONTENT_TYPE)
+            self.send_json_conditional(test_data)
 
         elif self.path == "/0000-0003-4997-3076/works/1526002":
             work_record = load_test_data(TEST_DATA_DIR, "orcid", "work_1526002")
@@ -84,6 +105,24 @@ class MockORCIDAPI(MockService):
                 "more-info": "https://members.orcid.org/api/resources/troubleshooting",
             }
             self.send_json_error(error, 403, ORCID_API_CONTENT_TYPE)
+
+        elif self.path.startswith("/0000-0003-4997-3076/works/") and "," in self.path:
+            # A bulk read of works; as ORCID does, an unknown put code is returned as
+            # an error in place of its work.
+            put_codes = self.path.split("/")[-1].split(",")
+            bulk = []
+            for put_code in put_codes:
+                if put_code in ["1526002", "1487805"]:
+                    work_record = load_test_data(
+                        TEST_DATA_DIR, "orcid", f"work_{put_code}"
+                    )
+                    bulk.append(work_record["bulk"][0])
+                else:
+                    error = load_test_data(
+                        TEST_DATA_DIR, "orcid", "get-works-bad-put-code"
+                    )
+                    bulk.append(error["bulk"][0])
+            self.send_json({"bulk": bulk}, ORCID_API_CONTENT_TYPE)
         else:
             raise Exception("Not a supported mock case")
 
@@ -152,8 +191,32 @@ class MockORCIDAPI(MockService):
                 # don't bother with sending data, as the connection
                 # will probably be dead by the time this is reached.
             else:
+                # Each work is created independently; as ORCID does, a work which
+                # cannot be created is returned as an error in place of the work.
                 test_work = load_test_data(TEST_DATA_DIR, "orcid", "work_1526002")
-                self.send_json(test_work, ORCID_API_CONTENT_TYPE)
+                bulk = []
+                for item in new_work["bulk"]:
+                    title = item["work"]["title"]["title"]["value"]
+                    if title == "trigger-item-error":
+                        bulk.append(
+                            {
+                                "error": {
+                                    "response-code": 409,
+                                    "developer-message": (
+                                        "409 Conflict: You have already added this "
+                                        "activity (matched by external identifiers)"
+                                    ),
+                                    "user-message": (
+                                        "There was an error when updating the record."
+                                    ),
+                                    "error-code": 9021,
+                                    "more-info": "https://members.orcid.org/api/resources/troubleshooting",
+                                }
+                            }
+                        )
+                    else:
+                        bulk.append(test_work["bulk"][0])
+                self.send_json({"bulk": bulk}, ORCID_API_CONTENT_TYPE)
 
 
 class MockORCIDAPIWithErrors(MockService):
@@ -30,9 +30,7 @@ TOKEN_BAZ = generate_kbase_token("baz")
 
 async def clear_storage_model():
     sm = storage_model()
-    await sm.db.linking_sessions_completed.delete_many({})
-    await sm.db.linking_sessions_initial.delete_many({})
-    await sm.db.linking_sessions_started.delete_many({})
+    await sm.db.linking_sessions.delete_many({})
     await sm.db.links.delete_many({})
 
 
@@ -154,19 +152,25 @@ async def get_linking_session_initial(session_id: str) -> LinkingSessionInitial
 
 async def add_linking_session_initial(linking_session: LinkingSessionInitial) -> None:
     storage = storage_model()
-    await storage.db.linking_sessions_initial.insert_one(linking_session.model_dump())
+    await storage.db.linking_sessions.insert_one(
+        {**linking_session.model_dump(), "state": "initial"}
+    )
 
 
 async def add_linking_session_started(linking_session: LinkingSessionStarted) -> None:
     storage = storage_model()
-    await storage.db.linking_sessions_started.insert_one(linking_session.model_dump())
+    await storage.db.linking_sessions.insert_one(
+        {**linking_session.model_dump(), "state": "started"}
+    )
 
 
 async def add_linking_session_completed(
     linking_session: LinkingSessionComplete,
 ) -> None:
     storage = storage_model()
-    await storage.db.linking_sessions_completed.insert_one(linking_session.model_dump())
+    await storage.db.linking_sessions.insert_one(
+        {**linking_session.model_dump(), "state": "completed"}
+    )
 
 
 # JSON-RPC
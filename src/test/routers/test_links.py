@@ -0,0 +1,233 @@
+import contextlib
+import json
+import os
+from test.mocks.data import load_data_json
+from test.mocks.env import MOCK_KBASE_SERVICES_PORT, TEST_ENV
+from test.mocks.mock_contexts import mock_auth_service, no_stderr
+from test.mocks.testing_utils import clear_storage_model, generate_kbase_token
+from typing import Any, Dict, List
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from orcidlink.jsonrpc.errors import (
+    AuthorizationRequiredError,
+    ContentTypeError,
+    NotAuthorizedError,
+    UpstreamError,
+)
+from orcidlink.main import app
+from orcidlink.model import LinkRecord
+from orcidlink.routers.links import iter_lines
+from orcidlink.storage.indexes import REQUIRED_INDEXES
+from orcidlink.storage.storage_model import storage_model
+
+client = TestClient(app)
+
+TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
+
+TEST_LINK = load_data_json(TEST_DATA_DIR, "link1.json")
+TEST_LINK_BAR = load_data_json(TEST_DATA_DIR, "link-bar.json")
+
+
+@contextlib.contextmanager
+def mock_services():
+    with no_stderr():
+        with mock_auth_service(MOCK_KBASE_SERVICES_PORT):
+            yield
+
+
+async def add_links(links: List[Dict[str, Any]]) -> None:
+    storage = storage_model()
+    for link in links:
+        await storage.create_link_record(LinkRecord.model_validate(link))
+
+
+def ndjson_lines(text: str):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+async def test_iter_lines():
+    async def chunks(*values: bytes):
+        for value in values:
+            yield value
+
+    lines = [line async for line in iter_lines(chunks(b"a\nb", b"c\n\nd", b"e"))]
+    assert lines == [b"a", b"bc", b"", b"de"]
+
+    lines = [line async for line in iter_lines(chunks(b"a\n"))]
+    assert lines == [b"a"]
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_export_links():
+    with mock_services():
+        await clear_storage_model()
+        await add_links([TEST_LINK, TEST_LINK_BAR])
+
+        response = client.get(
+            "/links/export", headers={"Authorization": generate_kbase_token("amanager")}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        links = ndjson_lines(response.text)
+        # Ordered by username, and without tokens.
+        assert [link["username"] for link in links] == ["bar", "foo"]
+        assert "access_token" not in links[0]["orcid_auth"]
+        assert links[1]["orcid_auth"]["orcid"] == TEST_LINK["orcid_auth"]["orcid"]
+
+        response = client.get(
+            "/links/export",
+            params={"full": "true"},
+            headers={"Authorization": generate_kbase_token("amanager")},
+        )
+        assert response.status_code == 200
+        links = ndjson_lines(response.text)
+        assert links == [TEST_LINK_BAR, TEST_LINK]
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_export_links_error_not_manager():
+    with mock_services():
+        response = client.get(
+            "/links/export", headers={"Authorization": generate_kbase_token("foo")}
+        )
+        assert response.status_code == 403
+        assert response.json()["code"] == NotAuthorizedError.CODE
+
+        response = client.get("/links/export")
+        assert response.status_code == 401
+        assert response.json()["code"] == AuthorizationRequiredError.CODE
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_export_links_error_auth():
+    with mock_services():
+        # An invalid token is not authorized.
+        response = client.get(
+            "/links/export",
+            headers={"Authorization": generate_kbase_token("invalid_token")},
+        )
+        assert response.status_code == 401
+        assert response.json()["code"] == AuthorizationRequiredError.CODE
+
+        # The message describes the specific error.
+        response = client.get("/links/export")
+        assert response.status_code == 401
+        assert response.json()["message"] == "Authorization required but missing"
+
+        # A failure of the auth service is not the caller's fault.
+        response = client.get(
+            "/links/export",
+            headers={"Authorization": generate_kbase_token("other_error")},
+        )
+        assert response.status_code == 502
+        assert response.json()["code"] == UpstreamError.CODE
+
+        response = client.get(
+            "/links/export",
+            headers={"Authorization": generate_kbase_token("bad_content_type")},
+        )
+        assert response.status_code == 502
+        assert response.json()["code"] == ContentTypeError.CODE
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_import_links():
+    with mock_services():
+        storage = storage_model()
+        await storage.reset_database()
+        # The unique indexes reject links for users or ORCID accounts already linked.
+        for spec in REQUIRED_INDEXES:
+            await storage.db[spec.collection].create_index(
+                spec.field, unique=spec.unique
+            )
+        await add_links([TEST_LINK])
+
+        # Another link for foo is rejected, as is an invalid link; the others are
+        # created.
+        content = "\n".join(
+            [
+                json.dumps(TEST_LINK_BAR),
+                json.dumps({**TEST_LINK, "created_at": 1}),
+                "",
+                json.dumps({"username": "baz"}),
+                json.dumps({**TEST_LINK_BAR, "username": "baz"}),
+                json.dumps(
+                    {
+                        **TEST_LINK,
+                        "username": "qux",
+                        "orcid_auth": {**TEST_LINK["orcid_auth"], "orcid": "qux-orcid"},
+                    }
+                ),
+            ]
+        )
+        response = client.post(
+            "/links/import",
+            content=content,
+            headers={
+                "Authorization": generate_kbase_token("amanager"),
+                "Content-Type": "application/x-ndjson",
+            },
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["created"] == 2
+        errors = result["errors"]
+        assert [(error["line"], error["username"]) for error in errors] == [
+            (2, "foo"),
+            (4, None),
+            (5, "baz"),
+        ]
+        assert errors[0]["message"] == "User or ORCID account already linked"
+        assert "orcid_auth" in errors[1]["message"]
+
+        assert await storage.get_link_record("bar") == LinkRecord.model_validate(
+            TEST_LINK_BAR
+        )
+        assert await storage.get_link_record("qux") is not None
+        assert await storage.get_link_record("baz") is None
+        # The existing link is unchanged.
+        foo_link = await storage.get_link_record("foo")
+        assert foo_link is not None
+        assert foo_link.created_at == TEST_LINK["created_at"]
+
+        await storage.reset_database()
+
+
+@mock.patch.dict(os.environ, {**TEST_ENV, "MONGO_CURSOR_BATCH_SIZE": "2"}, clear=True)
+async def test_import_links_round_trip():
+    with mock_services():
+        await clear_storage_model()
+        links = [
+            {
+                **TEST_LINK,
+                "username": f"user{index}",
+                "orcid_auth": {**TEST_LINK["orcid_auth"], "orcid": f"orcid{index}"},
+            }
+            for index in range(5)
+        ]
+        await add_links(links)
+
+        headers = {"Authorization": generate_kbase_token("amanager")}
+        export = client.get("/links/export", params={"full": "true"}, headers=headers)
+        assert export.status_code == 200
+
+        await clear_storage_model()
+        response = client.post("/links/import", content=export.text, headers=headers)
+        assert response.json() == {"created": 5, "errors": []}
+
+        storage = storage_model()
+        assert [link.model_dump() for link in await storage.get_link_records()] == links
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_import_links_error_not_manager():
+    with mock_services():
+        response = client.post(
+            "/links/import",
+            content=json.dumps(TEST_LINK),
+            headers={"Authorization": generate_kbase_token("foo")},
+        )
+        assert response.status_code == 403
+        assert response.json()["code"] == NotAuthorizedError.CODE
@@ -1,14 +1,17 @@
 import os
-from test.mocks.data import load_test_data
+from test.mocks.data import load_data_file, load_test_data
 from test.mocks.env import MOCK_ORCID_API_PORT, TEST_ENV
 from test.mocks.mock_contexts import (
     mock_orcid_api_service,
     mock_orcid_api_service_with_errors,
     no_stderr,
 )
+from typing import cast
 from unittest import mock
 
+import aiohttp
 import pytest
+from pydantic import ValidationError
 
 from orcidlink.jsonrpc.errors import (
     ORCIDInsufficientAuthorizationError,
@@ -93,6 +96,169 @@ async def test_ORCIDAPI_get_profile():
             assert profile.orcid_identifier.path == orcid_id
 
 
+class FakeClientResponse:
+    """
+    Stands in for an aiohttp response, for the response handlers.
+    """
+
+    def __init__(self, status: int, body: bytes, content_type: str | None):
+        self.status = status
+        self.body = body
+        self.headers = {} if content_type is None else {"Content-Type": content_type}
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+def fake_response(
+    status: int, body: bytes, content_type: str | None
+) -> aiohttp.ClientResponse:
+    return cast(aiohttp.ClientResponse, FakeClientResponse(status, body, content_type))
+
+
+def orcid_response(status: int, body: bytes) -> aiohttp.ClientResponse:
+    return fake_response(status, body, orcid_api.ORCID_API_CONTENT_TYPE)
+
+
+async def test_handle_model_response():
+    body = load_data_file(TEST_DATA_DIR, "orcid/profile.json").encode("utf-8")
+    # A successful response is validated directly from the JSON body, without being
+    # parsed first.
+    with mock.patch.object(
+        orcid_api.json_codec, "loads", wraps=orcid_api.json_codec.loads
+    ) as loads:
+        profile = await orcid_api.handle_model_response(
+            orcid_response(200, body), orcid_api.ORCIDProfile
+        )
+        loads.assert_not_called()
+    assert profile.orcid_identifier.path == "0000-0003-4997-3076"
+
+
+async def test_handle_model_response_errors():
+    # An error in a successful bulk response is raised.
+    body = load_data_file(TEST_DATA_DIR, "orcid/get-works-bad-put-code.json")
+    with pytest.raises(ORCIDNotFoundError):
+        await orcid_api.handle_model_response(
+            orcid_response(200, body.encode("utf-8")), orcid_api.GetWorkResult
+        )
+
+    # Unless bulk item errors are expected.
+    works = await orcid_api.handle_model_response(
+        orcid_response(200, body.encode("utf-8")),
+        orcid_api.GetBulkWorksResult,
+        bulk_item_errors=True,
+    )
+    assert works.bulk[0].error is not None
+    assert works.bulk[0].error.error_code == 9034
+
+    # An error response.
+    body = load_data_file(TEST_DATA_DIR, "orcid/get-profile-404-error.json")
+    with pytest.raises(ORCIDNotFoundError):
+        await orcid_api.handle_model_response(
+            orcid_response(404, body.encode("utf-8")), orcid_api.ORCIDProfile
+        )
+
+    # A successful response which is not JSON.
+    with pytest.raises(UpstreamError, match="Error decoding JSON response"):
+        await orcid_api.handle_model_response(
+            orcid_response(200, b"this is not json!"), orcid_api.ORCIDProfile
+        )
+
+    # A successful response which is not the model.
+    with pytest.raises(ValidationError):
+        await orcid_api.handle_model_response(
+            orcid_response(200, b'{"foo": "bar"}'), orcid_api.ORCIDProfile
+        )
+
+    # A response which is not ORCID JSON.
+    with pytest.raises(UpstreamError, match="Expected JSON response"):
+        await orcid_api.handle_model_response(
+            fake_response(200, b"{}", "text/plain"), orcid_api.ORCIDProfile
+        )
+
+
+def make_profile_cache() -> orcid_api.ORCIDProfileCache:
+    return orcid_api.ORCIDProfileCache(max_size=10, lifetime=60)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_get_profile_cached():
+    profile_cache = make_profile_cache()
+    orcid_id = "0000-0003-4997-3076"
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", profile_cache=profile_cache
+            )
+            profile = await client.get_profile(orcid_id)
+            assert profile.orcid_identifier.path == orcid_id
+            assert profile_cache.stats().misses == 1
+
+    # The mock ORCID service is gone, but the profile is cached.
+    profile2 = await client.get_profile(orcid_id)
+    assert profile2 is profile
+    assert profile_cache.stats().hits == 1
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_save_work_invalidates_profile():
+    profile_cache = make_profile_cache()
+    orcid_id = "0000-0003-4997-3076"
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", profile_cache=profile_cache
+            )
+            await client.get_profile(orcid_id)
+            assert profile_cache.get(orcid_id) is not None
+
+            put_code = 1526002
+            work_update = load_test_data(
+                TEST_DATA_DIR, "orcid", f"work_{str(put_code)}"
+            )["bulk"][0]["work"]
+            await client.save_work(
+                orcid_id, put_code, orcid_api.WorkUpdate.model_validate(work_update)
+            )
+            assert profile_cache.get(orcid_id) is None
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_profile_cache_invalidate_modified_at():
+    profile = orcid_api.ORCIDProfile.model_validate(
+        load_test_data(TEST_DATA_DIR, "orcid", "profile")
+    )
+    last_modified = orcid_api.profile_last_modified(profile)
+    assert last_modified == 1671119638386
+
+    profile_cache = make_profile_cache()
+    profile_cache.set("foo", profile)
+
+    # Not modified since the profile was fetched
+    profile_cache.invalidate("foo", last_modified)
+    assert profile_cache.get("foo") is profile
+
+    # Modified since
+    profile_cache.invalidate("foo", last_modified + 1)
+    assert profile_cache.get("foo") is None
+
+    # Unconditionally
+    profile_cache.set("foo", profile)
+    profile_cache.invalidate("foo")
+    assert profile_cache.get("foo") is None
+
+    # Not cached
+    profile_cache.invalidate("bar", last_modified)
+    assert profile_cache.get("bar") is None
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+def test_orcid_profile_cache():
+    profile_cache = orcid_api.orcid_profile_cache()
+    assert isinstance(profile_cache, orcid_api.ORCIDProfileCache)
+    assert profile_cache is orcid_api.orcid_profile_cache()
+    assert orcid_api.orcid_api("token").profile_cache is profile_cache
+
+
 @mock.patch.dict(os.environ, TEST_ENV, clear=True)
 async def test_ORCIDAPI_get_profile_not_found():
     """
@@ -292,6 +458,143 @@ async def test_ORCIDAPI_get_works():
             assert works.group[0].work_summary[0].put_code == 1487805
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_get_works_source_filter():
+    """
+    Only works whose source is the given client are parsed, and groups without any
+    such works are dropped.
+    """
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            orcid_id = "0000-0003-4997-3076"
+            client = orcid_api.ORCIDAPIClient(
+                url=url,
+                access_token="access_token",
+                works_source_client_id="APP-RC3PM3KSMMV3GKWS",
+            )
+            works = await client.get_works(orcid_id)
+            assert [
+                [work_summary.put_code for work_summary in group.work_summary]
+                for group in works.group
+            ] == [[1537385], [1547701], [1526002], [1526014], [1591568]]
+
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", works_source_client_id="OTHER"
+            )
+            works = await client.get_works(orcid_id)
+            assert works.group == []
+            assert works.last_modified_date is not None
+
+
+def test_filter_works_by_source():
+    works = load_test_data(TEST_DATA_DIR, "orcid", "works_x")
+    filtered = orcid_api.filter_works_by_source(works, "APP-RC3PM3KSMMV3GKWS")
+    assert len(filtered["group"]) == 5
+    # The group holding works of both sources keeps only the KBase work, and its
+    # external ids.
+    group = filtered["group"][3]
+    assert [work["put-code"] for work in group["work-summary"]] == [1526014]
+    assert group["external-ids"] == works["group"][4]["external-ids"]
+    # The works themselves are not modified.
+    assert len(works["group"]) == 6
+
+
+def make_response_cache() -> orcid_api.ORCIDResponseCache:
+    return orcid_api.ORCIDResponseCache(max_size=10, lifetime=60)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_get_works_revalidated():
+    response_cache = make_response_cache()
+    orcid_id = "0000-0003-4997-3076"
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", response_cache=response_cache
+            )
+            works = await client.get_works(orcid_id)
+            cached = response_cache.get(f"{orcid_id}/works")
+            assert cached is not None
+            assert cached.value is works
+            assert cached.etag is not None
+            assert cached.last_modified == "Thu, 15 Dec 2022 15:53:58 GMT"
+
+            # The mock service reports the works as not modified, so the cached
+            # works are returned without being parsed again.
+            with mock.patch.object(
+                orcid_api.Works, "model_validate", wraps=orcid_api.Works.model_validate
+            ) as model_validate:
+                works2 = await client.get_works(orcid_id)
+                assert works2 is works
+                model_validate.assert_not_called()
+            assert response_cache.stats().not_modified == 1
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_get_profile_revalidated():
+    response_cache = make_response_cache()
+    orcid_id = "0000-0003-4997-3076"
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", response_cache=response_cache
+            )
+            profile = await client.get_profile(orcid_id)
+            profile2 = await client.get_profile(orcid_id)
+            assert profile2 is profile
+            assert response_cache.stats().not_modified == 1
+
+            # A response for a different resource is not used.
+            works = await client.get_works(orcid_id)
+            assert isinstance(works, orcid_api.Works)
+            assert response_cache.stats().not_modified == 1
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_ORCIDAPI_save_work_invalidates_responses():
+    response_cache = make_response_cache()
+    orcid_id = "0000-0003-4997-3076"
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            client = orcid_api.ORCIDAPIClient(
+                url=url, access_token="access_token", response_cache=response_cache
+            )
+            await client.get_profile(orcid_id)
+            await client.get_works(orcid_id)
+            assert response_cache.stats().size == 2
+
+            put_code = 1526002
+            work_update = load_test_data(
+                TEST_DATA_DIR, "orcid", f"work_{str(put_code)}"
+            )["bulk"][0]["work"]
+            await client.save_work(
+                orcid_id, put_code, orcid_api.WorkUpdate.model_validate(work_update)
+            )
+            assert response_cache.stats().size == 0
+
+
+def test_validated_response_conditional_header():
+    works = orcid_api.Works(group=[], path="/0000-0003-4997-3076/works")
+    header = orcid_api.ValidatedResponse(works, '"abc"', None).conditional_header()
+    assert header.get("if-none-match") == '"abc"'
+    assert "if-modified-since" not in header
+
+    last_modified = "Thu, 15 Dec 2022 15:53:58 GMT"
+    header = orcid_api.ValidatedResponse(
+        works, None, last_modified
+    ).conditional_header()
+    assert "if-none-match" not in header
+    assert header.get("if-modified-since") == last_modified
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+def test_orcid_response_cache():
+    response_cache = orcid_api.orcid_response_cache()
+    assert isinstance(response_cache, orcid_api.ORCIDResponseCache)
+    assert response_cache is orcid_api.orcid_response_cache()
+    assert orcid_api.orcid_api("token").response_cache is response_cache
+
+
 # @mock.patch.dict(os.environ, TEST_ENV, clear=True)
 # async def test_ORCIDAPI_get_works_error():
 #     """
@@ -345,6 +648,78 @@ async def test_get_work_error():
                 await client.get_work(orcid_id, put_code)
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_works_detail():
+    """
+    Tests a bulk read of works, which returns each work, or the error reading it, in
+    the order of the put codes.
+    """
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            orcid_id = "0000-0003-4997-3076"
+            client = orcid_api.ORCIDAPIClient(url=url, access_token="access_token")
+            works = await client.get_works_detail(orcid_id, [1526002, 1234, 1487805])
+            assert len(works) == 3
+            assert works[0].work is not None
+            assert works[0].work.put_code == 1526002
+            assert works[1].work is None
+            assert works[1].error is not None
+            assert works[1].error.error_code == 9034
+            assert works[2].work is not None
+            assert works[2].work.put_code == 1487805
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_works_detail_chunked():
+    """
+    Tests that a bulk read of more works than ORCID will read at once is made in
+    chunks, whose results are returned in order.
+    """
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            orcid_id = "0000-0003-4997-3076"
+            client = orcid_api.ORCIDAPIClient(url=url, access_token="access_token")
+            put_codes = [1526002, 1487805, 1234, 1487805, 1526002]
+            with mock.patch.object(orcid_api, "ORCID_BULK_WORKS_LIMIT", 2):
+                works = await client.get_works_detail(orcid_id, put_codes)
+            assert [
+                work.work.put_code if work.work is not None else None for work in works
+            ] == [1526002, 1487805, None, 1487805, 1526002]
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_works_detail_concurrency():
+    """
+    Tests that no more than ORCID_BULK_WORKS_CONCURRENCY chunks are read at once.
+    """
+    with no_stderr():
+        with mock_orcid_api_service(MOCK_ORCID_API_PORT) as [_, _, url, port]:
+            orcid_id = "0000-0003-4997-3076"
+            client = orcid_api.ORCIDAPIClient(url=url, access_token="access_token")
+            in_flight = 0
+            max_in_flight = 0
+            original_get_works_bulk = orcid_api.ORCIDAPIClient.get_works_bulk
+
+            async def get_works_bulk(self, orcid_id, put_codes):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    return await original_get_works_bulk(self, orcid_id, put_codes)
+                finally:
+                    in_flight -= 1
+
+            put_codes = [1526002, 1487805] * 5
+            with mock.patch.object(orcid_api, "ORCID_BULK_WORKS_LIMIT", 1):
+                with mock.patch.object(orcid_api, "ORCID_BULK_WORKS_CONCURRENCY", 2):
+                    with mock.patch.object(
+                        orcid_api.ORCIDAPIClient, "get_works_bulk", get_works_bulk
+                    ):
+                        works = await client.get_works_detail(orcid_id, put_codes)
+            assert len(works) == 10
+            assert max_in_flight == 2
+
+
 @mock.patch.dict(os.environ, TEST_ENV, clear=True)
 async def test_ORCIDAPI_save_work():
     with no_stderr():
@@ -0,0 +1,103 @@
+from typing import Optional
+
+from bson import ObjectId
+
+from orcidlink.lib.type import ServiceBaseModel
+from orcidlink.model import (
+    LinkingSessionComplete,
+    LinkingSessionCompletePublic,
+    LinkRecord,
+    LinkRecordPublic,
+    ORCIDAuth,
+    ORCIDAuthPublic,
+)
+from orcidlink.storage.decode import construct_model, decode_model, field_model
+
+LINK_DOC = {
+    "_id": ObjectId(),
+    "username": "foo",
+    "created_at": 1,
+    "expires_at": 2,
+    "retires_at": 3,
+    "orcid_auth": {
+        "access_token": "access-token",
+        "token_type": "bearer",
+        "refresh_token": "refresh-token",
+        "expires_in": 123,
+        "scope": "/read-limited",
+        "name": "Foo Bear",
+        "orcid": "0000-0003-4997-3076",
+    },
+}
+
+LINKING_SESSION_DOC = {
+    "_id": ObjectId(),
+    "state": "completed",
+    "session_id": "session",
+    "username": "foo",
+    "created_at": 1,
+    "expires_at": 2,
+    "return_link": None,
+    "skip_prompt": False,
+    "ui_options": "",
+    "orcid_auth": LINK_DOC["orcid_auth"],
+}
+
+
+class OptionalNested(ServiceBaseModel):
+    orcid_auth: Optional[ORCIDAuthPublic] = None
+
+
+def test_field_model():
+    assert field_model(ORCIDAuth) is ORCIDAuth
+    assert field_model(Optional[ORCIDAuth]) is ORCIDAuth
+    assert field_model(ORCIDAuth | None) is ORCIDAuth
+    assert field_model(str) is None
+    assert field_model(Optional[str]) is None
+
+
+def test_construct_model():
+    link = construct_model(LinkRecord, LINK_DOC)
+    assert isinstance(link, LinkRecord)
+    assert isinstance(link.orcid_auth, ORCIDAuth)
+    # The same model as would be validated, less the document's _id.
+    assert link == LinkRecord.model_validate(LINK_DOC)
+
+    session = construct_model(LinkingSessionComplete, LINKING_SESSION_DOC)
+    assert session == LinkingSessionComplete.model_validate(LINKING_SESSION_DOC)
+
+
+def test_construct_model_public():
+    # A public model takes only its own fields from the stored document.
+    link = construct_model(LinkRecordPublic, LINK_DOC)
+    assert isinstance(link.orcid_auth, ORCIDAuthPublic)
+    assert link.model_dump() == {
+        "username": "foo",
+        "created_at": 1,
+        "expires_at": 2,
+        "retires_at": 3,
+        "orcid_auth": {
+            "name": "Foo Bear",
+            "scope": "/read-limited",
+            "expires_in": 123,
+            "orcid": "0000-0003-4997-3076",
+        },
+    }
+
+    session = construct_model(LinkingSessionCompletePublic, LINKING_SESSION_DOC)
+    assert session == LinkingSessionCompletePublic.model_validate(LINKING_SESSION_DOC)
+
+
+def test_construct_model_optional_nested():
+    value = construct_model(OptionalNested, {"orcid_auth": LINK_DOC["orcid_auth"]})
+    assert isinstance(value.orcid_auth, ORCIDAuthPublic)
+
+    # Absent fields take their defaults.
+    assert construct_model(OptionalNested, {}).orcid_auth is None
+    assert construct_model(OptionalNested, {"orcid_auth": None}).orcid_auth is None
+
+
+def test_decode_model():
+    assert decode_model(LinkRecord, LINK_DOC, True) == decode_model(
+        LinkRecord, LINK_DOC, False
+    )
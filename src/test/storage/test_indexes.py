@@ -0,0 +1,68 @@
+from orcidlink.storage.indexes import (
+    REQUIRED_INDEXES,
+    TTL_INDEXES,
+    IndexSpec,
+    has_index,
+    missing_indexes,
+    required_indexes,
+)
+
+ID_INDEX = {"_id_": {"key": [("_id", 1)], "v": 2}}
+
+
+def test_has_index():
+    spec = IndexSpec(collection="links", field="created_at")
+    assert has_index(ID_INDEX, spec) is False
+    assert has_index({**ID_INDEX, "c": {"key": [("created_at", 1)]}}, spec) is True
+    # The direction of a single field index does not matter.
+    assert has_index({**ID_INDEX, "c": {"key": [("created_at", -1)]}}, spec) is True
+    # Nor does a compound index count.
+    compound = {"c": {"key": [("created_at", 1), ("username", 1)]}}
+    assert has_index(compound, spec) is False
+
+
+def test_has_index_unique():
+    spec = IndexSpec(collection="links", field="username", unique=True)
+    assert has_index({"u": {"key": [("username", 1)]}}, spec) is False
+    assert has_index({"u": {"key": [("username", 1)], "unique": True}}, spec) is True
+
+    # A unique index serves when a non-unique one is required.
+    spec = IndexSpec(collection="links", field="username")
+    assert has_index({"u": {"key": [("username", 1)], "unique": True}}, spec) is True
+
+
+def test_missing_indexes():
+    assert missing_indexes({}) == REQUIRED_INDEXES
+
+    index_information = {}
+    for spec in REQUIRED_INDEXES:
+        indexes = index_information.setdefault(spec.collection, dict(ID_INDEX))
+        indexes[f"{spec.field}_1"] = {
+            "key": [(spec.field, 1)],
+            "unique": spec.unique,
+        }
+    assert missing_indexes(index_information) == []
+
+    del index_information["links"]["orcid_auth.orcid_1"]
+    assert missing_indexes(index_information) == [
+        IndexSpec(collection="links", field="orcid_auth.orcid", unique=True)
+    ]
+
+
+def test_has_index_ttl():
+    spec = IndexSpec(
+        collection="linking_sessions",
+        field="expires_at_date",
+        expire_after_seconds=0,
+    )
+    assert has_index({"e": {"key": [("expires_at_date", 1)]}}, spec) is False
+    index = {"key": [("expires_at_date", 1)], "expireAfterSeconds": 60}
+    assert has_index({"e": index}, spec) is False
+    index = {"key": [("expires_at_date", 1)], "expireAfterSeconds": 0}
+    assert has_index({"e": index}, spec) is True
+
+
+def test_required_indexes():
+    assert required_indexes(False) == REQUIRED_INDEXES
+    assert required_indexes(True) == REQUIRED_INDEXES + TTL_INDEXES
+    assert missing_indexes({}, required_indexes(True)) == REQUIRED_INDEXES + TTL_INDEXES
@@ -6,7 +6,12 @@ from unittest import mock
 import pytest
 
 from orcidlink.model import LinkingSessionInitial, LinkRecord, ORCIDAuth
-from orcidlink.storage.storage_model import storage_model
+from orcidlink.storage.storage_model import (
+    close_mongo_client,
+    mongo_client,
+    mongo_pool_stats,
+    storage_model,
+)
 from orcidlink.storage.storage_model_mongo import StorageModelMongo
 
 TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
@@ -30,6 +35,32 @@ def test_constructor():
     assert isinstance(sm, StorageModelMongo)
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_shared_client():
+    sm1 = storage_model()
+    sm2 = storage_model()
+    assert sm1.client is sm2.client
+    assert sm1.client is mongo_client()
+
+    close_mongo_client()
+    sm3 = storage_model()
+    assert sm3.client is not sm1.client
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_mongo_pool_stats(fake_fs):
+    sm = storage_model()
+    await sm.reset_database()
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+    await sm.get_link_record("foo")
+
+    stats = mongo_pool_stats()
+    assert stats.checkouts > 0
+    assert stats.connections_created > 0
+    assert stats.checked_out >= 0
+    assert stats.wait_time_average >= 0
+
+
 # TODO: test constructor errors when config is bad
 #
 # def test_constructor_errors(temp_config):
@@ -1,4 +1,5 @@
 import copy
+import datetime
 import os
 from test.mocks.data import load_data_json
 from test.mocks.env import TEST_ENV
@@ -6,13 +7,24 @@ from unittest import mock
 
 import pytest
 
-from orcidlink.jsonrpc.errors import NotFoundError
+from orcidlink.jsonrpc.errors import AlreadyLinkedError, NotFoundError
 from orcidlink.lib.utils import posix_time_millis
-from orcidlink.model import LinkingSessionInitial, LinkRecord, ORCIDAuth
+from orcidlink.model import (
+    LinkingSessionInitial,
+    LinkRecord,
+    LinkRecordPublic,
+    ORCIDAuth,
+)
+from orcidlink.storage.indexes import REQUIRED_INDEXES
 
 # TODO: is it really worth it separately testing the mongo storage model? If so,
 # we should not use the generic storage_model!
 from orcidlink.storage.storage_model import storage_model
+from orcidlink.storage.storage_model_mongo import (
+    StorageModelMongo,
+    document_value,
+    keyset_filter,
+)
 
 
 @pytest.fixture
@@ -108,6 +120,73 @@ async def test_save_link_record():
     assert record.orcid_auth.access_token == "fee"
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_link_refresh_lease():
+    sm = storage_model()
+    await sm.reset_database()
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+    expires_at = posix_time_millis() + 10000
+
+    # Not acquired for a refresh token the record does not hold.
+    assert not await sm.acquire_link_refresh_lease("foo", "zab", "lease1", expires_at)
+
+    assert await sm.acquire_link_refresh_lease("foo", "baz", "lease1", expires_at)
+
+    # Only one lease may be held.
+    assert not await sm.acquire_link_refresh_lease("foo", "baz", "lease2", expires_at)
+
+    # Releasing requires the lease id.
+    await sm.release_link_refresh_lease("foo", "lease2")
+    assert not await sm.acquire_link_refresh_lease("foo", "baz", "lease2", expires_at)
+    await sm.release_link_refresh_lease("foo", "lease1")
+    assert await sm.acquire_link_refresh_lease("foo", "baz", "lease2", expires_at)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_link_refresh_lease_expired():
+    sm = storage_model()
+    await sm.reset_database()
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+
+    expired_at = posix_time_millis() - 1
+    assert await sm.acquire_link_refresh_lease("foo", "baz", "lease1", expired_at)
+
+    # An expired lease may be taken over.
+    expires_at = posix_time_millis() + 10000
+    assert await sm.acquire_link_refresh_lease("foo", "baz", "lease2", expires_at)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_save_refreshed_link_record():
+    sm = storage_model()
+    await sm.reset_database()
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+    expires_at = posix_time_millis() + 10000
+    assert await sm.acquire_link_refresh_lease("foo", "baz", "lease1", expires_at)
+
+    refreshed_record = LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1)
+    refreshed_record.orcid_auth.access_token = "fee"
+    refreshed_record.orcid_auth.refresh_token = "zab"
+    assert await sm.save_refreshed_link_record(refreshed_record, "baz")
+
+    record = await sm.get_link_record("foo")
+    assert record is not None
+    assert record.orcid_auth.access_token == "fee"
+    assert record.orcid_auth.refresh_token == "zab"
+
+    # The lease was released along with the save.
+    raw_record = await sm.db.links.find_one({"username": "foo"})
+    assert raw_record is not None
+    assert "refresh_lease" not in raw_record
+
+    # Not saved again, as the refresh token has been replaced.
+    refreshed_record.orcid_auth.access_token = "fie"
+    assert not await sm.save_refreshed_link_record(refreshed_record, "baz")
+    record = await sm.get_link_record("foo")
+    assert record is not None
+    assert record.orcid_auth.access_token == "fee"
+
+
 @mock.patch.dict(os.environ, TEST_ENV, clear=True)
 async def test_get_link_record_for_orcid_id():
     sm = storage_model()
@@ -196,6 +275,256 @@ async def test_get_link_records():
     assert len(records) == 2
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_link_record_projections():
+    sm = storage_model()
+    await sm.reset_database()
+
+    assert await sm.link_record_exists("foo") is False
+    assert await sm.get_link_record_public_non_owner("foo") is None
+
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+
+    assert await sm.link_record_exists("foo") is True
+    link = await sm.get_link_record_public_non_owner("foo")
+    assert link is not None
+    assert link.model_dump() == {
+        "username": "foo",
+        "orcid_auth": {"name": "abc", "orcid": "def"},
+    }
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_missing_indexes():
+    sm = storage_model()
+    await sm.reset_database()
+
+    assert await sm.missing_indexes() == REQUIRED_INDEXES
+
+    # A non-unique index does not satisfy a required unique index.
+    await sm.db.links.create_index("orcid_auth.orcid")
+    for spec in REQUIRED_INDEXES:
+        if spec.field != "orcid_auth.orcid":
+            await sm.db[spec.collection].create_index(spec.field, unique=spec.unique)
+    missing = await sm.missing_indexes()
+    assert [(spec.collection, spec.field) for spec in missing] == [
+        ("links", "orcid_auth.orcid")
+    ]
+
+    await sm.db.links.drop_index("orcid_auth.orcid_1")
+    await sm.db.links.create_index("orcid_auth.orcid", unique=True)
+    assert await sm.missing_indexes() == []
+
+    await sm.reset_database()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_create_link_record_orcid_already_linked():
+    sm = storage_model()
+    await sm.reset_database()
+    for spec in REQUIRED_INDEXES:
+        await sm.db[spec.collection].create_index(spec.field, unique=spec.unique)
+
+    await sm.create_link_record(LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1))
+
+    # The same ORCID account may not be linked to another user.
+    link_record = copy.deepcopy(EXAMPLE_LINK_RECORD_1)
+    link_record["username"] = "bar"
+    with pytest.raises(AlreadyLinkedError):
+        await sm.create_link_record(LinkRecord.model_validate(link_record))
+
+    assert await sm.link_record_exists("bar") is False
+
+    await sm.reset_database()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_linking_session_ttl():
+    sm = storage_model()
+    sm.session_ttl = True
+    await sm.reset_database()
+
+    expires_at = 1_700_000_000_000
+    await sm.create_linking_session(
+        LinkingSessionInitial(
+            session_id="foo-session",
+            username="foo",
+            created_at=expires_at - 600_000,
+            expires_at=expires_at,
+        )
+    )
+    doc = await sm.db.linking_sessions.find_one({"session_id": "foo-session"})
+    assert doc is not None
+    # Dates are returned by MongoDB as naive UTC.
+    expires_at_date = doc["expires_at_date"]
+    assert expires_at_date == datetime.datetime(2023, 11, 14, 22, 13, 20)
+
+    await sm.update_linking_session_to_started("foo-session", None, False, "")
+    doc = await sm.db.linking_sessions.find_one({"session_id": "foo-session"})
+    assert doc is not None
+    assert doc["state"] == "started"
+    assert doc["expires_at_date"] == expires_at_date
+
+    # Completed sessions are reaped, rather than expired by TTL.
+    await sm.update_linking_session_to_finished(
+        "foo-session", ORCIDAuth.model_validate(EXAMPLE_LINK_RECORD_1["orcid_auth"])
+    )
+    doc = await sm.db.linking_sessions.find_one({"session_id": "foo-session"})
+    assert doc is not None
+    assert doc["state"] == "completed"
+    assert "expires_at_date" not in doc
+
+    # The TTL indexes are required.
+    for spec in REQUIRED_INDEXES:
+        await sm.db[spec.collection].create_index(spec.field, unique=spec.unique)
+    missing = await sm.missing_indexes()
+    assert [(spec.collection, spec.field) for spec in missing] == [
+        ("linking_sessions", "expires_at_date"),
+    ]
+
+    await sm.reset_database()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_linking_session_transitions():
+    sm = storage_model()
+    await sm.reset_database()
+
+    await sm.create_linking_session(
+        LinkingSessionInitial(
+            session_id="foo-session", username="foo", created_at=1, expires_at=2
+        )
+    )
+
+    # Only the owner's session is started, if an owner is given.
+    with pytest.raises(NotFoundError):
+        await sm.update_linking_session_to_started(
+            "foo-session", None, False, "", username="bar"
+        )
+
+    started = await sm.update_linking_session_to_started(
+        "foo-session", "link", True, "ui", username="foo"
+    )
+    assert started.return_link == "link"
+    assert await sm.get_linking_session_initial("foo-session") is None
+
+    # A session may be started, or completed, only once.
+    with pytest.raises(NotFoundError):
+        await sm.update_linking_session_to_started("foo-session", None, False, "")
+
+    orcid_auth = ORCIDAuth.model_validate(EXAMPLE_LINK_RECORD_1["orcid_auth"])
+    completed = await sm.update_linking_session_to_finished("foo-session", orcid_auth)
+    assert completed.orcid_auth == orcid_auth
+    assert await sm.get_linking_session_started("foo-session") is None
+
+    with pytest.raises(NotFoundError):
+        await sm.update_linking_session_to_finished("foo-session", orcid_auth)
+
+    await sm.reset_database()
+
+
+def make_link_record(index: int) -> LinkRecord:
+    link_record = copy.deepcopy(EXAMPLE_LINK_RECORD_1)
+    link_record["username"] = f"user{index}"
+    link_record["retires_at"] = index
+    return LinkRecord.model_validate(link_record)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_iter_link_records_batches():
+    sm = storage_model()
+    sm.batch_size = 7
+    await sm.reset_database()
+
+    # More records than fit into a single batch, or than were once returned at all.
+    for index in range(150):
+        await sm.create_link_record(make_link_record(index))
+
+    usernames = [
+        link.username async for link in sm.iter_link_records(sort=[("retires_at", 1)])
+    ]
+    assert usernames == [f"user{index}" for index in range(150)]
+
+    records = await sm.get_link_records(sort=[("retires_at", 1)], offset=10, limit=5)
+    assert [record.username for record in records] == [
+        f"user{index}" for index in range(10, 15)
+    ]
+
+
+def test_keyset_filter():
+    sort = [("created_at", -1), ("username", 1), ("_id", 1)]
+    assert keyset_filter(sort, [10, "foo", "id"]) == {
+        "$or": [
+            {"created_at": {"$lt": 10}},
+            {"created_at": 10, "username": {"$gt": "foo"}},
+            {"created_at": 10, "username": "foo", "_id": {"$gt": "id"}},
+        ]
+    }
+
+
+def test_document_value():
+    doc = {"username": "foo", "orcid_auth": {"orcid": "bar"}}
+    assert document_value(doc, "username") == "foo"
+    assert document_value(doc, "orcid_auth.orcid") == "bar"
+    assert document_value(doc, "orcid_auth.name") is None
+    assert document_value(doc, "username.first") is None
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_link_records_page():
+    sm = storage_model()
+    await sm.reset_database()
+
+    # Pairs of links share a sort value, so _id decides their order.
+    for index in range(7):
+        link_record = make_link_record(index)
+        link_record.retires_at = index // 2
+        await sm.create_link_record(link_record)
+
+    sort = [("retires_at", -1)]
+    usernames: list[str] = []
+    after = None
+    while True:
+        page = await sm.get_link_records_page(None, sort, limit=3, after=after)
+        usernames.extend(link.username for link in page.links)
+        if page.next is None:
+            break
+        after = page.next
+
+    assert usernames == ["user6", "user4", "user5", "user2", "user3", "user0", "user1"]
+
+    # Filtered
+    page = await sm.get_link_records_page(
+        {"retires_at": {"$lte": 1}}, sort, limit=3, after=None
+    )
+    assert [link.username for link in page.links] == ["user2", "user3", "user0"]
+    assert page.next is not None
+    page = await sm.get_link_records_page(
+        {"retires_at": {"$lte": 1}}, sort, limit=3, after=page.next
+    )
+    assert [link.username for link in page.links] == ["user1"]
+    assert page.next is None
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_iter_link_records_abandoned():
+    sm = storage_model()
+    sm.batch_size = 2
+    await sm.reset_database()
+
+    for index in range(5):
+        await sm.create_link_record(make_link_record(index))
+
+    link_records = sm.iter_link_records()
+    async for link in link_records:
+        assert link.username == "user0"
+        break
+    # Closing the iteration early closes the cursor.
+    await link_records.aclose()  # type: ignore
+
+    assert len(await sm.get_link_records()) == 5
+
+
 #
 # Linking session records
 #
@@ -600,6 +929,11 @@ async def test_delete_expired_sessions():
     assert stats.links.last_7_days == 0
     assert stats.links.last_30_days == 0
 
+    # Nothing had expired as of a time before the sessions expired.
+    await sm.delete_expired_sessions(100)
+    stats = await sm.get_stats()
+    assert stats.linking_sessions_initial.expired == 1
+
     await sm.delete_expired_sessions()
     stats = await sm.get_stats()
     assert stats.linking_sessions_initial.expired == 0
@@ -665,3 +999,28 @@ async def test_get_expired_sessions():
     assert len(expired_sessions.initial_sessions) == 1
     assert len(expired_sessions.started_sessions) == 1
     assert len(expired_sessions.completed_sessions) == 1
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_trusted_reads():
+    sm = StorageModelMongo(
+        storage_model().client, TEST_ENV["MONGO_DATABASE"], validate_reads=False
+    )
+    await sm.reset_database()
+
+    link = LinkRecord.model_validate(EXAMPLE_LINK_RECORD_1)
+    await sm.create_link_record(link)
+
+    assert await sm.get_link_record("foo") == link
+    assert await sm.get_link_records() == [link]
+
+    public_links = [
+        public_link async for public_link in sm.iter_link_records_as(LinkRecordPublic)
+    ]
+    assert public_links == [LinkRecordPublic.model_validate(link.model_dump())]
+
+    page = await sm.get_link_records_page_as(
+        LinkRecordPublic, None, [("username", 1)], limit=10
+    )
+    assert page.links == public_links
+    assert page.next is None
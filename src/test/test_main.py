@@ -43,6 +43,8 @@ from orcidlink.jsonrpc.errors import (
     UpstreamError,
 )
 from orcidlink.lib.logger import log_event
+from orcidlink.lib.responses import NEW_WORKS_LIMIT, PUT_CODES_LIMIT
+from orcidlink.lib.service_clients import orcid_api
 from orcidlink.lib.utils import posix_time_millis
 from orcidlink.main import app, config_to_log_level
 from orcidlink.model import (
@@ -1080,6 +1082,14 @@ async def test_getorcid_works():
         response = rpc_call("get-orcid-works", params, generate_kbase_token("foo"))
         result = assert_json_rpc_result_ignore_result(response)
         assert isinstance(result, list)
+        # Only works added by KBase are returned, and groups without any are dropped.
+        assert [[work["putCode"] for work in group["works"]] for group in result] == [
+            [1537385],
+            [1547701],
+            [1526002],
+            [1526014],
+            [1591568],
+        ]
 
 
 @mock.patch.dict(os.environ, TEST_ENV, clear=True)
@@ -1198,6 +1208,64 @@ async def test_get_work_errors():
         assert_json_rpc_error(response, 1050, "Upstream Error")
 
 
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_works_detail():
+    with mock_services():
+        orcid_id = "0000-0003-4997-3076"
+        test_link = LinkRecord.model_validate(TEST_LINK)
+        test_link.orcid_auth.orcid = orcid_id
+        await create_link(test_link.model_dump())
+
+        # The works are returned in the order of the put codes; an unknown put code
+        # is returned with its error, without failing the others.
+        params = {"username": "foo", "put_codes": [1487805, 1234, 1526002]}
+        response = rpc_call(
+            "get-orcid-works-detail", params, generate_kbase_token("foo")
+        )
+        result = assert_json_rpc_result_ignore_result(response)
+        works = result["works"]
+        assert [work["putCode"] for work in works] == [1487805, 1234, 1526002]
+        assert works[0]["work"]["putCode"] == 1487805
+        assert works[0]["error"] is None
+        assert works[1]["work"] is None
+        assert works[1]["error"]["code"] == ORCIDNotFoundError.CODE
+        assert works[1]["error"]["orcidErrorCode"] == 9034
+        assert works[2]["work"]["putCode"] == 1526002
+
+        params = {"username": "foo", "put_codes": []}
+        response = rpc_call(
+            "get-orcid-works-detail", params, generate_kbase_token("foo")
+        )
+        result = assert_json_rpc_result_ignore_result(response)
+        assert result["works"] == []
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_get_works_detail_errors():
+    with mock_services():
+        await clear_database()
+
+        params = {"username": "foo", "put_codes": [1526002, 1487805]}
+        response = rpc_call(
+            "get-orcid-works-detail", params, generate_kbase_token("foo")
+        )
+        assert_json_rpc_error(response, NotFoundError.CODE, NotFoundError.MESSAGE)
+
+        response = rpc_call(
+            "get-orcid-works-detail", params, generate_kbase_token("bar")
+        )
+        assert_json_rpc_error(
+            response, NotAuthorizedError.CODE, NotAuthorizedError.MESSAGE
+        )
+
+        # There is a limit to the works which may be read at once.
+        params = {"username": "foo", "put_codes": [1526002] * (PUT_CODES_LIMIT + 1)}
+        response = rpc_call(
+            "get-orcid-works-detail", params, generate_kbase_token("foo")
+        )
+        assert_json_rpc_error(response, -32602, "Invalid params")
+
+
 @mock.patch.dict(os.environ, TEST_ENV, clear=True)
 async def test_update_orcid_work(fake_fs):
     with mock_services():
@@ -1506,3 +1574,147 @@ async def test_create_work_errors(fake_fs):
         params = {"username": "foo", "new_work": new_work_data}
         response = rpc_call("create-orcid-work", params, generate_kbase_token("foo"))
         assert_json_rpc_error(response, 1050, "Upstream Error")
+
+
+def new_work_data(title: str):
+    return {
+        "title": title,
+        "journal": "Me myself and I and me",
+        "date": "2021",
+        "workType": "online-resource",
+        "url": "https://kbase.us",
+        "doi": "123",
+        "externalIds": [],
+        "citation": {
+            "type": "formatted-vancouver",
+            "value": "my reference here",
+        },
+        "shortDescription": "my short description",
+        "selfContributor": {
+            "orcidId": "1111-2222-3333-4444",
+            "name": "Bar Baz",
+            "roles": [],
+        },
+        "otherContributors": [],
+    }
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_create_works(fake_fs):
+    with mock_services():
+        orcid_id = "0000-0003-4997-3076"
+        test_link = LinkRecord.model_validate(TEST_LINK)
+        test_link.orcid_auth.orcid = orcid_id
+        await create_link(test_link.model_dump())
+
+        # A work which ORCID cannot create is returned with its error, without
+        # failing the others.
+        new_works = [
+            new_work_data("Some Data Set"),
+            new_work_data("trigger-item-error"),
+            new_work_data("Another Data Set"),
+        ]
+        params = {"username": "foo", "new_works": new_works}
+        response = rpc_call("create-orcid-works", params, generate_kbase_token("foo"))
+        result = assert_json_rpc_result_ignore_result(response)
+        works = result["works"]
+        assert len(works) == 3
+        assert works[0]["work"]["putCode"] == 1526002
+        assert works[0]["error"] is None
+        assert works[1]["work"] is None
+        assert works[1]["error"]["code"] == UpstreamError.CODE
+        assert works[1]["error"]["orcidErrorCode"] == 9021
+        assert works[2]["work"]["putCode"] == 1526002
+
+        params = {"username": "foo", "new_works": []}
+        response = rpc_call("create-orcid-works", params, generate_kbase_token("foo"))
+        result = assert_json_rpc_result_ignore_result(response)
+        assert result["works"] == []
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_create_works_chunked(fake_fs):
+    with mock_services():
+        orcid_id = "0000-0003-4997-3076"
+        test_link = LinkRecord.model_validate(TEST_LINK)
+        test_link.orcid_auth.orcid = orcid_id
+        await create_link(test_link.model_dump())
+
+        # The works are created in chunks; a chunk whose request fails is returned
+        # as an error for each of its works, without failing the other chunks.
+        new_works = [
+            new_work_data("Some Data Set"),
+            new_work_data("Another Data Set"),
+            new_work_data("trigger-500"),
+            new_work_data("Yet Another Data Set"),
+            new_work_data("And Another Data Set"),
+        ]
+        params = {"username": "foo", "new_works": new_works}
+        with mock.patch.object(orcid_api, "ORCID_BULK_WORKS_LIMIT", 2):
+            response = rpc_call(
+                "create-orcid-works", params, generate_kbase_token("foo")
+            )
+        result = assert_json_rpc_result_ignore_result(response)
+        works = result["works"]
+        assert [work["work"] is not None for work in works] == [
+            True,
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert works[2]["error"]["code"] == UpstreamError.CODE
+        assert works[3]["error"]["code"] == UpstreamError.CODE
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_create_works_profile_error(fake_fs):
+    with mock_services():
+        orcid_id = "0000-0003-4997-3076"
+        test_link = LinkRecord.model_validate(TEST_LINK)
+        test_link.orcid_auth.orcid = orcid_id
+        await create_link(test_link.model_dump())
+
+        # The works are created even though the profile cannot be fetched; each
+        # created work is reported with the profile error.
+        async def get_profile(self, orcid_id):
+            raise UpstreamError("Profile unavailable")
+
+        new_works = [
+            new_work_data("Some Data Set"),
+            new_work_data("trigger-item-error"),
+        ]
+        params = {"username": "foo", "new_works": new_works}
+        with mock.patch.object(orcid_api.ORCIDAPIClient, "get_profile", get_profile):
+            response = rpc_call(
+                "create-orcid-works", params, generate_kbase_token("foo")
+            )
+        result = assert_json_rpc_result_ignore_result(response)
+        works = result["works"]
+        assert works[0]["work"] is None
+        assert works[0]["error"]["code"] == UpstreamError.CODE
+        assert works[0]["error"]["orcidErrorCode"] is None
+        assert works[1]["error"]["orcidErrorCode"] == 9021
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_create_works_errors(fake_fs):
+    with mock_services():
+        await clear_database()
+
+        params = {"username": "foo", "new_works": [new_work_data("Some Data Set")]}
+        response = rpc_call("create-orcid-works", params, generate_kbase_token("foo"))
+        assert_json_rpc_error(response, NotFoundError.CODE, NotFoundError.MESSAGE)
+
+        response = rpc_call("create-orcid-works", params, generate_kbase_token("bar"))
+        assert_json_rpc_error(
+            response, NotAuthorizedError.CODE, NotAuthorizedError.MESSAGE
+        )
+
+        # There is a limit to the works which may be created at once.
+        params = {
+            "username": "foo",
+            "new_works": [new_work_data("Some Data Set")] * (NEW_WORKS_LIMIT + 1),
+        }
+        response = rpc_call("create-orcid-works", params, generate_kbase_token("foo"))
+        assert_json_rpc_error(response, -32602, "Invalid params")
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import os
 from test.mocks.data import load_data_file, load_data_json
@@ -17,14 +18,18 @@ from unittest import mock
 
 import pytest
 
-from orcidlink.jsonrpc.errors import NotFoundError
+from orcidlink.jsonrpc.errors import NotAuthorizedError, NotFoundError, UpstreamError
+from orcidlink.lib.service_clients.orcid_oauth_api import ORCIDOAuthAPIClient
 from orcidlink.lib.utils import posix_time_millis
-from orcidlink.model import LinkRecord
+from orcidlink.model import LinkingSessionInitial, LinkRecord
 from orcidlink.process import (
     delete_link,
     link_record_for_orcid_id,
     link_record_for_user,
+    refresh_token_for_link,
+    start_linking_session,
 )
+from orcidlink.storage.storage_model import storage_model
 
 TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
 TEST_LINK = load_data_json(TEST_DATA_DIR, "link1.json")
@@ -182,3 +187,202 @@ async def test_link_record_for_orcid_id_with_refresh():
             new_access_token = new_link_record.orcid_auth.access_token
 
             assert old_access_token != new_access_token
+
+
+@contextlib.contextmanager
+def count_refreshes():
+    """
+    Counts calls to the ORCID OAuth API to refresh tokens, which are otherwise
+    handled as usual.
+    """
+    calls = []
+    original_refresh_token = ORCIDOAuthAPIClient.refresh_token
+
+    async def refresh_token(self, refresh_token):
+        calls.append(refresh_token)
+        return await original_refresh_token(self, refresh_token)
+
+    with mock.patch.object(ORCIDOAuthAPIClient, "refresh_token", refresh_token):
+        yield calls
+
+
+async def retire_link(username: str) -> LinkRecord:
+    link_record = await get_link(username)
+    assert link_record is not None
+    link_record.retires_at = posix_time_millis()
+    await update_link(link_record)
+    return link_record
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_link_record_for_user_with_concurrent_refresh():
+    with mock_services():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            await create_link(TEST_LINK)
+            await retire_link("foo")
+
+            with count_refreshes() as calls:
+                link_records = await asyncio.gather(
+                    *[link_record_for_user("foo") for _ in range(5)]
+                )
+
+            assert calls == ["refresh-token-foo"]
+            for link_record in link_records:
+                assert link_record is not None
+                assert (
+                    link_record.orcid_auth.access_token == "access-token-foo-refreshed"
+                )
+
+            stored_link_record = await get_link("foo")
+            assert stored_link_record is not None
+            assert (
+                stored_link_record.orcid_auth.refresh_token
+                == "refresh-token-foo-refreshed"
+            )
+            assert stored_link_record.retires_at > posix_time_millis()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_token_for_link_refreshed_by_other_instance():
+    """
+    Another instance holds the refresh lease, and saves the refreshed link while we
+    wait; we should use its refreshed link rather than refresh again.
+    """
+    with mock_services():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            await create_link(TEST_LINK)
+            link_record = await retire_link("foo")
+
+            storage = storage_model()
+            assert await storage.acquire_link_refresh_lease(
+                "foo", "refresh-token-foo", "other-lease", posix_time_millis() + 10000
+            )
+
+            async def other_instance_refresh():
+                await asyncio.sleep(0.5)
+                refreshed_link_record = LinkRecord.model_validate(TEST_LINK)
+                refreshed_link_record.orcid_auth.access_token = "access-token-other"
+                refreshed_link_record.orcid_auth.refresh_token = "refresh-token-other"
+                await storage.save_refreshed_link_record(
+                    refreshed_link_record, "refresh-token-foo"
+                )
+
+            with count_refreshes() as calls:
+                refreshed_link_record, _ = await asyncio.gather(
+                    refresh_token_for_link(link_record), other_instance_refresh()
+                )
+
+            assert calls == []
+            assert refreshed_link_record.orcid_auth.access_token == "access-token-other"
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_token_for_link_expired_lease():
+    """
+    Another instance acquired the refresh lease but never completed the refresh; once
+    the lease expires we should refresh.
+    """
+    with mock_services():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            await create_link(TEST_LINK)
+            link_record = await retire_link("foo")
+
+            storage = storage_model()
+            assert await storage.acquire_link_refresh_lease(
+                "foo", "refresh-token-foo", "other-lease", posix_time_millis() + 500
+            )
+
+            with count_refreshes() as calls:
+                refreshed_link_record = await refresh_token_for_link(link_record)
+
+            assert calls == ["refresh-token-foo"]
+            assert (
+                refreshed_link_record.orcid_auth.access_token
+                == "access-token-foo-refreshed"
+            )
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_token_for_link_replaced_during_refresh():
+    """
+    The link is replaced while we refresh it (e.g. by another instance, after our
+    lease expired); our refreshed tokens are not saved, and the stored link is used.
+    """
+    with mock_services():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            await create_link(TEST_LINK)
+            link_record = await retire_link("foo")
+
+            storage = storage_model()
+            original_refresh_token = ORCIDOAuthAPIClient.refresh_token
+
+            async def refresh_token(self, refresh_token):
+                orcid_auth = await original_refresh_token(self, refresh_token)
+                replaced_link_record = LinkRecord.model_validate(TEST_LINK)
+                replaced_link_record.orcid_auth.access_token = "access-token-other"
+                replaced_link_record.orcid_auth.refresh_token = "refresh-token-other"
+                await storage.save_refreshed_link_record(
+                    replaced_link_record, "refresh-token-foo"
+                )
+                return orcid_auth
+
+            with mock.patch.object(ORCIDOAuthAPIClient, "refresh_token", refresh_token):
+                refreshed_link_record = await refresh_token_for_link(link_record)
+
+            assert refreshed_link_record.orcid_auth.access_token == "access-token-other"
+            stored_link_record = await get_link("foo")
+            assert stored_link_record is not None
+            assert stored_link_record.orcid_auth.access_token == "access-token-other"
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_token_for_link_error_releases_lease():
+    with mock_services():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            link = LinkRecord.model_validate(TEST_LINK)
+            link.orcid_auth.refresh_token = "refresh-token-other-error"
+            await create_link(link.model_dump())
+            link_record = await retire_link("foo")
+
+            with pytest.raises(UpstreamError):
+                await refresh_token_for_link(link_record)
+
+            # The lease has been released, so another refresh may be attempted.
+            storage = storage_model()
+            assert await storage.acquire_link_refresh_lease(
+                "foo",
+                "refresh-token-other-error",
+                "another-lease",
+                posix_time_millis() + 10000,
+            )
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_start_linking_session():
+    storage = storage_model()
+    await storage.reset_database()
+    now = posix_time_millis()
+    await storage.create_linking_session(
+        LinkingSessionInitial(
+            session_id="foo-session",
+            username="foo",
+            created_at=now,
+            expires_at=now + 60_000,
+        )
+    )
+
+    with pytest.raises(NotFoundError):
+        await start_linking_session("bar-session", "foo", None, False, "")
+
+    with pytest.raises(NotAuthorizedError):
+        await start_linking_session("foo-session", "bar", None, False, "")
+
+    session = await start_linking_session("foo-session", "foo", "link", True, "ui")
+    assert session.session_id == "foo-session"
+    assert session.return_link == "link"
+    assert session.skip_prompt is True
+    assert session.ui_options == "ui"
+
+    # It may not be started again.
+    with pytest.raises(NotFoundError):
+        await start_linking_session("foo-session", "foo", None, False, "")
@@ -0,0 +1,196 @@
+import asyncio
+import contextlib
+import os
+from test.mocks.env import MOCK_ORCID_OAUTH_PORT, TEST_ENV
+from test.mocks.mock_contexts import mock_orcid_oauth_service, no_stderr
+from test.mocks.testing_utils import clear_storage_model
+from unittest import mock
+
+import pytest
+
+from orcidlink.lib.utils import posix_time_millis
+from orcidlink.model import LinkingSessionInitial, ORCIDAuth
+from orcidlink.session_reaper import (
+    LinkingSessionReaper,
+    LinkingSessionReaperStats,
+    linking_session_reaper,
+    revoke_access_token,
+)
+from orcidlink.storage.storage_model import storage_model
+
+
+@contextlib.contextmanager
+def mock_services():
+    with no_stderr():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            yield
+
+
+def make_reaper(interval: int = 60) -> LinkingSessionReaper:
+    return LinkingSessionReaper(
+        interval=interval, batch_size=10, concurrency=2, retries=0
+    )
+
+
+async def add_completed_session(session_id: str, expires_at: int, access_token: str):
+    storage = storage_model()
+    await storage.create_linking_session(
+        LinkingSessionInitial(
+            session_id=session_id,
+            username="foo",
+            created_at=posix_time_millis(),
+            expires_at=expires_at,
+        )
+    )
+    await storage.update_linking_session_to_started(session_id, None, False, "")
+    await storage.update_linking_session_to_finished(
+        session_id,
+        ORCIDAuth(
+            access_token=access_token,
+            token_type="bearer",
+            refresh_token="refresh-token",
+            expires_in=1000,
+            scope="/read-limited",
+            name="Foo Bear",
+            orcid="0000-0003-4997-3076",
+        ),
+    )
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_reap_expired_sessions():
+    with mock_services():
+        await clear_storage_model()
+        now = posix_time_millis()
+        await add_completed_session("expired", now - 60_000, "access_token")
+        await add_completed_session("active", now + 60_000, "access_token")
+
+        reaper = make_reaper()
+        assert await reaper.reap_expired_sessions() == 1
+
+        storage = storage_model()
+        assert await storage.get_linking_session_completed("expired") is None
+        assert await storage.get_linking_session_completed("active") is not None
+
+        stats = reaper.stats()
+        assert isinstance(stats, LinkingSessionReaperStats)
+        assert stats.scans == 1
+        assert stats.reaped == 1
+        assert stats.failed == 0
+        assert stats.backlog == 0
+        assert stats.last_scan_at is not None
+
+        # Nothing left to reap.
+        assert await reaper.reap_expired_sessions() == 0
+        assert reaper.stats().scans == 2
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_reap_expired_sessions_failure():
+    with mock_services():
+        await clear_storage_model()
+        now = posix_time_millis()
+        await add_completed_session("revoked", now - 60_000, "access_token")
+        await add_completed_session(
+            "not-revoked", now - 60_000, "error-unauthorized-client"
+        )
+
+        reaper = make_reaper()
+        assert await reaper.reap_expired_sessions() == 1
+
+        stats = reaper.stats()
+        assert stats.reaped == 1
+        assert stats.failed == 1
+        # The session whose tokens could not be revoked remains to be reaped.
+        assert stats.backlog == 1
+        storage = storage_model()
+        assert await storage.get_linking_session_completed("not-revoked") is not None
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_reap_expired_sessions_batch():
+    with mock_services():
+        await clear_storage_model()
+        now = posix_time_millis()
+        for index in range(3):
+            await add_completed_session(
+                f"session{index}", now - (index + 1) * 60_000, "access_token"
+            )
+
+        reaper = LinkingSessionReaper(
+            interval=60, batch_size=2, concurrency=1, retries=0
+        )
+        assert await reaper.reap_expired_sessions() == 2
+        assert reaper.stats().backlog == 1
+
+        # The longest expired are reaped first.
+        storage = storage_model()
+        assert await storage.get_linking_session_completed("session0") is not None
+        assert await storage.get_linking_session_completed("session2") is None
+
+        assert await reaper.reap_expired_sessions() == 1
+        assert reaper.stats().backlog == 0
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_revoke_access_token_retries():
+    attempts = 0
+
+    async def revoke(access_token: str) -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise Exception("Unavailable")
+
+    oauth_api = mock.Mock()
+    oauth_api.revoke_access_token = revoke
+    with mock.patch(
+        "orcidlink.session_reaper.orcid_oauth_api", return_value=oauth_api
+    ), mock.patch("orcidlink.session_reaper.RETRY_DELAY", 0):
+        await revoke_access_token("access_token", retries=2)
+        assert attempts == 3
+
+        # Once the retries are exhausted, the last error is raised.
+        attempts = 0
+        with pytest.raises(Exception, match="Unavailable"):
+            await revoke_access_token("access_token", retries=1)
+        assert attempts == 2
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_reaper_start_stop():
+    with mock_services():
+        await clear_storage_model()
+        await add_completed_session(
+            "expired", posix_time_millis() - 60_000, "access_token"
+        )
+
+        reaper = make_reaper(interval=1)
+        reaper.start()
+        assert reaper.running()
+        await asyncio.sleep(1.5)
+        await reaper.stop()
+        assert not reaper.running()
+
+        stats = reaper.stats()
+        assert stats.scans == 1
+        assert stats.reaped == 1
+
+        # Stopping again is harmless.
+        await reaper.stop()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_reaper_disabled():
+    reaper = make_reaper(interval=0)
+    reaper.start()
+    assert not reaper.running()
+    await reaper.stop()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+def test_linking_session_reaper():
+    reaper = linking_session_reaper()
+    assert isinstance(reaper, LinkingSessionReaper)
+    assert reaper is linking_session_reaper()
+    assert reaper.interval == 0
@@ -0,0 +1,137 @@
+import asyncio
+import contextlib
+import os
+from test.mocks.data import load_data_json
+from test.mocks.env import MOCK_ORCID_OAUTH_PORT, TEST_ENV
+from test.mocks.mock_contexts import mock_orcid_oauth_service, no_stderr
+from test.mocks.testing_utils import clear_database, create_link, get_link
+from unittest import mock
+
+from orcidlink import token_refresh
+from orcidlink.lib.utils import posix_time_millis
+from orcidlink.model import LinkRecord
+from orcidlink.storage.storage_model import storage_model
+from orcidlink.token_refresh import (
+    TokenRefreshScheduler,
+    TokenRefreshStats,
+    token_refresh_scheduler,
+)
+
+TEST_DATA_DIR = os.environ["TEST_DATA_DIR"]
+TEST_LINK = load_data_json(TEST_DATA_DIR, "link1.json")
+TEST_LINK_BAR = load_data_json(TEST_DATA_DIR, "link-bar.json")
+
+
+@contextlib.contextmanager
+def mock_services():
+    with no_stderr():
+        with mock_orcid_oauth_service(MOCK_ORCID_OAUTH_PORT):
+            with mock.patch.object(token_refresh, "REFRESH_JITTER", 0):
+                yield
+
+
+def make_scheduler(interval: int = 60) -> TokenRefreshScheduler:
+    return TokenRefreshScheduler(
+        interval=interval, lookahead=3600, concurrency=2, batch_size=10
+    )
+
+
+async def add_link(link: dict, retires_at: int, refresh_token: str | None = None):
+    link_record = LinkRecord.model_validate(link)
+    link_record.retires_at = retires_at
+    if refresh_token is not None:
+        link_record.orcid_auth.refresh_token = refresh_token
+    await storage_model().create_link_record(link_record)
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_retiring_links():
+    with mock_services():
+        await clear_database()
+        now = posix_time_millis()
+        # Retiring within the lookahead window.
+        await add_link(TEST_LINK, now + 60 * 1000)
+        # Not retiring for a long while.
+        await add_link(TEST_LINK_BAR, now + 7 * 86400 * 1000)
+
+        scheduler = make_scheduler()
+        assert await scheduler.refresh_retiring_links() == 1
+
+        link_foo = await get_link("foo")
+        assert link_foo is not None
+        assert link_foo.orcid_auth.access_token == "access-token-foo-refreshed"
+        assert link_foo.retires_at > now + 3600 * 1000
+
+        link_bar = await get_link("bar")
+        assert link_bar is not None
+        assert (
+            link_bar.orcid_auth.access_token
+            == TEST_LINK_BAR["orcid_auth"]["access_token"]
+        )
+
+        stats = scheduler.stats()
+        assert isinstance(stats, TokenRefreshStats)
+        assert stats.scans == 1
+        assert stats.refreshed == 1
+        assert stats.failed == 0
+        assert stats.backlog == 0
+        assert stats.last_scan_at is not None
+
+        # Nothing left to refresh.
+        assert await scheduler.refresh_retiring_links() == 0
+        assert scheduler.stats().scans == 2
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_refresh_retiring_links_failure():
+    with mock_services():
+        await clear_database()
+        now = posix_time_millis()
+        await add_link(TEST_LINK, now + 60 * 1000, "refresh-token-other-error")
+        await add_link(TEST_LINK_BAR, now + 60 * 1000)
+
+        scheduler = make_scheduler()
+        assert await scheduler.refresh_retiring_links() == 1
+
+        stats = scheduler.stats()
+        assert stats.refreshed == 1
+        assert stats.failed == 1
+        # The failed link remains to be refreshed.
+        assert stats.backlog == 1
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_scheduler_start_stop():
+    with mock_services():
+        await clear_database()
+        await add_link(TEST_LINK, posix_time_millis() + 60 * 1000)
+
+        scheduler = make_scheduler(interval=1)
+        scheduler.start()
+        assert scheduler.running()
+        await asyncio.sleep(1.5)
+        await scheduler.stop()
+        assert not scheduler.running()
+
+        stats = scheduler.stats()
+        assert stats.scans == 1
+        assert stats.refreshed == 1
+
+        # Stopping again is harmless.
+        await scheduler.stop()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+async def test_scheduler_disabled():
+    scheduler = make_scheduler(interval=0)
+    scheduler.start()
+    assert not scheduler.running()
+    await scheduler.stop()
+
+
+@mock.patch.dict(os.environ, TEST_ENV, clear=True)
+def test_token_refresh_scheduler():
+    scheduler = token_refresh_scheduler()
+    assert isinstance(scheduler, TokenRefreshScheduler)
+    assert scheduler is token_refresh_scheduler()
+    assert scheduler.interval == 900
@@ -117,3 +117,43 @@ def test_transform_contributors():
 
     orcid_contributors = to_orcid.transform_contributors(model_contributors)
     assert len(orcid_contributors) == 4
+
+
+def test_translate_new_work():
+    new_work = model.NewWork.model_validate(
+        {
+            "title": "Some Data Set",
+            "journal": "Me myself and I and me",
+            "date": "2021/02",
+            "workType": "online-resource",
+            "url": "https://kbase.us",
+            "doi": "123",
+            "externalIds": [
+                {
+                    "type": "doi",
+                    "value": "456",
+                    "url": "https://example.com",
+                    "relationship": "self",
+                }
+            ],
+            "citation": {"type": "formatted-vancouver", "value": "my reference"},
+            "shortDescription": "my short description",
+            "selfContributor": {
+                "orcidId": "1111-2222-3333-4444",
+                "name": "Bar Baz",
+                "roles": [],
+            },
+            "otherContributors": [],
+        }
+    )
+
+    work = to_orcid.translate_new_work(new_work)
+    assert isinstance(work, orcid_api.NewWork)
+    assert work.title.title.value == "Some Data Set"
+    # The DOI is the first external id, followed by any others.
+    assert [
+        external_id.external_id_value for external_id in work.external_ids.external_id
+    ] == ["123", "456"]
+    assert work.publication_date.year.value == "2021"
+    assert work.publication_date.month is not None
+    assert work.publication_date.month.value == "02"